@@ -0,0 +1,214 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Rigging.Controls
+
+Description: Captures NURBS curves from the scene as control shapes.
+    Degree, form, knots and CVs are read in object space through OpenMaya, one function set per curve.
+    Shapes are turned so their forward axis points down -z, scaled so their largest coordinate is 1,
+    and their CVs simplified with Ramer-Douglas-Peucker within a tolerance before new knots are made for them.
+    The pivot of the captured transform stays the origin of the shape.
+    Captured shapes are written to a shape library file, see Rigging.Controls.libraryFile.
+
+"""
+
+import os
+
+import maya.cmds as mc
+import maya.api.OpenMaya as om
+
+from Rigging.Controls.library import transformShapePoints
+from Rigging.Controls.libraryFile import readLibrary,writeLibrary
+import Utility.vectorMath as vec
+
+#rotation taking each axis to -z
+FORWARD_ROTATIONS = {
+    '-z':(0,0,0),
+    'z':(0,180,0),
+    'x':(0,90,0),
+    '-x':(0,-90,0),
+    'y':(-90,0,0),
+    '-y':(90,0,0)}
+
+
+def readCurves(nodes=None):
+    """Reads the curve data of the NURBS curve shapes under nodes
+
+    Args:
+        nodes (str | list, optional): curve transforms or shapes. Defaults to the selection.
+
+    Returns:
+        list: (transform, degree, periodic, knots, points) for every curve shape, points as (x,y,z) tuples
+    """
+    if nodes is None:
+        shapes = mc.ls(sl=1,dag=1,type='nurbsCurve',ni=1,l=1)
+    else:
+        shapes = mc.ls(nodes,dag=1,type='nurbsCurve',ni=1,l=1)
+    if not shapes:
+        return []
+
+    selection = om.MSelectionList()
+    for shape in shapes:
+        selection.add(shape)
+    curves = []
+    for count, shape in enumerate(shapes):
+        fn = om.MFnNurbsCurve(selection.getDagPath(count))
+        points = [(point.x, point.y, point.z) for point in fn.cvPositions(om.MSpace.kObject)]
+        curves.append((shape.rpartition('|')[0].rpartition('|')[2],
+                       fn.degree,
+                       fn.form == om.MFnNurbsCurve.kPeriodic,
+                       list(fn.knots()),
+                       points))
+    return curves
+
+
+def captureShapes(nodes=None, path='', tolerance=0.01, forward='-z', normalize=True):
+    """Captures curves as control shapes, optionally adding them to a shape library file.
+        Transforms with more than one curve shape give one shape per curve, numbered after the first.
+
+    Args:
+        nodes (str | list, optional): curve transforms or shapes. Defaults to the selection.
+        path (str, optional): library file to add the shapes to, replacing shapes of the same name. Defaults to ''.
+        tolerance (float, optional): furthest a removed CV may be from the simplified CVs, after normalizing. 0 keeps every CV. Defaults to 0.01.
+        forward (str, optional): axis of the captured shapes to point down -z. Defaults to '-z'.
+        normalize (bool, optional): scale shapes so their largest coordinate is 1. Defaults to True.
+
+    Returns:
+        dict: shape definitions by name
+    """
+    shapes = {}
+    counts = {}
+    for transform, degree, periodic, knots, points in readCurves(nodes):
+        counts[transform] = counts.get(transform, 0) + 1
+        name = transform if counts[transform] == 1 else '{}{}'.format(transform, counts[transform])
+
+        points = transformShapePoints(points, rotation=FORWARD_ROTATIONS[forward])
+        if normalize:
+            extent = max(abs(value) for point in points for value in point)
+            if extent:
+                points = transformShapePoints(points, size=1.0/extent)
+        if tolerance > 0:
+            simplified = simplifyCurve(points, degree, periodic, tolerance)
+            if len(simplified) < len(points):
+                points = simplified
+                knots = makeKnots(len(points), degree, periodic)
+
+        shapes[name] = {
+            'ID':name,
+            'type':'curve',
+            'd':degree,
+            'p':[tuple(round(value, 6) for value in point) for point in points],
+            'k':knots,
+            'n':name+'_cntl'}
+        if periodic:
+            shapes[name]['per'] = True
+
+    if path and shapes:
+        library = {}
+        if os.path.isfile(path):
+            existing = readLibrary(path)
+            library = dict((key, existing[key]) for key in existing)
+        library.update(shapes)
+        writeLibrary(path, library)
+    return shapes
+
+
+##########################################################
+##########################################################
+#                      Simplifying                       #
+##########################################################
+##########################################################
+
+def simplifyCurve(points, degree, periodic=False, tolerance=0.01):
+    """Removes CVs that lie within tolerance of the line between the CVs kept around them.
+        Periodic curves are simplified without their overlapping CVs, which are added back after.
+        The CVs are returned unchanged if too few would be left for the degree.
+
+    Args:
+        points (list): (x,y,z) CVs
+        degree (int): curve degree
+        periodic (bool, optional): the last degree CVs repeat the first. Defaults to False.
+        tolerance (float, optional): furthest a removed CV may be. Defaults to 0.01.
+
+    Returns:
+        list: (x,y,z) CVs
+    """
+    if not periodic:
+        kept = simplifyPoints(points, tolerance)
+        return kept if len(kept) > degree else list(points)
+
+    unique = list(points[:len(points) - degree])
+    if len(unique) < 3:
+        return list(points)
+    #split the loop at the CV furthest from the first so each half is an open run
+    far = max(range(len(unique)), key=lambda count: vec.mag(vec.vector(unique[0], unique[count])))
+    first = simplifyPoints(unique[:far + 1], tolerance)
+    second = simplifyPoints(unique[far:] + unique[:1], tolerance)
+    kept = first + second[1:-1]
+    if len(kept) <= degree:
+        return list(points)
+    return kept + kept[:degree]
+
+
+def simplifyPoints(points, tolerance):
+    """Ramer-Douglas-Peucker simplification of an open run of points, keeping both ends
+
+    Args:
+        points (list): (x,y,z) points
+        tolerance (float): furthest a removed point may be from the line between its kept neighbours
+
+    Returns:
+        list: kept (x,y,z) points
+    """
+    points = [tuple(point) for point in points]
+    if len(points) < 3:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        furthest, index = 0.0, None
+        for count in range(start + 1, end):
+            distance = __segmentDistance(points[count], points[start], points[end])
+            if distance > furthest:
+                furthest, index = distance, count
+        if index is not None and furthest > tolerance:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def __segmentDistance(point, start, end):
+    segment = vec.vector(start, end)
+    length = vec.dot(segment, segment)
+    offset = vec.vector(start, point)
+    if not length:
+        return vec.mag(offset)
+    t = min(1.0, max(0.0, vec.dot(offset, segment) / length))
+    return vec.mag(vec.vector(vec.add(start, vec.mult(segment, t)), point))
+
+
+def makeKnots(count, degree, periodic=False):
+    """Uniform knots in Maya's layout, count + degree - 1 of them
+
+    Args:
+        count (int): number of CVs, including the overlapping CVs of a periodic curve
+        degree (int): curve degree
+        periodic (bool, optional): make periodic rather than clamped knots. Defaults to False.
+
+    Returns:
+        list: knot values
+    """
+    if periodic:
+        return list(range(1 - degree, count))
+    spans = count - degree
+    return [0] * (degree - 1) + list(range(spans + 1)) + [spans] * (degree - 1)
@@ -17,13 +17,14 @@ Description: Primary functions for creating controls
 import re
 import maya.cmds as mc
 
-from Rigging.Controls.library import ControlLibrary
+from Rigging.Controls.template import getShapeTemplates
 from Rigging.Utility.general import organizeElement
 from Rigging.Utility.general import getDescendent,getParent
-from Rigging.Utility.general import getRigSpace
+from Rigging.Utility.general import getRigSpace,assignSpaces
 from Rigging.Utility.general import hideAttrs
-from Rigging.Utility.general import createUtility
+from Rigging.Utility.general import createUtility,getDriverWeights
 from Rigging.Utility.general import addDriver
+from Rigging.Utility.nameIndex import nodeExists,trackCreated,getNameAllocator
 
 
 from Utility.stringTools import getSegment,replaceSegment,appendID
@@ -89,14 +90,9 @@ def addOffsetAbove(cntl,index=1, tag=''):
 
     #make name and ensure it's unique
     offset_name = replaceSegment(replaceSegment(cntl,-1,'grp'),-2,'offset')
-    target_offset_name = appendID(offset_name,tag)
-    count=1
-    while(mc.objExists(target_offset_name)):
-        target_offset_name=appendID(offset_name,''.join((tag,str(count))))
-        count+=1
-    offset_name=target_offset_name
+    offset_name = getNameAllocator().allocate(appendID(offset_name,tag),offset_name,tag)
     #make grp and reorder the list
-    new_offset = mc.group(em=1,name=offset_name)
+    new_offset = trackCreated(mc.group(em=1,name=offset_name))
     parent = getParent(target,1)
     mc.parent(new_offset,parent)
     mc.makeIdentity(new_offset, apply=False)
@@ -114,7 +110,7 @@ def enableInverseBlend(cntl,constraint,attrName='switch',inverseWeightIdx=1,dire
 
     Args:
         cntl (str): name of control to add inverseBlend feature
-        constraint (str): name of contraint to be driven by the attr. Expects 2 influences
+        constraint (str): name of contraint, or matrix driver weight node, to be driven by the attr. Expects 2 influences
         attrName (str, optional): name of blend attr. Defaults to 'switch'.
         inverseWeightIdx (int, optional): Influence that will be active at 0. Defaults to 1.
         directWeightIdx (int, optional): Influence that will be active at 1. Defaults to 0.
@@ -128,7 +124,7 @@ def enableInverseBlend(cntl,constraint,attrName='switch',inverseWeightIdx=1,dire
     invert_node_name = '_'.join((cntl,attrName,'reverse','util'))
     
     #create invert node if needed
-    if not mc.objExists(invert_node_name):
+    if not nodeExists(invert_node_name):
         invertNode= createUtility('reverse', invert_node_name)
     else:
         invertNode = invert_node_name
@@ -138,13 +134,13 @@ def enableInverseBlend(cntl,constraint,attrName='switch',inverseWeightIdx=1,dire
         mc.addAttr(cntl,ln=attrName,w=1,at='float',dv=1,hxv=1,hnv=1,max=1.0,min=0.0,k=1) 
 
     #does the connection
-    constraintWeights = mc.parentConstraint(constraint, q=1, wal=1)
+    constraintWeights = getDriverWeights(constraint)
     driver= ''.join((cntl,'.',attrName))
-    driven=''.join((constraint,'.',constraintWeights[directWeightIdx]))
+    driven=constraintWeights[directWeightIdx]
     inverseIn = '.'.join((invertNode,'ix'))
     if not mc.isConnected(driver,inverseIn,iuc=1):
         mc.connectAttr(driver, inverseIn,f=1)
-    inverseDriven=''.join((constraint,'.',constraintWeights[inverseWeightIdx]))
+    inverseDriven=constraintWeights[inverseWeightIdx]
     
     mc.connectAttr(driver,driven,f=1)
     mc.connectAttr('.'.join((invertNode,'ox')), inverseDriven,f=1)
@@ -169,7 +165,7 @@ def syncVis(base_cntl,attrName,max_cntls=None,min_cntls=None, max=1.0,min=0.0):
             max_cntls = [max_cntls]
         condition_max_node = '_'.join((base_cntl,attrName,'visConditionMax','util'))
         #make condition node
-        if not mc.objExists(condition_max_node):
+        if not nodeExists(condition_max_node):
             condition_max_node = createUtility('condition',condition_max_node)
         mc.setAttr('.'.join((condition_max_node,'ctr')),0)
         mc.setAttr('.'.join((condition_max_node,'cfr')),1)
@@ -182,7 +178,7 @@ def syncVis(base_cntl,attrName,max_cntls=None,min_cntls=None, max=1.0,min=0.0):
         if isinstance(min_cntls,(str)):
             min_cntls = [min_cntls]
         condition_min_node = '_'.join((cntl,attrName,'visConditionMin','util'))
-        if not mc.objExists(condition_min_node):
+        if not nodeExists(condition_min_node):
             condition_min_node = createUtility('condition',condition_min_node)
         mc.setAttr('.'.join((condition_min_node,'ctr')),0)
         mc.setAttr('.'.join((condition_min_node,'cfr')),1)
@@ -207,7 +203,8 @@ def makeCntl(jnts,
             size=1.0,
             rotation=(0,0,0),
             position='',
-            shapeOffset=(0,0,0)):
+            shapeOffset=(0,0,0),
+            instance=False):
     """Creates a control for the given nodes. Control Shapes lay on the x,-z plane and point towards towards the origin, when applicable
         Controls consist of a shape with 2 parent groups-- one for alignment and one for incoming connections.
     Args
@@ -219,6 +216,7 @@ def makeCntl(jnts,
         rotation (tuple, optional): Rotation of Control. Defaults to (0,0,0).
         position (list | tuple, optional): World Space Location to place control. Defaults to joint location if not given.
         shapeOffset (list | tuple, optional): Offset Distance from pivot. Defaults to (0,0,0).
+        instance (bool, optional): Share the shape node of the shape's template when no edits are needed. Defaults to False.
 
     Returns:
         list : Name of highest control groups created
@@ -229,6 +227,7 @@ def makeCntl(jnts,
     if isinstance(size,int):
         float(size)
 
+    library = getShapeTemplates()
     cntls = []
     for jnt in jnts:
         node_name= jnt
@@ -247,24 +246,26 @@ def makeCntl(jnts,
 
         #make cntl
         node_name = replaceSegment(node_name,-1,'cntl')
-        cntl = ControlLibrary().createControlShape(shape, node_name,shapeOffset,rotation,size)
-        mc.xform(cntl,t=shapeOffset,ws=1)
-        mc.makeIdentity(cntl,apply=True)
+        if library.isPreTransformed(shape):
+            #made in place, with the offset applied twice as moving and freezing the made shape did
+            cntl = library.createControlShape(shape, node_name,vec.add(shapeOffset,shapeOffset),rotation,size,instance,getSegment(node_name,0))
+        else:
+            cntl = library.createControlShape(shape, node_name,shapeOffset,rotation,size)
+            mc.xform(cntl,t=shapeOffset,ws=1)
+            mc.makeIdentity(cntl,apply=True)
 
         #make offset grp
         node_name = appendID(node_name,typ)
         offset_grp = replaceSegment(appendID(node_name, 'offset'),-1,'grp')
-        mc.parent(cntl,mc.group(em=1,n=offset_grp))
+        mc.parent(cntl,trackCreated(mc.group(em=1,n=offset_grp)))
 
         #make base cntl grp
         cntl_grp = replaceSegment(replaceSegment(offset_grp, -2, 'cntl'),-1,'grp')
-        mc.parent(offset_grp,mc.group(em=1,n=cntl_grp))
+        mc.parent(offset_grp,trackCreated(mc.group(em=1,n=cntl_grp)))
         
         #if position not specified, match to joint
         if not position:
-            mc.parent(cntl_grp,jnt)
-            mc.makeIdentity(cntl_grp, apply=False)
-            mc.parent(cntl_grp, a=1,w=1)
+            mc.xform(cntl_grp,m=mc.xform(jnt,q=1,m=1,ws=1),ws=1)
         else:
             mc.xform(cntl_grp,t=position,ws=1)
 
@@ -312,6 +313,7 @@ def makeMasterCntl(root,
     #issue-Requires testing
     addDriver(rig_space,mstr_cntl_offset,'parent',w=0)
     enableInverseBlend(mstr_cntl,follow_constraint,'follow')
+    assignSpaces(mstr_cntl,rig_space)
 
     #hide things you don't need to see
     hideAttrs(mstr_cntl_offset,(0,0,1))
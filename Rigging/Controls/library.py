@@ -11,725 +11,911 @@ Version: 2.0
 Module: Rigging.Controls
 
 Description: Library of shapes, curves, and other controls used for the generation of control rigs
+    The shape definitions are turned into read-only ShapeRecords once per session and shared through getShapeRegistry.
+    ControlLibrary is a view over a registry, so making one per control costs nothing.
+    Registries can also be read from shape library files, see Rigging.Controls.libraryFile,
+    layered over the default shapes. Records are only made when a shape is first used.
+    Curve shapes are sized, rotated and offset in memory and made with their final points in a single curve command.
 
 """
 
+import os
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+
 from maya.cmds import curve, circle, rename, makeIdentity, scale, xform, sphere, ls
 from maya.mel import eval as mc_eval
 
+import Utility.vectorArray as vecArray
+from Rigging.Controls.libraryFile import readLibrary
+from Rigging.Utility.nameIndex import trackCreated,trackCreatedHierarchy
+
+__shapeRegistries = {}
+
+
+def getDefaultControlDict():
+    """
+    Dictionary pattern 'Shape Name': ['ID','type',d,p,k,n]
+    Default orientation is -X
+    #Stores the actual list of curves and their data
+    Built once per session by getShapeRegistry, use the registry rather than calling this.
+    """
+    ControlLibraryDict = {
+        'nSphere':{
+            'ID':'nSphere',
+            'type':'nSphere',
+            'n':'nSphere_cntl',
+            'spans':2,
+            'sections':2,
+            'cch':1},
+        'triangle':{
+            'ID':'triangle',
+            'type':'curve',
+            'd':1,
+            'p':[(-1.03923,0,-1.8),(1.03923,0,-1.8),(0,0,0),(-1.03923,0,-1.8)],
+            'k':list(range(4)),
+            'n':"triangle_cntl"},
+
+        'square':{
+            'ID':'square',
+            'type':'curve',
+            'd':1,
+            'p':[(1,0,-1),(-1,0,-1),(-1,0,1),(1,0,1),(1,0,-1)],
+            'k':list(range(5)),
+            'n':'square_cntl'},
+
+        #'angle':{
+        #    'ID':'angle',
+        #    'type':'curve',
+        #    'd':1,
+        #    'p':[(-1,0,3),(1,0,-3),(1,0,1),(-3,0,-1),(-1,0,-1),(-1,0,3)],
+        #    'k':list(range(6)),
+        #    'n':'angle_cntl'},
+
+        'cross':{
+            'ID':'cross',
+            'type':'curve',
+            'd':1,
+            'p':[(0.4,0,-0.4),(0.4,0,-2),(-0.4,0,-2),(-0.4,0,-0.4),(-2,0,-0.4),(-2,0,0.4),
+                (-0.4,0,0.4),(-0.4,0,2),(0.4,0,2),(0.4,0,0.4),(2,0,0.4),(2,0,-0.4),(0.4,0,-0.4)],
+            'k':list(range(13)),
+            'n':'cross_cntl'},
+
+        'crossFat':{
+            'ID':'crossFat',
+            'type':'curve',
+            'd':1,
+            'p':[(2,0,1),(2,0,-1),(1,0,-1),(1,0,-2),(-1,0,-2),(-1,0,-1),(-2,0,-1),(-2,0,1),
+                (-1,0,1),(-1,0,2),(1,0,2),(1,0,1),(2,0,1)],
+            'k':list(range(13)),
+            'n':'fatCross_cntl'},
+
+        'circle':{
+            'ID':'circle',
+            'type':'circle',
+            'c':(0,0,0),
+            'nr':(0,1,0),
+            'sw':360,
+            'r':1,
+            'd':3,
+            'ut':0,
+            'tol':0.01,
+            's':8,
+            'ch':0,
+            'n':'circle_cntl'},
+
+        'arc270':{
+            'ID':'arc270',
+            'type':'curve',
+            'd':3,
+            'p':[(0.707107,0,0.707107),(0.570265,0,0.843948),(0.205819,0,1.040044),
+                (-0.405223,0,0.978634),(-0.881027,0,0.588697),(-1.059487,0,0),
+                (-0.881027,0,0.-0.588697),(-0.405223,0,-0.978634),
+                (0.205819,0,-1.040044),(-.570265,0,-0.843948),(0.707107,0,-0.707107)],
+            'k':[0,0,0,1,2,3,4,5,6,7,8,8,8],
+            'n':'arc270_cntl'},
+
+        'arc180':{
+            'ID':'arc180',
+            'type':'circle',
+            'c':(0,0,0),
+            'nr':(0,1,0),
+            'sw':180,
+            'r':1,
+            'd':3,
+            'ut':0,
+            'tol':0.01,
+            's':8,
+            'ch':0,
+            'n':'arc180_cntl'},
+
+        'spiral':{
+            'ID':'spiral',
+            'type':'curve',
+            'd':3,
+            'p':[(0.474561,0,-1.241626),(0.171579,0,-1.214307),(-0.434384,0,-1.159672),
+                (-1.124061,0,-0.419971),(-1.169741,0,0.305922),(-0.792507,0,1.018176),
+                (-0.0412486,0,1.262687),(0.915809,0,1.006098),(1.258635,0,0.364883),
+                (1.032378,0,-0.461231),(0.352527,0,-0.810017),(-0.451954,0,-0.43765),
+                (-0.634527,0,0.208919),(-0.0751226,0,0.696326),(0.292338,0,0.414161),
+                (0.476068,0,0.273078)],
+            'k':[0,0,0,1,2,3,4,5,6,7,8,9,10,11,12,13,13,13],
+            'n':'spiral_cntl'},
+
+        'pyramid12':{
+            'ID':'pyramid12',
+            'type':'curve',
+            'd':1,
+            'p':[(1, 0, 0), (0, 0, -1), (0, 1, 0), (1, 0, 0), (-1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, 0, -1), (0, 1, 0)],
+            'k':list(range(9)),
+            'n':'pyramid12_cntl'},
+
+        'pyramid':{
+            'ID':'pyramid',
+            'type':'curve',
+            'd':1,
+            'p':[(0, 0, 0), (-1, 1, -2), (-1, -1, -2), (0, 0, 0), (1, -1, -2), (1, 1, -2), (0, 0, 0), (-1, 1, -2), (1, 1, -2), (1, -1, -2), (-1, -1, -2)],
+            'k':list(range(11)),
+            'n':'pyrmid_cntl'},
+
+        'spear12':{
+            'ID':'spear12',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, -2.0), (-2.0, 0.0, 0.0), 
+                (2.0, 0.0, 0.0), (0.0, 0.0, -2.0), 
+                (0.0, -2.0, 0.0), (0.0, 2.0, 0.0), (0.0, 0.0, -2.0)],
+            'k':list(range(7)),
+            'n':'spear12_cntl'},
+
+        'spear':{
+            'ID':'spear',
+            'type':'curve',
+            'd':1,
+            'p':[(0,2,0),(0,0,2),(0,-2,0),(0,0,-2),(0,2,0),(0,-2,0),(0,0,0),(0,0,2),(0,0,-2),
+                (2,0,0),(0,0,2),(-2,0,0),(0,0,-2),(0,0,2),(0,0,0),(-2,0,0),(2,0,0)],
+            'k':list(range(17)),
+            'n':'spear_cntl'},
+
+        'cube':{
+            'ID':'cube',
+            'type':'curve',
+            'd':1,
+            'p':[(0.5,0.5,0.5),(0.5,0.5,-0.5),(-0.5,0.5,-0.5),(-0.5,-0.5,-0.5),
+                (0.5,-0.5,-0.5),(0.5,0.5,-0.5),(-0.5,0.5,-0.5),(-0.5,0.5,0.5),(0.5,0.5,0.5),
+                (0.5,-0.5,0.5),(0.5,-0.5,-0.5),(-0.5,-0.5,-0.5),(-0.5,-0.5,0.5),(0.5,-0.5,0.5),
+                (-0.5,-0.5,0.5),(-0.5,0.5,0.5)],
+            'k':list(range(16)),
+            'n':'cube_cntl'},
+
+        'hexagon':{
+            'ID':'hexagon',
+            'type':'curve',
+            'd':1,
+            'p':[(-0.5,1,0.866025),(0.5,1,0.866025),(0.5,-1,0.866025),(1,-1,0),(1,1,0),
+                (0.5,1,-0.866025),(0.5,-1,-0.866025),(-0.5,-1,-0.866026),(-0.5,1,-0.866026),
+                (-1,1,-1.5885e-007),(-1,-1,-1.5885e-007),(-0.5,-1,0.866025),(-0.5,1,0.866025),
+                (-1,1,-1.5885e-007),(-0.5,1,-0.866026),(0.5,1,-0.866025),(1,1,0),
+                (0.5,1,0.866025),(0.5,-1,0.866025),(-0.5,-1,0.866025),(-1,-1,-1.5885e-007),
+                (-0.5,-1,-0.866026),(0.5,-1,-0.866025),(1,-1,0)],
+            'k':list(range(24)),
+            'n':'hexagon_cntl'},
+
+        'rombus':{
+            'ID':'rombus',
+            'type':'curve',
+            'd':1,
+            'p':[(0,1,0),(1,0,0),(0,0,1),(-1,0,0),(0,0,-1),(0,1,0),(0,0,1),
+                (0,-1,0),(0,0,-1),(1,0,0),(0,1,0),(-1,0,0),(0,-1,0),(1,0,0)],
+            'k':list(range(14)),
+            'n':'rombus_cntl'},
+
+        'rombus2':{
+            'ID':'rombus2',
+            'type':'curve',
+            'd':1,
+            'p':[(0,0,2),(0,1,0),(0,0,-2),(0,-1,0),(-1,0,0),(0,1,0),(1,0,0),(0,-1,0),
+                (0,0,2),(1,0,0),(0,0,-2),(-1,0,0),(0,0,2)],
+            'k':list(range(13)),
+            'n':'rombus2_cntl'},
+
+        'rombus3':{
+            'ID':'rombus3',
+            'type':'curve',
+            'd':1,
+            'p':[(0,0,2),(-0.707107,0.707107,0),(0,0,-2),(0.707107,0.707107,0),
+                (0,0,2),(0.707107,-0.707107,0),(0,0,-2),(-0.707107,-0.707107,0),
+                (0.707107,-0.707107,0),(0.707107,0.707107,0),(-0.707107,0.707107,0),
+                (-0.707107,-0.707107,0),(0,0,2)],
+            'k':list(range(13)),
+            'n':'rombus3_cntl'},
+
+        'dirSingleThin':{
+            'ID':'dirSingleThin',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, -2.0), (0.0, 0.0, 0.0), (1.0, 0.0, -1.0), 
+                (0.0, 0.0, 0.0), (-1.0, 0.0, -1.0)],
+            'k':list(range(5)),
+            'n':'dirSingleThin_cntl'},
+
+        'dirSingle':{
+            'ID':'dirSingle',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, 0.0), (1.0, 0.0, -1.33), (0.33, 0.0, -1.33), 
+                (0.33, 0.0, -2.33), (-0.33, 0.0, -2.33), (-0.33, 0.0, -1.33), 
+                (-0.99, 0.0, -1.33), (0.0, 0.0, 0.0)],
+            'k':list(range(8)),
+            'n':'dirSingle_cntl'},
+
+        'dirSingleFat':{
+            'ID':'dirSingleFat',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, 0.0), (0.66, 0.0, -0.99), (0.33, 0.0, -0.99), 
+                (0.33, 0.0, -1.66), (-0.33, 0.0, -1.66), (-0.33, 0.0, -0.99), 
+                (-0.66, 0.0, -0.99), (0.0, 0.0, 0.0)],
+            'k':list(range(8)),
+            'n':'dirSingleFat_cntl'},
+
+        'dirDoubleThin':{
+            'ID':'dirDoubleThin',
+            'type':'curve',
+            'd':1,
+            'p':[(1,0,-1),(2,0,0),(1,0,1),
+                (2,0,0),(-2,0,0),(-1,0,1),
+                (-2,0,0),(-1,0,-1)],
+            'k':list(range(8)),
+            'n':'dirDoubleThin_cntl'},
+
+        'dirDouble':{
+            'ID':'dirDouble',
+            'type':'curve',
+            'd':1,
+            'p':[(-2.31,0,0),(-0.99,0,0.99),(-0.99,0,0.33),(0.99,0,0.33),
+                (0.99,0,0.99),(2.31,0,0),(0.99,0,-0.99),(0.99,0,-0.33),
+                (-0.99,0,-0.33),(-0.99,0,-0.99),(-2.31,0,0)],
+            'k':list(range(11)),
+            'n':'dirDouble_cntl'},
+
+        'dirDoubleFat':{
+            'ID':'dirDoubleFat',
+            'type':'curve',
+            'd':1,
+            'p':[(-1.35,0,0),(-0.36,0,0.66),(-0.36,0,0.33),(0.36,0,0.33),
+                (0.36,0,0.66),(1.35,0,0),(0.36,0,-0.66),(0.36,0,-0.33),
+                (-0.36,0,-0.33),(-0.36,0,-0.66),(-1.35,0,0)],
+            'k':list(range(11)),
+            'n':'dirDoubleFat_cntl'},
+
+        'dirFourThin':{
+            'ID':'dirFourThin',
+            'type':'curve',
+            'd':1,
+            'p':[(1.25,0,-0.5),(1.75,0,0),(1.25,0,0.5),(1.75,0,0),(-1.75,0,0),
+                (-1.25,0,-0.5),(-1.75,0,0),(-1.25,0,0.5),(-1.75,0,0),(0,0,0),(0,0,1.75),
+                (-0.5,0,1.25),(0,0,1.75),(0.5,0,1.25),(0,0,1.75),(0,0,-1.75),(0.5,0,-1.25),
+                (0,0,-1.75),(-0.5,0,-1.25),(0,0,-1.75)],
+            'k':list(range(20)),
+            'n':'dirFourThin_cntl'},
+
+        'dirFour':{
+            'ID':'dirFour',
+            'type':'curve',
+            'd':1,
+            'p':[(0,0,-1.98),(-0.495,0,-1.32),(-0.165,0,-1.32),(-0.165,0,-0.165),
+                (-1.32,0,-0.165),(-1.32,0,-0.495),(-1.98,0,0),(-1.32,0,0.495),(-1.32,0,0.165),
+                (-0.165,0,0.165),(-0.165,0,1.32),(-0.495,0,1.32),(0,0,1.98),(0.495,0,1.32),
+                (0.165,0,1.32),(0.165,0,0.165),(1.32,0,0.165),(1.32,0,0.495),(1.98,0,0),
+                (1.32,0,-0.495),(1.32,0,-0.165),(0.165,0,-0.165),(0.165,0,-1.32),
+                (0.495,0,-1.32),(0,0,-1.98)],
+            'k':list(range(25)),
+            'n':'dirFour_cntl'},
+
+        'dirFourFat':{
+            'ID':'dirFourFat',
+            'type':'curve',
+            'd':1,
+            'p':[(0,0,-1.1025),(-0.33,0,-0.6075),(-0.165,0,-0.6075),(-0.165,0,-0.165),
+                (-0.6075,0,-0.165),(-0.6075,0,-0.33),(-1.1025,0,0),(-0.6075,0,0.33),
+                (-0.6075,0,0.165),(-0.165,0,0.165),(-0.165,0,0.6075),(-0.33,0,0.6075),
+                (0,0,1.1025),(0.33,0,0.6075),(0.165,0,0.6075),(0.165,0,0.165),
+                (0.6075,0,0.165),(0.6075,0,0.33),(1.1025,0,0),(0.6075,0,-0.33),
+                (0.6075,0,-0.165),(0.165,0,-0.165),(0.165,0,-0.6075),(0.33,0,-0.6075),
+                (0,0,-1.1025)],
+            'k':list(range(25)),
+            'n':'dirFourFat_cntl'},
+
+        'dirEight':{
+            'ID':'dirEight',
+            'type':'curve',
+            'd':1,
+            'p':[(-1.8975,0,0),(-1.4025,0,0.37125),(-1.4025,0,0.12375),
+                (-0.380966,0,0.157801),(-1.079222,0,0.904213),(-1.254231,0,0.729204),
+                (-1.341735,0,1.341735),(-0.729204,0,1.254231),(-0.904213,0,1.079222),
+                (-0.157801,0,0.380966),(-0.12375,0,1.4025),(-0.37125,0,1.4025),(0,0,1.8975),
+                (0.37125,0,1.4025),(0.12375,0,1.4025),(0.157801,0,0.380966),
+                (0.904213,0,1.079222),(0.729204,0,1.254231),(1.341735,0,1.341735),
+                (1.254231,0,0.729204),(1.079222,0,0.904213),(0.380966,0,0.157801),
+                (1.4025,0,0.12375),(1.4025,0,0.37125),(1.8975,0,0),(1.4025,0,-0.37125),
+                (1.4025,0,-0.12375),(0.380966,0,-0.157801),(1.079222,0,-0.904213),
+                (1.254231,0,-0.729204),(1.341735,0,-1.341735),(0.729204,0,-1.254231),
+                (0.904213,0,-1.079222),(0.157801,0,-0.380966),(0.12375,0,-1.4025),
+                (0.37125,0,-1.4025),(0,0,-1.8975),(-0.37125,0,-1.4025),(-0.12375,0,-1.4025),
+                (-0.157801,0,-0.380966),(-0.904213,0,-1.079222),(-0.729204,0,-1.254231),
+                (-1.341735,0,-1.341735),(-1.254231,0,-0.729204),(-1.079222,0,-0.904213),
+                (-0.380966,0,-0.157801),(-1.4025,0,-0.12375),(-1.4025,0,-0.37125),(-1.8975,0,0)],
+            'k':list(range(49)),
+            'n':'dirEight_cntl'},
+
+        'cone':{
+            'ID':'cone',
+            'type':'curve',
+            'd':1,
+            'p':[(0.866, 0.5, -2.0), (0.866, -0.5, -2.0), (0.0, 0.0, 0.0), 
+                (0.866, 0.5, -2.0), (0.0, 1.0, -2.0), (0.0, 0.0, 0.0), 
+                (-0.866, 0.5, -2.0), (0.0, 1.0, -2.0), (0.0, 0.0, 0.0), 
+                (-0.866, -0.5, -2.0), (-0.866, 0.5, -2.0), (0.0, 0.0, 0.0), 
+                (0.0, -1.0, -2.0), (-0.866, -0.5, -2.0), (0.0, 0.0, 0.0), 
+                (0.866, -0.5, -2.0), (0.0, -1.0, -2.0)],
+            'k':list(range(17)),
+            'n':'cone_cntl'},
+
+        'rot90Thin':{
+            'ID':'rot90Thin',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, -1.026), (-0.3926, 0.0, -0.948), 
+                (-0.7255, 0.0, -0.7254), (-0.9479, 0.0, -0.393), 
+                (-1.0, 0.0, -0.1301), (-1.0014, 0.0, 0.0107), 
+                (-0.5442, 0.0, -0.3395), (-1.0014, 0.0, 0.0107), 
+                (-1.3517, 0.0, -0.4465)],
+            'k':list(range(9)),
+            'n':'rot90Thin_cntl'},
+
+        'rot90':{
+            'ID':'rot90',
+            'type':'curve',
+            'd':1,
+            'p':[(-1.0158, 0.0, -0.251), (-0.9797, 0.0, -0.7618), 
+                (-0.9305, 0.0, -0.4865), (-0.8864, 0.0, -0.5707), 
+                (-0.7748, 0.0, -0.7279), (-0.5507, 0.0, -0.9093), 
+                (-0.2859, 0.0, -1.0239), (0.0, 0.0, -1.0631), 
+                (0.0, 0.0, -0.9618), (-0.2586, 0.0, -0.9264), 
+                (-0.4982, 0.0, -0.8227), (-0.701, 0.0, -0.6586), 
+                (-0.802, 0.0, -0.5164), (-0.8419, 0.0, -0.4402), 
+                (-0.5677, 0.0, -0.4989), (-1.0158, 0.0, -0.251)],
+            'k':list(range(16)),
+            'n':'rot90_cntl'},
+
+        'rot90Fat':{
+            'ID':'rot90Fat',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, -0.9234), (0.0, 0.0, -1.1287), (-0.4319, 0.0, -1.0427), 
+                (-0.798, 0.0, -0.798), (-0.9462, 0.0, -0.5609), (-1.0363, 0.0, -0.9759), 
+                (-1.0965, 0.0, -0.1246), (-0.3497, 0.0, -0.5377), (-0.7887, 0.0, -0.4408), 
+                (-0.653, 0.0, -0.6528), (-0.3534, 0.0, -0.8532), (0.0, 0.0, -0.9234)],
+            'k':list(range(12)),
+            'n':'rot90Fat_cntl'},
+
+        'rot180Thin':{
+            'ID':'rot180Thin',
+            'type':'curve',
+            'd':1,
+            'p':[(1.3517, 0.0, -0.4465), (1.0014, 0.0, 0.0107), (0.5442, 0.0, -0.3395), 
+                (1.0014, 0.0, 0.0107), (1.0, 0.0, -0.1301), (0.9479, 0.0, -0.393), 
+                (0.7255, 0.0, -0.7254), (0.3926, 0.0, -0.948), (0.0, 0.0, -1.026), 
+                (-0.3926, 0.0, -0.948), (-0.7255, 0.0, -0.7254), (-0.9479, 0.0, -0.393), 
+                (-1.0, 0.0, -0.1301), (-1.0, 0.0, 0.0), (-0.5442, 0.0, -0.3395), 
+                (-1.0, 0.0, 0.0), (-1.3517, 0.0, -0.4465)],
+            'k':list(range(17)),
+            'n':'rot180Thin_cntl'},
+
+        'rot180':{
+            'ID':'rot180',
+            'type':'curve',
+            'd':1,
+            'p':[(1.0158, 0.0, -0.251), (0.9797, 0.0, -0.7618), (0.9305, 0.0, -0.4865), 
+                (0.8864, 0.0, -0.5707), (0.7748, 0.0, -0.7279), (0.5507, 0.0, -0.9093), 
+                (0.2859, 0.0, -1.0239), (0.0, 0.0, -1.0631), (-0.2859, 0.0, -1.0239), 
+                (-0.5507, 0.0, -0.9093), (-0.7748, 0.0, -0.7279), (-0.8864, 0.0, -0.5707), 
+                (-0.9305, 0.0, -0.4865), (-0.9797, 0.0, -0.7618), (-1.0158, 0.0, -0.251), 
+                (-0.5677, 0.0, -0.4989), (-0.8419, 0.0, -0.4402), (-0.802, 0.0, -0.5164), 
+                (-0.701, 0.0, -0.6586), (-0.4982, 0.0, -0.8227), (-0.2586, 0.0, -0.9264), 
+                (0.0, 0.0, -0.9618), (0.2586, 0.0, -0.9264), (0.4982, 0.0, -0.8227), 
+                (0.701, 0.0, -0.6586), (0.802, 0.0, -0.5164), (0.8419, 0.0, -0.4402), 
+                (0.5677, 0.0, -0.4989), (1.0158, 0.0, -0.251)],
+            'k':list(range(29)),
+            'n':'rot180_cntl'},
+
+        'rot180Fat':{
+            'ID':'rot180Fat',
+            'type':'curve',
+            'd':1,
+            'p':[(1.0965, 0.0, -0.1246), (1.0363, 0.0, -0.9759), (0.9443, 0.0, -0.5591), 
+                (0.798, 0.0, -0.798), (0.4319, 0.0, -1.0427), (0.0, 0.0, -1.1287), 
+                (-0.4319, 0.0, -1.0427), (-0.798, 0.0, -0.798), (-0.9462, 0.0, -0.5609), 
+                (-1.0363, 0.0, -0.9759), (-1.0965, 0.0, -0.1246), (-0.3497, 0.0, -0.5377), 
+                (-0.7887, 0.0, -0.4408), (-0.653, 0.0, -0.6528), (-0.3534, 0.0, -0.8532), 
+                (0.0, 0.0, -0.9234), (0.3534, 0.0, -0.8532), (0.653, 0.0, -0.6528), 
+                (0.7856, 0.0, -0.4392), (0.3497, 0.0, -0.5377), (1.0965, 0.0, -0.1246)],
+            'k':list(range(21)),
+            'n':'rot180Fat_cntl'},
+
+        'transform':{
+        'ID':'transform',
+        'type':'special',
+        'n':'transform_cntl',
+        'mel':'''
+            $circleHelper = `circle -c 0 0 0 -nr 0 1 0 -sw 360 -r 1.5 -d 3 -ut 0 -tol 0.01 -s 8 -ch 0 -n "controller1"`;
+            string $arrows[] ;
+            $arrows[0] = `curve -d 1 -p 1.75625 0 0.115973 -p 1.75625 0 -0.170979 -p 2.114939 0 -0.170979 -p 2.114939 0 -0.314454 -p 2.473628 0 -0.0275029 -p 2.114939 0 0.259448 -p 2.114939 0 0.115973 -p 1.75625 0 0.115973 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow1` ;
+                setAttr ($arrows[0] + ".overrideEnabled") 1 ;
+                setAttr ($arrows[0] + ".overrideDisplayType") 2 ;
+                pickWalk -d down ; TemplateObject ;
+            $arrows[1] = `curve -d 1 -p 0.143476 0 -1.783753 -p 0.143476 0 -2.142442 -p 0.286951 0 -2.142442 -p 0 0 -2.501131 -p -0.286951 0 -2.142442 -p -0.143476 0 -2.142442 -p -0.143476 0 -1.783753 -p 0.143476 0 -1.783753 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow2` ;
+                setAttr ($arrows[1] + ".overrideEnabled") 1 ;
+                setAttr ($arrows[1] + ".overrideDisplayType") 2 ;
+                pickWalk -d down ; TemplateObject ;
+            $arrows[2] = `curve -d 1 -p -1.75625 0 -0.170979 -p -2.114939 0 -0.170979 -p -2.114939 0 -0.314454 -p -2.473628 0 -0.0275029 -p -2.114939 0 0.259448 -p -2.114939 0 0.115973 -p -1.75625 0 0.115973 -p -1.75625 0 -0.170979 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow3`;
+                setAttr ($arrows[2] + ".overrideEnabled") 1 ;
+                setAttr ($arrows[2] + ".overrideDisplayType") 2 ;
+                pickWalk -d down ; TemplateObject ;
+            $arrows[3] = `curve -d 1 -p -0.143476 0 1.728747 -p -0.143476 0 2.087436 -p -0.286951 0 2.087436 -p 0 0 2.446125 -p 0.286951 0 2.087436 -p 0.143476 0 2.087436 -p 0.143476 0 1.728747 -p -0.143476 0 1.728747 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow4`;
+                setAttr ($arrows[3] + ".overrideEnabled") 1 ;
+                setAttr ($arrows[3] + ".overrideDisplayType") 2 ;
+                pickWalk -d down ; TemplateObject ;
+            string $arrowGRP = `group -n helperArrowsGRP -p $circleHelper $arrows[0] $arrows[1] $arrows[2] $arrows[3]`;
+                select -r $circleHelper ;
+            '''},
+
+        'arrowsOnBall':{
+            'ID':'arrowsOnBall',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, -1.0016, -0.35), (-0.3366, -0.7512, -0.6779), 
+                (-0.096, -0.7512, -0.6779), (-0.096, -0.5008, -0.8505), 
+                (-0.096, -0.0988, -0.954), (-0.5008, -0.0988, -0.8505), 
+                (-0.7512, -0.0988, -0.6779), (-0.7512, -0.3366, -0.6779), 
+                (-1.0016, 0.0, -0.35), (-0.7512, 0.3366, -0.6779), 
+                (-0.7512, 0.0988, -0.6779), (-0.5008, 0.0988, -0.8505), 
+                (-0.096, 0.0988, -0.954), (-0.096, 0.5008, -0.8505), 
+                (-0.096, 0.7512, -0.6779), (-0.3366, 0.7512, -0.6779), 
+                (0.0, 1.0016, -0.35), (0.3366, 0.7512, -0.6779), 
+                (0.096, 0.7512, -0.6779), (0.096, 0.5008, -0.8505), 
+                (0.096, 0.0988, -0.954), (0.5008, 0.0988, -0.8505), 
+                (0.7512, 0.0988, -0.6779), (0.7512, 0.3366, -0.6779), 
+                (1.0016, 0.0, -0.35), (0.7512, -0.3366, -0.6779), 
+                (0.7512, -0.0988, -0.6779), (0.5008, -0.0988, -0.8505), 
+                (0.096, -0.0988, -0.954), (0.096, -0.5008, -0.8505), 
+                (0.096, -0.7512, -0.6779), (0.3366, -0.7512, -0.6779), 
+                (0.0, -1.0016, -0.35)],
+            'k':list(range(33)),
+            'n':'arrowsOnBall_cntl'},
+
+        'sun':{
+            'ID':'sun',
+            'type':'special',
+            'n':'sun_cntl',
+            'mel':
+            '''
+                string $CONTROLLER1[] = `circle -c 0 0 0 -nr 0 1 0 -sw 360 -r 1 -d 3 -ut 0 -tol 0.01 -s 16 -ch 1 -n controller1` ;
+                select -r ($CONTROLLER1[0] + ".cv[0]") ($CONTROLLER1[0] + ".cv[2]") ($CONTROLLER1[0] + ".cv[4]")($CONTROLLER1[0] + ".cv[6]")($CONTROLLER1[0] + ".cv[8]")($CONTROLLER1[0] + ".cv[10]")($CONTROLLER1[0] + ".cv[12]") ($CONTROLLER1[0] + ".cv[14]") ;
+                string $CONTROLCLUSTER[] = `cluster -relative -envelope 1` ;
+                setAttr ($CONTROLCLUSTER[0] + "Handle.scale") 0.5 0.5 0.5 ;
+                string $CONTROLLER2[] = `circle -c 0 0 0 -nr 0 1 0 -sw 360 -r 0.25 -d 3 -ut 0 -tol 0.01 -s 8 -ch 1 -n controller1` ;
+                select -r $CONTROLLER2[0] $CONTROLLER1[0] ; parent ; pickWalk -d up ; DeleteHistory ;
+            '''},
+            'pin':{
+            'ID':'pin',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), 
+                (1.0, 0.0, -0.5), (0.5, 0.0, -0.5), 
+                (0.5, 0.0, -1.5), (1.0, 0.0, -1.5), (1.0, 0.0, -2.5), 
+                (-1.0, 0.0, -2.5), (-1.0, 0.0, -1.5), (-0.5, 0.0, -1.5), 
+                (-0.5, 0.0, -0.5), (-1.0, 0.0, -0.5), (-1.0, 0.0, 0.0), 
+                (0.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 1.0, -0.5), (0.0, 0.5, -0.5), 
+                (0.0, 0.5, -1.5), (0.0, 1.0, -1.5), (0.0, 1.0, -2.5), (0.0, -1.0, -2.5), 
+                (0.0, -1.0, -1.5), (0.0, -0.5, -1.5), (0.0, -0.5, -0.5), (0.0, -1.0, -0.5), 
+                (0.0, -1.0, 0.0), (0.0, 0.0, 0.0)],
+            'k':list(range(27)),
+            'n':'pin_cntl'},
+
+        'jack':{
+            'ID':'jack',
+            'type':'curve',
+            'd':1,
+            'p':[(0,0,0),(0.75,0,0),(1,0.25,0),(1.25,0,0),(1,-0.25,0),(0.75,0,0),
+                (1,0,0.25),(1.25,0,0),(1,0,-0.25),(1,0.25,0),(1,0,0.25),(1,-0.25,0),
+                (1,0,-0.25),(0.75,0,0),(0,0,0),(-0.75,0,0),(-1,0.25,0),(-1.25,0,0),
+                (-1,-0.25,0),(-0.75,0,0),(-1,0,0.25),(-1.25,0,0),(-1,0,-0.25),
+                (-1,0.25,0),(-1,0,0.25),(-1,-0.25,0),(-1,0,-0.25),(-0.75,0,0),(0,0,0),
+                (0,0.75,0),(0,1,-0.25),(0,1.25,0),(0,1,0.25),(0,0.75,0),(-0.25,1,0),
+                (0,1.25,0),(0.25,1,0),(0,1,0.25),(-0.25,1,0),(0,1,-0.25),(0.25,1,0),
+                (0,0.75,0),(0,0,0),(0,-0.75,0),(0,-1,-0.25),(0,-1.25,0),(0,-1,0.25),
+                (0,-0.75,0),(-0.25,-1,0),(0,-1.25,0),(0.25,-1,0),(0,-1,-0.25),
+                (-0.25,-1,0),(0,-1,0.25),(0.25,-1,0),(0,-0.75,0),(0,0,0),(0,0,-0.75),
+                (0,0.25,-1),(0,0,-1.25),(0,-0.25,-1),(0,0,-0.75),(-0.25,0,-1),
+                (0,0,-1.25),(0.25,0,-1),(0,0.25,-1),(-0.25,0,-1),(0,-0.25,-1),
+                (0.25,0,-1),(0,0,-0.75),(0,0,0),(0,0,0.75),(0,0.25,1),(0,0,1.25),
+                (0,-0.25,1),(0,0,0.75),(-0.25,0,1),(0,0,1.25),(0.25,0,1),(0,0.25,1),
+                (-0.25,0,1),(0,-0.25,1),(0.25,0,1),(0,0,0.75)],
+            'k':list(range(84)),
+            'n':'jack_cntl'},
+
+        'footprint':{
+            'ID':'footprint',
+            'type':'curve',
+            'd':1,
+            'p':[(1.1,0,-0.08),(.922,0,0.4),(0.62,0,0.514),(-0.03,0,0.412),
+                (-0.552,0,0.863),(-1.162,0,0.921),(-1.67,0,0.775),(-2,0,0.383),
+                (-2.33,0,-0.132),(-2.3,0,-0.55),(-1.7,0,-0.655),(-0.64,0,-0.575),
+                (-0.1,0,-0.364),(0.4,0,-0.53),(0.842,0,-0.466),(1.12,0,-0.08)],
+            'k':list(range(16)),
+            'n':'footprint_cntl'},
+
+        'hand':{
+            'ID':'hand',
+            'type':'special',
+            'n':'hand_cntl',
+            'mel':
+            '''
+                string $CONTROLLERS[] ;
+                $CONTROLLERS[0] = `curve -d 1 -p -0.718223 0 -0.925311 -p -0.718223 0 0.462656 -p -0.462656 0 0.925311 -p 0 0 0.925311 -p 0.170548 0 0.873409 -p 0.341096 0 0.925311 -p 0.925311 0 0.925311 -p 0.925311 0 0 -p 0.718223 0 -0.462656 -p 0.718223 0 -0.925311 -p 0.457051 0 -1.156639 -p -0.462656 0 -1.156639 -p -0.718223 0 -0.925311 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -k 8 -k 9 -k 10 -k 11 -k 12 -n "controller1"` ;
+                $CONTROLLERS[1] = `curve -d 1 -p -0.718223 0 -0.925311 -p -0.718223 0 -2.544605 -p -0.457051 0 -2.544605 -p -0.462656 0 -1.156639 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
+                $CONTROLLERS[2] = `curve -d 1 -p -0.326465 0 -1.156639 -p -0.326465 0 -2.775933 -p -0.065293 0 -2.775933 -p -0.065293 0 -1.156639 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
+                $CONTROLLERS[3] = `curve -d 1 -p 0.065293 0 -1.156639 -p 0.065293 0 -3.007261 -p 0.326465 0 -3.007261 -p 0.326465 0 -1.156639 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
+                $CONTROLLERS[4] = `curve -d 1 -p 0.457051 0 -1.156639 -p 0.457051 0 -2.775933 -p 0.718223 0 -2.775933 -p 0.718223 0 -0.925311 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
+                $CONTROLLERS[5] = `curve -d 1 -p 0.925311 0 0 -p 1.156639 0 -0.231328 -p 1.387967 0 -0.693983 -p 1.619294 0 -0.462656 -p 1.387967 0 0.231328 -p 0.925311 0 0.925311 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -n "controller1"` ;
+                select -r $CONTROLLERS ;
+                select -d $CONTROLLERS[0] ;
+                select -add $CONTROLLERS[0] ; parent ;
+                select -d $CONTROLLERS[0] ;
+                for ($ELEMENT in `ls -sl`)
+                {
+                setAttr -lock true ($ELEMENT + ".t") ;
+                setAttr -lock true ($ELEMENT + ".r") ;
+                setAttr -lock true ($ELEMENT + ".s") ;
+                setAttr -lock true ($ELEMENT + ".v") ;
+                setAttr -e -k false ($ELEMENT + ".tx") ;
+                setAttr -e -k false ($ELEMENT + ".ty") ;
+                setAttr -e -k false ($ELEMENT + ".tz") ;
+                setAttr -e -k false ($ELEMENT + ".rx") ;
+                setAttr -e -k false ($ELEMENT + ".ry") ;
+                setAttr -e -k false ($ELEMENT + ".rz") ;
+                setAttr -e -k false ($ELEMENT + ".sx") ;
+                setAttr -e -k false ($ELEMENT + ".sy") ;
+                setAttr -e -k false ($ELEMENT + ".sz") ;
+                setAttr -e -k false ($ELEMENT + ".v") ;
+                } ;
+                select -r $CONTROLLERS[0] ;
+            '''},
+
+        'nail':{
+            'ID':'nail',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, 0.0), (0.0, 0.0, -1.0), (-0.35, 0.0, -1.146), 
+                (-0.5, 0.0, -1.5), (-0.35, 0.0, -1.85), (0.0, 0.0, -2.0), 
+                (0.35, 0.0, -1.85), (0.5, 0.0, -1.5), (0.35, 0.0, -1.146), 
+                (0.0, 0.0, -1.0), (-0.35, 0.0, -1.146), (0.35, 0.0, -1.85), 
+                (0.0, 0.0, -2.0), (-0.35, 0.0, -1.85), (0.35, 0.0, -1.146)],
+            'k':list(range(15)),
+            'n':'nail_cntl'},
+
+        'nail2':{
+            'ID':'nail2',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0,0.0,0.0),(-1.0,0.0,0.0),(-1.146,0.0,-0.35),
+                (-1.5,0.0,-0.5),(-1.85,0.0,-0.35),(-2.0,0.0,0.0),
+                (-1.85,0.0,0.35),(-1.5,0.0,0.5),(-1.146,0.0,0.35),
+                (-1.0,0.0,0.0),(-1.146,0.0,0.35),(-1.85,0.0,-0.35),
+                (-1.5,0.0,-0.5),(-1.146,0.0,-0.35),(-1.85,0.0,0.35),
+                (-1.5,0.0,0.5),(-1.146,0.0,0.35),(-1.0,0.0,0.0),
+                (0.0,0.0,0.0),(1.0,0.0,0.0),(1.146,0.0,-0.35),
+                (1.5,0.0,-0.5),(1.85,0.0,-0.35),(2.0,0.0,0.0),
+                (1.85,0.0,0.35),(1.5,0.0,0.5),(1.146,0.0,0.35),
+                (1.0,0.0,0.0),(1.146,0.0,0.35),(1.85,0.0,-0.35),
+                (1.5,0.0,-0.5),(1.146,0.0,-0.35),(1.85,0.0,0.35)],
+            'k':list(range(33)),
+            'n':'nail2_cntl'},
+
+        'nail4':{
+            'ID':'nail4',
+            'type':'curve',
+            'd':1,
+            'p':[(-1.0, 0.0, 0.0),(-1.146, 0.0, -0.35),(-1.5, 0.0, -0.5),
+                (-1.85, 0.0, -0.35),(-2.0, 0.0, 0.0),(-1.85, 0.0, 0.35),
+                (-1.5, 0.0, 0.5),(-1.146, 0.0, 0.35),(-1.0, 0.0, 0.0),
+                (-1.146, 0.0, 0.35),(-1.85, 0.0, -0.35),(-2.0, 0.0, 0.0),
+                (-1.85, 0.0, 0.35),(-1.146, 0.0, -0.35),(-1.0, 0.0, 0.0),
+                (0.0, 0.0, 0.0),(1.0, 0.0, 0.0),(1.146, 0.0, 0.35),(1.5, 0.0, 0.5),
+                (1.85, 0.0, 0.35),(2.0, 0.0, 0.0),(1.85, 0.0, -0.35),(1.5, 0.0, -0.5),
+                (1.146, 0.0, -0.35),(1.0, 0.0, 0.0),(1.146, 0.0, 0.35),
+                (1.85, 0.0, -0.35),(2.0, 0.0, 0.0),(1.85, 0.0, 0.35),
+                (1.146, 0.0, -0.35),(1.0, 0.0, 0.0),(0.0, 0.0, 0.0),(0.0, 0.0, 1.0),
+                (-0.35, 0.0, 1.146),(-0.5, 0.0, 1.5),(-0.35, 0.0, 1.85),(0.0, 0.0, 2.0),
+                (0.35, 0.0, 1.85),(0.5, 0.0, 1.5),(0.35, 0.0, 1.146),(0.0, 0.0, 1.0),
+                (0.35, 0.0, 1.146),(-0.35, 0.0, 1.85),(0.0, 0.0, 2.0),(0.35, 0.0, 1.85),
+                (-0.35, 0.0, 1.146),(0.0, 0.0, 1.0),(0.0, 0.0, -1.0),
+                (-0.35, 0.0, -1.146),(-0.5, 0.0, -1.5),(-0.35, 0.0, -1.85),
+                (0.0, 0.0, -2.0),(0.35, 0.0, -1.85),(0.5, 0.0, -1.5),
+                (0.35, 0.0, -1.146),(0.0, 0.0, -1.0),(0.35, 0.0, -1.146),
+                (-0.35, 0.0, -1.85),(0.0, 0.0, -2.0),(0.35, 0.0, -1.85),
+                (-0.35, 0.0, -1.146)],
+            'k':list(range(61)),
+            'n':'nail4_cntl'},
+
+        'sphere':{
+            'ID':'sphere',
+            'type':'curve',
+            'd':1,
+            'p':[(0,0,1),(0,0.5,0.866025),(0,0.866025,0.5),(0,1,0),(0,0.866025,-0.5),
+                (0,0.5,-0.866025),(0,0,-1),(0,-0.5,-0.866025),(0,-0.866025,-0.5),
+                (0,-1,0),(0,-0.866025,0.5),(0,-0.5,0.866025),(0,0,1),
+                (0.707107,0,0.707107),(1,0,0),(0.707107,0,-0.707107),(0,0,-1),
+                (-0.707107,0,-0.707107),(-1,0,0),(-0.866025,0.5,0),(-0.5,0.866025,0),
+                (0,1,0),(0.5,0.866025,0),(0.866025,0.5,0),(1,0,0),(0.866025,-0.5,0),
+                (0.5,-0.866025,0),(0,-1,0),(-0.5,-0.866025,0),(-0.866025,-0.5,0),
+                (-1,0,0),(-0.707107,0,0.707107),(0,0,1)],
+            'k':list(range(33)),
+            'n':'sphere_cntl'},
+
+        'cog':{
+            'ID':'cog',
+            'type':'special',
+            'n':'cog_cntl',
+            'mel':
+            '''
+                    string $cog=`curve -n 'cog_cntl' -d 3 -p 7.06316e-009 0 -1 -p 0.104714 0 -0.990425 -p 0.314142 0 -0.971274 -p 0.597534 0 -0.821244 -p 0.822435 0 -0.597853 -p 0.96683 0 -0.314057 -p 1.016585 0 -2.28604e-005 -p 0.96683 0 0.314148 -p 0.822435 0 0.597532 -p 0.597534 0 0.822435 -p 0.314142 0 0.96683 -p 1.22886e-008 0 1.016585 -p -0.314142 0 0.96683 -p -0.597534 0 0.822435 -p -0.822435 0 0.597532 -p -0.96683 0 0.314148 -p -1.016585 0 -2.29279e-005 -p -0.96683 0 -0.314057 -p -0.822435 0 -0.597853 -p -0.597534 0 -0.821244 -p -0.314142 0 -0.971274 -p -0.104714 0 -0.990425 -p 7.06316e-009 0 -1 -k 0 -k 0 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -k 8 -k 9 -k 10 -k 11 -k 12 -k 13 -k 14 -k 15 -k 16 -k 17 -k 18 -k 19 -k 20 -k 20 -k 20 -n helperCog`;
+                    select -r $cog.ep[1] $cog.ep[3] $cog.ep[5] $cog.ep[7] $cog.ep[9] $cog.ep[11] $cog.ep[13] $cog.ep[15] $cog.ep[17] $cog.ep[19];
+                    scale -r -p 0cm 0cm 0cm 0.732056 0.732056 0.732056 ;
+                    select -cl;
+
+            '''},
+
+        'pointer':{
+            'ID':'pointer',
+            'type':'curve',
+            'd':3,
+            'p':[(0.0, 0.0, -0.0096), (-0.3169, 0.0, -0.4585), 
+                (-0.9507, 0.0, -1.3563), (-0.1329, 0.0, -1.2866), 
+                (0.0238, 0.0, -1.538), (-0.4602, 0.0, -2.3617), 
+                (-1.1307, 0.0, -3.2225), (-0.4428, 0.0, -2.5264), 
+                (-0.0223, 0.0, -2.031), (0.509, 0.0, -2.5497), 
+                (1.1194, 0.0, -3.2197), (0.4479, 0.0, -2.3495), 
+                (0.0007, 0.0, -1.5368), (0.0475, 0.0, -1.3052), 
+                (0.9731, 0.0, -1.3658), (0.3244, 0.0, -0.4617), 
+                (0.0, 0.0, -0.0096)],
+            'k':[0,0,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,14,14],
+            'n':'pointer_cntl'},
+
+        'aim':{
+            'ID':'aim',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, -2.0), (0.0, 0.0, 0.0), (0.0, 2.0, -1.0),
+                (0.0, -2.0, -1.0), (0.0, 0.0, 0.0), (-1.0, 0.0, -1.0), 
+                (1.0, 0.0, -1.0), (0.0, 0.0, 0.0)],
+            'k':list(range(8)),
+            'n':'aim_cntl'},
+
+        'aim2':{
+            'ID':'aim2',
+            'type':'curve',
+            'd':1,
+            'p':[(0.0, 0.0, -2.0), (0.0, 0.0, 0.0), (0.0, 1.0, -1.0), 
+                (0.0, -1.0, -1.0), (0.0, 0.0, 0.0), (-1.0, 0.0, -1.0), 
+                (1.0, 0.0, -1.0), (0.0, 0.0, 0.0)],
+            'k':list(range(8)),
+            'n':'aim2_cntl'},
+
+        'dumbell':{
+            'ID':'dumbell',
+            'type':'curve',
+            'd':1,
+            'p':[(-1.2075, 0.0254, 0.0), (-1.1235, 0.0254, 0.2028), 
+                (-0.9208, 0.0254, 0.2868), (-0.718, 0.0254, 0.2028), 
+                (-0.635, 0.0254, 0.0024), (0.6341, 0.0254, 0.0), 
+                (0.718, 0.0254, 0.2028), (0.9208, 0.0254, 0.2868), 
+                (1.1235, 0.0254, 0.2028), (1.2075, 0.0254, 0.0), 
+                (1.1235, 0.0254, -0.2028), (0.9208, 0.0254, -0.2868), 
+                (0.718, 0.0254, -0.2028), (0.6341, 0.0254, 0.0), 
+                (-0.635, 0.0254, 0.0024), (-0.718, 0.0254, -0.2028), 
+                (-0.9208, 0.0254, -0.2868), (-1.1235, 0.0254, -0.2028), 
+                (-1.2075, 0.0254, 0.0)],
+            'k':list(range(19)),
+            'n':'dumbell_cntl'}
+        }
+    return ControlLibraryDict
+
+##########################################################
+##########################################################
+#                       Registry                         #
+##########################################################
+##########################################################
+
+class ShapeRecord(object):
+    """Read-only definition of a control shape.
+        Points and knots are flat, read-only double arrays. Anything else the shape's command needs is in options.
+        Indexing with the dictionary keys of getDefaultControlDict ('n','d','p','k'...) still works.
+
+    Args:
+        key (str): shape name, used as the ID when the definition has none
+        data (dict): shape definition. Points may be (x,y,z) tuples or a flat double memoryview
+    """
+    __slots__ = ('ID','type','name','degree','points','knots','options')
+    __keys = {'ID':'ID', 'type':'type', 'n':'name', 'd':'degree'}
+
+    def __init__(self, key, data):
+        data = dict(data)
+        points = data.pop('p', ())
+        if not isinstance(points, memoryview):
+            points = memoryview(array('d', [value for point in points for value in point]).tobytes()).cast('d')
+        knots = data.pop('k', ())
+        if not isinstance(knots, memoryview):
+            knots = memoryview(array('d', knots).tobytes()).cast('d')
+        setter = super(ShapeRecord,self).__setattr__
+        setter('ID', data.pop('ID', key))
+        setter('type', data.pop('type'))
+        setter('name', data.pop('n', ''))
+        setter('degree', data.pop('d', None))
+        setter('points', points)
+        setter('knots', knots)
+        setter('options', MappingProxyType(dict((option, tuple(value) if isinstance(value, list) else value)
+                                                for option, value in data.items())))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError('ShapeRecord is read-only')
+
+    def __delattr__(self, attr):
+        raise AttributeError('ShapeRecord is read-only')
+
+    def __getitem__(self, key):
+        if key in self.__keys:
+            return getattr(self, self.__keys[key])
+        if key == 'p':
+            return self.getPoints()
+        if key == 'k':
+            return self.knots.tolist()
+        return self.options[key]
+
+    def __repr__(self):
+        return 'ShapeRecord({!r}, {!r})'.format(self.ID, self.type)
+
+    def getPoints(self):
+        """Points as a list of (x,y,z) tuples, ready for the curve command
+
+        Returns:
+            list: points
+        """
+        values = self.points.tolist()
+        return list(zip(values[0::3], values[1::3], values[2::3]))
+
+
+class ShapeRegistry(object):
+    """Read-only set of ShapeRecords by name, merged from one or more sources.
+        Later sources replace shapes of the same name. A shape's record is made the first time it is asked for.
+
+    Args:
+        *sources (dict | ShapeLibraryFile | ShapeRegistry): shape definitions laid out like getDefaultControlDict
+    """
+    def __init__(self, *sources):
+        super(ShapeRegistry,self).__init__()
+        self._sources = OrderedDict()
+        for source in sources:
+            for key in source:
+                self._sources[key] = source
+        self._records = {}
+
+    def __contains__(self, key):
+        return key in self._sources
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def get(self, key):
+        """Returns the record of a shape
+
+        Args:
+            key (str): shape name
+
+        Returns:
+            ShapeRecord: shape definition
+        """
+        record = self._records.get(key)
+        if record is None:
+            data = self._sources[key][key]
+            record = data if isinstance(data, ShapeRecord) else ShapeRecord(key, data)
+            self._records[key] = record
+        return record
+
+    def names(self):
+        return list(self._sources)
+
+
+def getShapeRegistry(paths=()):
+    """Returns the registry of the default shapes, with the shapes of any library files layered over them.
+        Registries are shared for the session and read again when one of their files changes.
+
+    Args:
+        paths (str | list, optional): shape library files, later files replace shapes of earlier ones. Defaults to ().
+
+    Returns:
+        ShapeRegistry: shared registry
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    key = tuple((os.path.abspath(path), os.path.getmtime(path)) for path in paths)
+    registry = __shapeRegistries.get(key)
+    if registry is None:
+        if key:
+            registry = ShapeRegistry(getShapeRegistry(), *[readLibrary(path) for path in paths])
+        else:
+            registry = ShapeRegistry(getDefaultControlDict())
+        __shapeRegistries[key] = registry
+    return registry
+
+
+def transformShapePoints(points, size=1.0, rotation=(0,0,0), offset=(0,0,0)):
+    """Scales, rotates then offsets shape points, as the relative xforms and makeIdentity of a made shape would
+
+    Args:
+        points (list | memoryview): flat or (N,3) points
+        size (float | list | tuple, optional): uniform or per axis scale. Defaults to 1.0.
+        rotation (tuple, optional): xyz rotation in degrees. Defaults to (0,0,0).
+        offset (tuple, optional): translation added last. Defaults to (0,0,0).
+
+    Returns:
+        list: (x,y,z) tuples
+    """
+    if isinstance(size,(int,float)):
+        size = (size,size,size)
+    matrix = vecArray.composeMatrices([offset],[rotation],[size])
+    points = vecArray.transformPoints(points, matrix)
+    if vecArray.HAS_NUMPY:
+        points = points.tolist()
+    return [tuple(point) for point in points]
+
+
+##########################################################
+##########################################################
+#                        Library                         #
+##########################################################
+##########################################################
+
 class ControlLibrary(object):
-    """Container class for Control Shapes
+    """Container class for Control Shapes. A view over a ShapeRegistry, the shared default one unless given another
 
     Args:
-        object (_type_): _description_
+        controlLib (str | list | dict | ShapeRegistry, optional): shape library files to layer over the defaults,
+            or shape definitions to use instead of them. Defaults to ''.
     """
     def __init__(self, controlLib=''):
         super(ControlLibrary,self).__init__()
         self.setControlLibrary(controlLib)
-        
-    
-    def getDefaultControlDict(self):
-        """
-        Dictionary pattern 'Shape Name': ['ID','type',d,p,k,n]
-        Default orientation is -X
-        #Stores the actual list of curves and their data
-        """
-        ControlLibraryDict = {
-            'nSphere':{
-                'ID':'nSphere',
-                'type':'nSphere',
-                'n':'nSphere_cntl',
-                'spans':2,
-                'sections':2,
-                'cch':1},
-            'triangle':{
-                'ID':'triangle',
-                'type':'curve',
-                'd':1,
-                'p':[(-1.03923,0,-1.8),(1.03923,0,-1.8),(0,0,0),(-1.03923,0,-1.8)],
-                'k':list(range(4)),
-                'n':"triangle_cntl"},
-
-            'square':{
-                'ID':'square',
-                'type':'curve',
-                'd':1,
-                'p':[(1,0,-1),(-1,0,-1),(-1,0,1),(1,0,1),(1,0,-1)],
-                'k':list(range(5)),
-                'n':'square_cntl'},
-
-            """'angle':{
-                'ID':'angle',
-                'type':'curve',
-                'd':1,
-                'p':[(-1,0,3),(1,0,-3),(1,0,1),(-3,0,-1),(-1,0,-1),(-1,0,3)],
-                'k':list(range(6)),
-                'n':'angle_cntl'},"""
-
-            'cross':{
-                'ID':'cross',
-                'type':'curve',
-                'd':1,
-                'p':[(0.4,0,-0.4),(0.4,0,-2),(-0.4,0,-2),(-0.4,0,-0.4),(-2,0,-0.4),(-2,0,0.4),
-                    (-0.4,0,0.4),(-0.4,0,2),(0.4,0,2),(0.4,0,0.4),(2,0,0.4),(2,0,-0.4),(0.4,0,-0.4)],
-                'k':list(range(13)),
-                'n':'cross_cntl'},
-
-            'crossFat':{
-                'ID':'crossFat',
-                'type':'curve',
-                'd':1,
-                'p':[(2,0,1),(2,0,-1),(1,0,-1),(1,0,-2),(-1,0,-2),(-1,0,-1),(-2,0,-1),(-2,0,1),
-                    (-1,0,1),(-1,0,2),(1,0,2),(1,0,1),(2,0,1)],
-                'k':list(range(13)),
-                'n':'fatCross_cntl'},
-
-            'circle':{
-                'ID':'circle',
-                'type':'circle',
-                'c':(0,0,0),
-                'nr':(0,1,0),
-                'sw':360,
-                'r':1,
-                'd':3,
-                'ut':0,
-                'tol':0.01,
-                's':8,
-                'ch':0,
-                'n':'circle_cntl'},
-
-            'arc270':{
-                'ID':'arc270',
-                'type':'curve',
-                'd':3,
-                'p':[(0.707107,0,0.707107),(0.570265,0,0.843948),(0.205819,0,1.040044),
-                    (-0.405223,0,0.978634),(-0.881027,0,0.588697),(-1.059487,0,0),
-                    (-0.881027,0,0.-0.588697),(-0.405223,0,-0.978634),
-                    (0.205819,0,-1.040044),(-.570265,0,-0.843948),(0.707107,0,-0.707107)],
-                'k':[0,0,0,1,2,3,4,5,6,7,8,8,8],
-                'n':'arc270_cntl'},
-
-            'arc180':{
-                'ID':'arc180',
-                'type':'circle',
-                'c':(0,0,0),
-                'nr':(0,1,0),
-                'sw':180,
-                'r':1,
-                'd':3,
-                'ut':0,
-                'tol':0.01,
-                's':8,
-                'ch':0,
-                'n':'arc180_cntl'},
-
-            'spiral':{
-                'ID':'spiral',
-                'type':'curve',
-                'd':3,
-                'p':[(0.474561,0,-1.241626),(0.171579,0,-1.214307),(-0.434384,0,-1.159672),
-                    (-1.124061,0,-0.419971),(-1.169741,0,0.305922),(-0.792507,0,1.018176),
-                    (-0.0412486,0,1.262687),(0.915809,0,1.006098),(1.258635,0,0.364883),
-                    (1.032378,0,-0.461231),(0.352527,0,-0.810017),(-0.451954,0,-0.43765),
-                    (-0.634527,0,0.208919),(-0.0751226,0,0.696326),(0.292338,0,0.414161),
-                    (0.476068,0,0.273078)],
-                'k':[0,0,0,1,2,3,4,5,6,7,8,9,10,11,12,13,13,13],
-                'n':'spiral_cntl'},
-
-            'pyramid12':{
-                'ID':'pyramid12',
-                'type':'curve',
-                'd':1,
-                'p':[(1, 0, 0), (0, 0, -1), (0, 1, 0), (1, 0, 0), (-1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, 0, -1), (0, 1, 0)],
-                'k':list(range(9)),
-                'n':'pyramid12_cntl'},
-
-            'pyramid':{
-                'ID':'pyramid',
-                'type':'curve',
-                'd':1,
-                'p':[(0, 0, 0), (-1, 1, -2), (-1, -1, -2), (0, 0, 0), (1, -1, -2), (1, 1, -2), (0, 0, 0), (-1, 1, -2), (1, 1, -2), (1, -1, -2), (-1, -1, -2)],
-                'k':list(range(11)),
-                'n':'pyrmid_cntl'},
-
-            'spear12':{
-                'ID':'spear12',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, -2.0), (-2.0, 0.0, 0.0), 
-                    (2.0, 0.0, 0.0), (0.0, 0.0, -2.0), 
-                    (0.0, -2.0, 0.0), (0.0, 2.0, 0.0), (0.0, 0.0, -2.0)],
-                'k':list(range(7)),
-                'n':'spear12_cntl'},
-
-            'spear':{
-                'ID':'spear',
-                'type':'curve',
-                'd':1,
-                'p':[(0,2,0),(0,0,2),(0,-2,0),(0,0,-2),(0,2,0),(0,-2,0),(0,0,0),(0,0,2),(0,0,-2),
-                    (2,0,0),(0,0,2),(-2,0,0),(0,0,-2),(0,0,2),(0,0,0),(-2,0,0),(2,0,0)],
-                'k':list(range(17)),
-                'n':'spear_cntl'},
-
-            'cube':{
-                'ID':'cube',
-                'type':'curve',
-                'd':1,
-                'p':[(0.5,0.5,0.5),(0.5,0.5,-0.5),(-0.5,0.5,-0.5),(-0.5,-0.5,-0.5),
-                    (0.5,-0.5,-0.5),(0.5,0.5,-0.5),(-0.5,0.5,-0.5),(-0.5,0.5,0.5),(0.5,0.5,0.5),
-                    (0.5,-0.5,0.5),(0.5,-0.5,-0.5),(-0.5,-0.5,-0.5),(-0.5,-0.5,0.5),(0.5,-0.5,0.5),
-                    (-0.5,-0.5,0.5),(-0.5,0.5,0.5)],
-                'k':list(range(16)),
-                'n':'cube_cntl'},
-
-            'hexagon':{
-                'ID':'hexagon',
-                'type':'curve',
-                'd':1,
-                'p':[(-0.5,1,0.866025),(0.5,1,0.866025),(0.5,-1,0.866025),(1,-1,0),(1,1,0),
-                    (0.5,1,-0.866025),(0.5,-1,-0.866025),(-0.5,-1,-0.866026),(-0.5,1,-0.866026),
-                    (-1,1,-1.5885e-007),(-1,-1,-1.5885e-007),(-0.5,-1,0.866025),(-0.5,1,0.866025),
-                    (-1,1,-1.5885e-007),(-0.5,1,-0.866026),(0.5,1,-0.866025),(1,1,0),
-                    (0.5,1,0.866025),(0.5,-1,0.866025),(-0.5,-1,0.866025),(-1,-1,-1.5885e-007),
-                    (-0.5,-1,-0.866026),(0.5,-1,-0.866025),(1,-1,0)],
-                'k':list(range(24)),
-                'n':'hexagon_cntl'},
-
-            'rombus':{
-                'ID':'rombus',
-                'type':'curve',
-                'd':1,
-                'p':[(0,1,0),(1,0,0),(0,0,1),(-1,0,0),(0,0,-1),(0,1,0),(0,0,1),
-                    (0,-1,0),(0,0,-1),(1,0,0),(0,1,0),(-1,0,0),(0,-1,0),(1,0,0)],
-                'k':list(range(14)),
-                'n':'rombus_cntl'},
-
-            'rombus2':{
-                'ID':'rombus2',
-                'type':'curve',
-                'd':1,
-                'p':[(0,0,2),(0,1,0),(0,0,-2),(0,-1,0),(-1,0,0),(0,1,0),(1,0,0),(0,-1,0),
-                    (0,0,2),(1,0,0),(0,0,-2),(-1,0,0),(0,0,2)],
-                'k':list(range(13)),
-                'n':'rombus2_cntl'},
-
-            'rombus3':{
-                'ID':'rombus3',
-                'type':'curve',
-                'd':1,
-                'p':[(0,0,2),(-0.707107,0.707107,0),(0,0,-2),(0.707107,0.707107,0),
-                    (0,0,2),(0.707107,-0.707107,0),(0,0,-2),(-0.707107,-0.707107,0),
-                    (0.707107,-0.707107,0),(0.707107,0.707107,0),(-0.707107,0.707107,0),
-                    (-0.707107,-0.707107,0),(0,0,2)],
-                'k':list(range(13)),
-                'n':'rombus3_cntl'},
-
-            'dirSingleThin':{
-                'ID':'dirSingleThin',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, -2.0), (0.0, 0.0, 0.0), (1.0, 0.0, -1.0), 
-                    (0.0, 0.0, 0.0), (-1.0, 0.0, -1.0)],
-                'k':list(range(5)),
-                'n':'dirSingleThin_cntl'},
-
-            'dirSingle':{
-                'ID':'dirSingle',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, 0.0), (1.0, 0.0, -1.33), (0.33, 0.0, -1.33), 
-                    (0.33, 0.0, -2.33), (-0.33, 0.0, -2.33), (-0.33, 0.0, -1.33), 
-                    (-0.99, 0.0, -1.33), (0.0, 0.0, 0.0)],
-                'k':list(range(8)),
-                'n':'dirSingle_cntl'},
-
-            'dirSingleFat':{
-                'ID':'dirSingleFat',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, 0.0), (0.66, 0.0, -0.99), (0.33, 0.0, -0.99), 
-                    (0.33, 0.0, -1.66), (-0.33, 0.0, -1.66), (-0.33, 0.0, -0.99), 
-                    (-0.66, 0.0, -0.99), (0.0, 0.0, 0.0)],
-                'k':list(range(8)),
-                'n':'dirSingleFat_cntl'},
-
-            'dirDoubleThin':{
-                'ID':'dirDoubleThin',
-                'type':'curve',
-                'd':1,
-                'p':[(1,0,-1),(2,0,0),(1,0,1),
-                    (2,0,0),(-2,0,0),(-1,0,1),
-                    (-2,0,0),(-1,0,-1)],
-                'k':list(range(8)),
-                'n':'dirDoubleThin_cntl'},
-
-            'dirDouble':{
-                'ID':'dirDouble',
-                'type':'curve',
-                'd':1,
-                'p':[(-2.31,0,0),(-0.99,0,0.99),(-0.99,0,0.33),(0.99,0,0.33),
-                    (0.99,0,0.99),(2.31,0,0),(0.99,0,-0.99),(0.99,0,-0.33),
-                    (-0.99,0,-0.33),(-0.99,0,-0.99),(-2.31,0,0)],
-                'k':list(range(11)),
-                'n':'dirDouble_cntl'},
-
-            'dirDoubleFat':{
-                'ID':'dirDoubleFat',
-                'type':'curve',
-                'd':1,
-                'p':[(-1.35,0,0),(-0.36,0,0.66),(-0.36,0,0.33),(0.36,0,0.33),
-                    (0.36,0,0.66),(1.35,0,0),(0.36,0,-0.66),(0.36,0,-0.33),
-                    (-0.36,0,-0.33),(-0.36,0,-0.66),(-1.35,0,0)],
-                'k':list(range(11)),
-                'n':'dirDoubleFat_cntl'},
-
-            'dirFourThin':{
-                'ID':'dirFourThin',
-                'type':'curve',
-                'd':1,
-                'p':[(1.25,0,-0.5),(1.75,0,0),(1.25,0,0.5),(1.75,0,0),(-1.75,0,0),
-                    (-1.25,0,-0.5),(-1.75,0,0),(-1.25,0,0.5),(-1.75,0,0),(0,0,0),(0,0,1.75),
-                    (-0.5,0,1.25),(0,0,1.75),(0.5,0,1.25),(0,0,1.75),(0,0,-1.75),(0.5,0,-1.25),
-                    (0,0,-1.75),(-0.5,0,-1.25),(0,0,-1.75)],
-                'k':list(range(20)),
-                'n':'dirFourThin_cntl'},
-
-            'dirFour':{
-                'ID':'dirFour',
-                'type':'curve',
-                'd':1,
-                'p':[(0,0,-1.98),(-0.495,0,-1.32),(-0.165,0,-1.32),(-0.165,0,-0.165),
-                    (-1.32,0,-0.165),(-1.32,0,-0.495),(-1.98,0,0),(-1.32,0,0.495),(-1.32,0,0.165),
-                    (-0.165,0,0.165),(-0.165,0,1.32),(-0.495,0,1.32),(0,0,1.98),(0.495,0,1.32),
-                    (0.165,0,1.32),(0.165,0,0.165),(1.32,0,0.165),(1.32,0,0.495),(1.98,0,0),
-                    (1.32,0,-0.495),(1.32,0,-0.165),(0.165,0,-0.165),(0.165,0,-1.32),
-                    (0.495,0,-1.32),(0,0,-1.98)],
-                'k':list(range(25)),
-                'n':'dirFour_cntl'},
-
-            'dirFourFat':{
-                'ID':'dirFourFat',
-                'type':'curve',
-                'd':1,
-                'p':[(0,0,-1.1025),(-0.33,0,-0.6075),(-0.165,0,-0.6075),(-0.165,0,-0.165),
-                    (-0.6075,0,-0.165),(-0.6075,0,-0.33),(-1.1025,0,0),(-0.6075,0,0.33),
-                    (-0.6075,0,0.165),(-0.165,0,0.165),(-0.165,0,0.6075),(-0.33,0,0.6075),
-                    (0,0,1.1025),(0.33,0,0.6075),(0.165,0,0.6075),(0.165,0,0.165),
-                    (0.6075,0,0.165),(0.6075,0,0.33),(1.1025,0,0),(0.6075,0,-0.33),
-                    (0.6075,0,-0.165),(0.165,0,-0.165),(0.165,0,-0.6075),(0.33,0,-0.6075),
-                    (0,0,-1.1025)],
-                'k':list(range(25)),
-                'n':'dirFourFat_cntl'},
-
-            'dirEight':{
-                'ID':'dirEight',
-                'type':'curve',
-                'd':1,
-                'p':[(-1.8975,0,0),(-1.4025,0,0.37125),(-1.4025,0,0.12375),
-                    (-0.380966,0,0.157801),(-1.079222,0,0.904213),(-1.254231,0,0.729204),
-                    (-1.341735,0,1.341735),(-0.729204,0,1.254231),(-0.904213,0,1.079222),
-                    (-0.157801,0,0.380966),(-0.12375,0,1.4025),(-0.37125,0,1.4025),(0,0,1.8975),
-                    (0.37125,0,1.4025),(0.12375,0,1.4025),(0.157801,0,0.380966),
-                    (0.904213,0,1.079222),(0.729204,0,1.254231),(1.341735,0,1.341735),
-                    (1.254231,0,0.729204),(1.079222,0,0.904213),(0.380966,0,0.157801),
-                    (1.4025,0,0.12375),(1.4025,0,0.37125),(1.8975,0,0),(1.4025,0,-0.37125),
-                    (1.4025,0,-0.12375),(0.380966,0,-0.157801),(1.079222,0,-0.904213),
-                    (1.254231,0,-0.729204),(1.341735,0,-1.341735),(0.729204,0,-1.254231),
-                    (0.904213,0,-1.079222),(0.157801,0,-0.380966),(0.12375,0,-1.4025),
-                    (0.37125,0,-1.4025),(0,0,-1.8975),(-0.37125,0,-1.4025),(-0.12375,0,-1.4025),
-                    (-0.157801,0,-0.380966),(-0.904213,0,-1.079222),(-0.729204,0,-1.254231),
-                    (-1.341735,0,-1.341735),(-1.254231,0,-0.729204),(-1.079222,0,-0.904213),
-                    (-0.380966,0,-0.157801),(-1.4025,0,-0.12375),(-1.4025,0,-0.37125),(-1.8975,0,0)],
-                'k':list(range(49)),
-                'n':'dirEight_cntl'},
-
-            'cone':{
-                'ID':'cone',
-                'type':'curve',
-                'd':1,
-                'p':[(0.866, 0.5, -2.0), (0.866, -0.5, -2.0), (0.0, 0.0, 0.0), 
-                    (0.866, 0.5, -2.0), (0.0, 1.0, -2.0), (0.0, 0.0, 0.0), 
-                    (-0.866, 0.5, -2.0), (0.0, 1.0, -2.0), (0.0, 0.0, 0.0), 
-                    (-0.866, -0.5, -2.0), (-0.866, 0.5, -2.0), (0.0, 0.0, 0.0), 
-                    (0.0, -1.0, -2.0), (-0.866, -0.5, -2.0), (0.0, 0.0, 0.0), 
-                    (0.866, -0.5, -2.0), (0.0, -1.0, -2.0)],
-                'k':list(range(17)),
-                'n':'cone_cntl'},
-
-            'rot90Thin':{
-                'ID':'rot90Thin',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, -1.026), (-0.3926, 0.0, -0.948), 
-                    (-0.7255, 0.0, -0.7254), (-0.9479, 0.0, -0.393), 
-                    (-1.0, 0.0, -0.1301), (-1.0014, 0.0, 0.0107), 
-                    (-0.5442, 0.0, -0.3395), (-1.0014, 0.0, 0.0107), 
-                    (-1.3517, 0.0, -0.4465)],
-                'k':list(range(9)),
-                'n':'rot90Thin_cntl'},
-
-            'rot90':{
-                'ID':'rot90',
-                'type':'curve',
-                'd':1,
-                'p':[(-1.0158, 0.0, -0.251), (-0.9797, 0.0, -0.7618), 
-                    (-0.9305, 0.0, -0.4865), (-0.8864, 0.0, -0.5707), 
-                    (-0.7748, 0.0, -0.7279), (-0.5507, 0.0, -0.9093), 
-                    (-0.2859, 0.0, -1.0239), (0.0, 0.0, -1.0631), 
-                    (0.0, 0.0, -0.9618), (-0.2586, 0.0, -0.9264), 
-                    (-0.4982, 0.0, -0.8227), (-0.701, 0.0, -0.6586), 
-                    (-0.802, 0.0, -0.5164), (-0.8419, 0.0, -0.4402), 
-                    (-0.5677, 0.0, -0.4989), (-1.0158, 0.0, -0.251)],
-                'k':list(range(16)),
-                'n':'rot90_cntl'},
-
-            'rot90Fat':{
-                'ID':'rot90Fat',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, -0.9234), (0.0, 0.0, -1.1287), (-0.4319, 0.0, -1.0427), 
-                    (-0.798, 0.0, -0.798), (-0.9462, 0.0, -0.5609), (-1.0363, 0.0, -0.9759), 
-                    (-1.0965, 0.0, -0.1246), (-0.3497, 0.0, -0.5377), (-0.7887, 0.0, -0.4408), 
-                    (-0.653, 0.0, -0.6528), (-0.3534, 0.0, -0.8532), (0.0, 0.0, -0.9234)],
-                'k':list(range(12)),
-                'n':'rot90Fat_cntl'},
-
-            'rot180Thin':{
-                'ID':'rot180Thin',
-                'type':'curve',
-                'd':1,
-                'p':[(1.3517, 0.0, -0.4465), (1.0014, 0.0, 0.0107), (0.5442, 0.0, -0.3395), 
-                    (1.0014, 0.0, 0.0107), (1.0, 0.0, -0.1301), (0.9479, 0.0, -0.393), 
-                    (0.7255, 0.0, -0.7254), (0.3926, 0.0, -0.948), (0.0, 0.0, -1.026), 
-                    (-0.3926, 0.0, -0.948), (-0.7255, 0.0, -0.7254), (-0.9479, 0.0, -0.393), 
-                    (-1.0, 0.0, -0.1301), (-1.0, 0.0, 0.0), (-0.5442, 0.0, -0.3395), 
-                    (-1.0, 0.0, 0.0), (-1.3517, 0.0, -0.4465)],
-                'k':list(range(17)),
-                'n':'rot180Thin_cntl'},
-
-            'rot180':{
-                'ID':'rot180',
-                'type':'curve',
-                'd':1,
-                'p':[(1.0158, 0.0, -0.251), (0.9797, 0.0, -0.7618), (0.9305, 0.0, -0.4865), 
-                    (0.8864, 0.0, -0.5707), (0.7748, 0.0, -0.7279), (0.5507, 0.0, -0.9093), 
-                    (0.2859, 0.0, -1.0239), (0.0, 0.0, -1.0631), (-0.2859, 0.0, -1.0239), 
-                    (-0.5507, 0.0, -0.9093), (-0.7748, 0.0, -0.7279), (-0.8864, 0.0, -0.5707), 
-                    (-0.9305, 0.0, -0.4865), (-0.9797, 0.0, -0.7618), (-1.0158, 0.0, -0.251), 
-                    (-0.5677, 0.0, -0.4989), (-0.8419, 0.0, -0.4402), (-0.802, 0.0, -0.5164), 
-                    (-0.701, 0.0, -0.6586), (-0.4982, 0.0, -0.8227), (-0.2586, 0.0, -0.9264), 
-                    (0.0, 0.0, -0.9618), (0.2586, 0.0, -0.9264), (0.4982, 0.0, -0.8227), 
-                    (0.701, 0.0, -0.6586), (0.802, 0.0, -0.5164), (0.8419, 0.0, -0.4402), 
-                    (0.5677, 0.0, -0.4989), (1.0158, 0.0, -0.251)],
-                'k':list(range(29)),
-                'n':'rot180_cntl'},
-
-            'rot180Fat':{
-                'ID':'rot180Fat',
-                'type':'curve',
-                'd':1,
-                'p':[(1.0965, 0.0, -0.1246), (1.0363, 0.0, -0.9759), (0.9443, 0.0, -0.5591), 
-                    (0.798, 0.0, -0.798), (0.4319, 0.0, -1.0427), (0.0, 0.0, -1.1287), 
-                    (-0.4319, 0.0, -1.0427), (-0.798, 0.0, -0.798), (-0.9462, 0.0, -0.5609), 
-                    (-1.0363, 0.0, -0.9759), (-1.0965, 0.0, -0.1246), (-0.3497, 0.0, -0.5377), 
-                    (-0.7887, 0.0, -0.4408), (-0.653, 0.0, -0.6528), (-0.3534, 0.0, -0.8532), 
-                    (0.0, 0.0, -0.9234), (0.3534, 0.0, -0.8532), (0.653, 0.0, -0.6528), 
-                    (0.7856, 0.0, -0.4392), (0.3497, 0.0, -0.5377), (1.0965, 0.0, -0.1246)],
-                'k':list(range(21)),
-                'n':'rot180Fat_cntl'},
-
-            'transform':{
-            'ID':'transform',
-            'type':'special',
-            'n':'transform_cntl',
-            'mel':'''
-                $circleHelper = `circle -c 0 0 0 -nr 0 1 0 -sw 360 -r 1.5 -d 3 -ut 0 -tol 0.01 -s 8 -ch 0 -n "controller1"`;
-                string $arrows[] ;
-                $arrows[0] = `curve -d 1 -p 1.75625 0 0.115973 -p 1.75625 0 -0.170979 -p 2.114939 0 -0.170979 -p 2.114939 0 -0.314454 -p 2.473628 0 -0.0275029 -p 2.114939 0 0.259448 -p 2.114939 0 0.115973 -p 1.75625 0 0.115973 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow1` ;
-                    setAttr ($arrows[0] + ".overrideEnabled") 1 ;
-                    setAttr ($arrows[0] + ".overrideDisplayType") 2 ;
-                    pickWalk -d down ; TemplateObject ;
-                $arrows[1] = `curve -d 1 -p 0.143476 0 -1.783753 -p 0.143476 0 -2.142442 -p 0.286951 0 -2.142442 -p 0 0 -2.501131 -p -0.286951 0 -2.142442 -p -0.143476 0 -2.142442 -p -0.143476 0 -1.783753 -p 0.143476 0 -1.783753 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow2` ;
-                    setAttr ($arrows[1] + ".overrideEnabled") 1 ;
-                    setAttr ($arrows[1] + ".overrideDisplayType") 2 ;
-                    pickWalk -d down ; TemplateObject ;
-                $arrows[2] = `curve -d 1 -p -1.75625 0 -0.170979 -p -2.114939 0 -0.170979 -p -2.114939 0 -0.314454 -p -2.473628 0 -0.0275029 -p -2.114939 0 0.259448 -p -2.114939 0 0.115973 -p -1.75625 0 0.115973 -p -1.75625 0 -0.170979 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow3`;
-                    setAttr ($arrows[2] + ".overrideEnabled") 1 ;
-                    setAttr ($arrows[2] + ".overrideDisplayType") 2 ;
-                    pickWalk -d down ; TemplateObject ;
-                $arrows[3] = `curve -d 1 -p -0.143476 0 1.728747 -p -0.143476 0 2.087436 -p -0.286951 0 2.087436 -p 0 0 2.446125 -p 0.286951 0 2.087436 -p 0.143476 0 2.087436 -p 0.143476 0 1.728747 -p -0.143476 0 1.728747 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -n helperArrow4`;
-                    setAttr ($arrows[3] + ".overrideEnabled") 1 ;
-                    setAttr ($arrows[3] + ".overrideDisplayType") 2 ;
-                    pickWalk -d down ; TemplateObject ;
-                string $arrowGRP = `group -n helperArrowsGRP -p $circleHelper $arrows[0] $arrows[1] $arrows[2] $arrows[3]`;
-                    select -r $circleHelper ;
-                '''},
-
-            'arrowsOnBall':{
-                'ID':'arrowsOnBall',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, -1.0016, -0.35), (-0.3366, -0.7512, -0.6779), 
-                    (-0.096, -0.7512, -0.6779), (-0.096, -0.5008, -0.8505), 
-                    (-0.096, -0.0988, -0.954), (-0.5008, -0.0988, -0.8505), 
-                    (-0.7512, -0.0988, -0.6779), (-0.7512, -0.3366, -0.6779), 
-                    (-1.0016, 0.0, -0.35), (-0.7512, 0.3366, -0.6779), 
-                    (-0.7512, 0.0988, -0.6779), (-0.5008, 0.0988, -0.8505), 
-                    (-0.096, 0.0988, -0.954), (-0.096, 0.5008, -0.8505), 
-                    (-0.096, 0.7512, -0.6779), (-0.3366, 0.7512, -0.6779), 
-                    (0.0, 1.0016, -0.35), (0.3366, 0.7512, -0.6779), 
-                    (0.096, 0.7512, -0.6779), (0.096, 0.5008, -0.8505), 
-                    (0.096, 0.0988, -0.954), (0.5008, 0.0988, -0.8505), 
-                    (0.7512, 0.0988, -0.6779), (0.7512, 0.3366, -0.6779), 
-                    (1.0016, 0.0, -0.35), (0.7512, -0.3366, -0.6779), 
-                    (0.7512, -0.0988, -0.6779), (0.5008, -0.0988, -0.8505), 
-                    (0.096, -0.0988, -0.954), (0.096, -0.5008, -0.8505), 
-                    (0.096, -0.7512, -0.6779), (0.3366, -0.7512, -0.6779), 
-                    (0.0, -1.0016, -0.35)],
-                'k':list(range(33)),
-                'n':'arrowsOnBall_cntl'},
-
-            'sun':{
-                'ID':'sun',
-                'type':'special',
-                'n':'sun_cntl',
-                'mel':
-                '''
-                    string $CONTROLLER1[] = `circle -c 0 0 0 -nr 0 1 0 -sw 360 -r 1 -d 3 -ut 0 -tol 0.01 -s 16 -ch 1 -n controller1` ;
-                    select -r ($CONTROLLER1[0] + ".cv[0]") ($CONTROLLER1[0] + ".cv[2]") ($CONTROLLER1[0] + ".cv[4]")($CONTROLLER1[0] + ".cv[6]")($CONTROLLER1[0] + ".cv[8]")($CONTROLLER1[0] + ".cv[10]")($CONTROLLER1[0] + ".cv[12]") ($CONTROLLER1[0] + ".cv[14]") ;
-                    string $CONTROLCLUSTER[] = `cluster -relative -envelope 1` ;
-                    setAttr ($CONTROLCLUSTER[0] + "Handle.scale") 0.5 0.5 0.5 ;
-                    string $CONTROLLER2[] = `circle -c 0 0 0 -nr 0 1 0 -sw 360 -r 0.25 -d 3 -ut 0 -tol 0.01 -s 8 -ch 1 -n controller1` ;
-                    select -r $CONTROLLER2[0] $CONTROLLER1[0] ; parent ; pickWalk -d up ; DeleteHistory ;
-                '''},
-                'pin':{
-                'ID':'pin',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), 
-                    (1.0, 0.0, -0.5), (0.5, 0.0, -0.5), 
-                    (0.5, 0.0, -1.5), (1.0, 0.0, -1.5), (1.0, 0.0, -2.5), 
-                    (-1.0, 0.0, -2.5), (-1.0, 0.0, -1.5), (-0.5, 0.0, -1.5), 
-                    (-0.5, 0.0, -0.5), (-1.0, 0.0, -0.5), (-1.0, 0.0, 0.0), 
-                    (0.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 1.0, -0.5), (0.0, 0.5, -0.5), 
-                    (0.0, 0.5, -1.5), (0.0, 1.0, -1.5), (0.0, 1.0, -2.5), (0.0, -1.0, -2.5), 
-                    (0.0, -1.0, -1.5), (0.0, -0.5, -1.5), (0.0, -0.5, -0.5), (0.0, -1.0, -0.5), 
-                    (0.0, -1.0, 0.0), (0.0, 0.0, 0.0)],
-                'k':list(range(27)),
-                'n':'pin_cntl'},
-
-            'jack':{
-                'ID':'jack',
-                'type':'curve',
-                'd':1,
-                'p':[(0,0,0),(0.75,0,0),(1,0.25,0),(1.25,0,0),(1,-0.25,0),(0.75,0,0),
-                    (1,0,0.25),(1.25,0,0),(1,0,-0.25),(1,0.25,0),(1,0,0.25),(1,-0.25,0),
-                    (1,0,-0.25),(0.75,0,0),(0,0,0),(-0.75,0,0),(-1,0.25,0),(-1.25,0,0),
-                    (-1,-0.25,0),(-0.75,0,0),(-1,0,0.25),(-1.25,0,0),(-1,0,-0.25),
-                    (-1,0.25,0),(-1,0,0.25),(-1,-0.25,0),(-1,0,-0.25),(-0.75,0,0),(0,0,0),
-                    (0,0.75,0),(0,1,-0.25),(0,1.25,0),(0,1,0.25),(0,0.75,0),(-0.25,1,0),
-                    (0,1.25,0),(0.25,1,0),(0,1,0.25),(-0.25,1,0),(0,1,-0.25),(0.25,1,0),
-                    (0,0.75,0),(0,0,0),(0,-0.75,0),(0,-1,-0.25),(0,-1.25,0),(0,-1,0.25),
-                    (0,-0.75,0),(-0.25,-1,0),(0,-1.25,0),(0.25,-1,0),(0,-1,-0.25),
-                    (-0.25,-1,0),(0,-1,0.25),(0.25,-1,0),(0,-0.75,0),(0,0,0),(0,0,-0.75),
-                    (0,0.25,-1),(0,0,-1.25),(0,-0.25,-1),(0,0,-0.75),(-0.25,0,-1),
-                    (0,0,-1.25),(0.25,0,-1),(0,0.25,-1),(-0.25,0,-1),(0,-0.25,-1),
-                    (0.25,0,-1),(0,0,-0.75),(0,0,0),(0,0,0.75),(0,0.25,1),(0,0,1.25),
-                    (0,-0.25,1),(0,0,0.75),(-0.25,0,1),(0,0,1.25),(0.25,0,1),(0,0.25,1),
-                    (-0.25,0,1),(0,-0.25,1),(0.25,0,1),(0,0,0.75)],
-                'k':list(range(84)),
-                'n':'jack_cntl'},
-
-            'footprint':{
-                'ID':'footprint',
-                'type':'curve',
-                'd':1,
-                'p':[(1.1,0,-0.08),(.922,0,0.4),(0.62,0,0.514),(-0.03,0,0.412),
-                    (-0.552,0,0.863),(-1.162,0,0.921),(-1.67,0,0.775),(-2,0,0.383),
-                    (-2.33,0,-0.132),(-2.3,0,-0.55),(-1.7,0,-0.655),(-0.64,0,-0.575),
-                    (-0.1,0,-0.364),(0.4,0,-0.53),(0.842,0,-0.466),(1.12,0,-0.08)],
-                'k':list(range(16)),
-                'n':'footprint_cntl'},
-
-            'hand':{
-                'ID':'hand',
-                'type':'special',
-                'n':'hand_cntl',
-                'mel':
-                '''
-                    string $CONTROLLERS[] ;
-                    $CONTROLLERS[0] = `curve -d 1 -p -0.718223 0 -0.925311 -p -0.718223 0 0.462656 -p -0.462656 0 0.925311 -p 0 0 0.925311 -p 0.170548 0 0.873409 -p 0.341096 0 0.925311 -p 0.925311 0 0.925311 -p 0.925311 0 0 -p 0.718223 0 -0.462656 -p 0.718223 0 -0.925311 -p 0.457051 0 -1.156639 -p -0.462656 0 -1.156639 -p -0.718223 0 -0.925311 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -k 8 -k 9 -k 10 -k 11 -k 12 -n "controller1"` ;
-                    $CONTROLLERS[1] = `curve -d 1 -p -0.718223 0 -0.925311 -p -0.718223 0 -2.544605 -p -0.457051 0 -2.544605 -p -0.462656 0 -1.156639 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
-                    $CONTROLLERS[2] = `curve -d 1 -p -0.326465 0 -1.156639 -p -0.326465 0 -2.775933 -p -0.065293 0 -2.775933 -p -0.065293 0 -1.156639 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
-                    $CONTROLLERS[3] = `curve -d 1 -p 0.065293 0 -1.156639 -p 0.065293 0 -3.007261 -p 0.326465 0 -3.007261 -p 0.326465 0 -1.156639 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
-                    $CONTROLLERS[4] = `curve -d 1 -p 0.457051 0 -1.156639 -p 0.457051 0 -2.775933 -p 0.718223 0 -2.775933 -p 0.718223 0 -0.925311 -k 0 -k 1 -k 2 -k 3 -n "controller1"` ;
-                    $CONTROLLERS[5] = `curve -d 1 -p 0.925311 0 0 -p 1.156639 0 -0.231328 -p 1.387967 0 -0.693983 -p 1.619294 0 -0.462656 -p 1.387967 0 0.231328 -p 0.925311 0 0.925311 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -n "controller1"` ;
-                    select -r $CONTROLLERS ;
-                    select -d $CONTROLLERS[0] ;
-                    select -add $CONTROLLERS[0] ; parent ;
-                    select -d $CONTROLLERS[0] ;
-                    for ($ELEMENT in `ls -sl`)
-                    {
-                    setAttr -lock true ($ELEMENT + ".t") ;
-                    setAttr -lock true ($ELEMENT + ".r") ;
-                    setAttr -lock true ($ELEMENT + ".s") ;
-                    setAttr -lock true ($ELEMENT + ".v") ;
-                    setAttr -e -k false ($ELEMENT + ".tx") ;
-                    setAttr -e -k false ($ELEMENT + ".ty") ;
-                    setAttr -e -k false ($ELEMENT + ".tz") ;
-                    setAttr -e -k false ($ELEMENT + ".rx") ;
-                    setAttr -e -k false ($ELEMENT + ".ry") ;
-                    setAttr -e -k false ($ELEMENT + ".rz") ;
-                    setAttr -e -k false ($ELEMENT + ".sx") ;
-                    setAttr -e -k false ($ELEMENT + ".sy") ;
-                    setAttr -e -k false ($ELEMENT + ".sz") ;
-                    setAttr -e -k false ($ELEMENT + ".v") ;
-                    } ;
-                    select -r $CONTROLLERS[0] ;
-                '''},
-
-            'nail':{
-                'ID':'nail',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, 0.0), (0.0, 0.0, -1.0), (-0.35, 0.0, -1.146), 
-                    (-0.5, 0.0, -1.5), (-0.35, 0.0, -1.85), (0.0, 0.0, -2.0), 
-                    (0.35, 0.0, -1.85), (0.5, 0.0, -1.5), (0.35, 0.0, -1.146), 
-                    (0.0, 0.0, -1.0), (-0.35, 0.0, -1.146), (0.35, 0.0, -1.85), 
-                    (0.0, 0.0, -2.0), (-0.35, 0.0, -1.85), (0.35, 0.0, -1.146)],
-                'k':list(range(15)),
-                'n':'nail_cntl'},
-
-            'nail2':{
-                'ID':'nail2',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0,0.0,0.0),(-1.0,0.0,0.0),(-1.146,0.0,-0.35),
-                    (-1.5,0.0,-0.5),(-1.85,0.0,-0.35),(-2.0,0.0,0.0),
-                    (-1.85,0.0,0.35),(-1.5,0.0,0.5),(-1.146,0.0,0.35),
-                    (-1.0,0.0,0.0),(-1.146,0.0,0.35),(-1.85,0.0,-0.35),
-                    (-1.5,0.0,-0.5),(-1.146,0.0,-0.35),(-1.85,0.0,0.35),
-                    (-1.5,0.0,0.5),(-1.146,0.0,0.35),(-1.0,0.0,0.0),
-                    (0.0,0.0,0.0),(1.0,0.0,0.0),(1.146,0.0,-0.35),
-                    (1.5,0.0,-0.5),(1.85,0.0,-0.35),(2.0,0.0,0.0),
-                    (1.85,0.0,0.35),(1.5,0.0,0.5),(1.146,0.0,0.35),
-                    (1.0,0.0,0.0),(1.146,0.0,0.35),(1.85,0.0,-0.35),
-                    (1.5,0.0,-0.5),(1.146,0.0,-0.35),(1.85,0.0,0.35)],
-                'k':list(range(33)),
-                'n':'nail2_cntl'},
-
-            'nail4':{
-                'ID':'nail4',
-                'type':'curve',
-                'd':1,
-                'p':[(-1.0, 0.0, 0.0),(-1.146, 0.0, -0.35),(-1.5, 0.0, -0.5),
-                    (-1.85, 0.0, -0.35),(-2.0, 0.0, 0.0),(-1.85, 0.0, 0.35),
-                    (-1.5, 0.0, 0.5),(-1.146, 0.0, 0.35),(-1.0, 0.0, 0.0),
-                    (-1.146, 0.0, 0.35),(-1.85, 0.0, -0.35),(-2.0, 0.0, 0.0),
-                    (-1.85, 0.0, 0.35),(-1.146, 0.0, -0.35),(-1.0, 0.0, 0.0),
-                    (0.0, 0.0, 0.0),(1.0, 0.0, 0.0),(1.146, 0.0, 0.35),(1.5, 0.0, 0.5),
-                    (1.85, 0.0, 0.35),(2.0, 0.0, 0.0),(1.85, 0.0, -0.35),(1.5, 0.0, -0.5),
-                    (1.146, 0.0, -0.35),(1.0, 0.0, 0.0),(1.146, 0.0, 0.35),
-                    (1.85, 0.0, -0.35),(2.0, 0.0, 0.0),(1.85, 0.0, 0.35),
-                    (1.146, 0.0, -0.35),(1.0, 0.0, 0.0),(0.0, 0.0, 0.0),(0.0, 0.0, 1.0),
-                    (-0.35, 0.0, 1.146),(-0.5, 0.0, 1.5),(-0.35, 0.0, 1.85),(0.0, 0.0, 2.0),
-                    (0.35, 0.0, 1.85),(0.5, 0.0, 1.5),(0.35, 0.0, 1.146),(0.0, 0.0, 1.0),
-                    (0.35, 0.0, 1.146),(-0.35, 0.0, 1.85),(0.0, 0.0, 2.0),(0.35, 0.0, 1.85),
-                    (-0.35, 0.0, 1.146),(0.0, 0.0, 1.0),(0.0, 0.0, -1.0),
-                    (-0.35, 0.0, -1.146),(-0.5, 0.0, -1.5),(-0.35, 0.0, -1.85),
-                    (0.0, 0.0, -2.0),(0.35, 0.0, -1.85),(0.5, 0.0, -1.5),
-                    (0.35, 0.0, -1.146),(0.0, 0.0, -1.0),(0.35, 0.0, -1.146),
-                    (-0.35, 0.0, -1.85),(0.0, 0.0, -2.0),(0.35, 0.0, -1.85),
-                    (-0.35, 0.0, -1.146)],
-                'k':list(range(61)),
-                'n':'nail4_cntl'},
-
-            'sphere':{
-                'ID':'sphere',
-                'type':'curve',
-                'd':1,
-                'p':[(0,0,1),(0,0.5,0.866025),(0,0.866025,0.5),(0,1,0),(0,0.866025,-0.5),
-                    (0,0.5,-0.866025),(0,0,-1),(0,-0.5,-0.866025),(0,-0.866025,-0.5),
-                    (0,-1,0),(0,-0.866025,0.5),(0,-0.5,0.866025),(0,0,1),
-                    (0.707107,0,0.707107),(1,0,0),(0.707107,0,-0.707107),(0,0,-1),
-                    (-0.707107,0,-0.707107),(-1,0,0),(-0.866025,0.5,0),(-0.5,0.866025,0),
-                    (0,1,0),(0.5,0.866025,0),(0.866025,0.5,0),(1,0,0),(0.866025,-0.5,0),
-                    (0.5,-0.866025,0),(0,-1,0),(-0.5,-0.866025,0),(-0.866025,-0.5,0),
-                    (-1,0,0),(-0.707107,0,0.707107),(0,0,1)],
-                'k':list(range(33)),
-                'n':'sphere_cntl'},
-
-            'cog':{
-                'ID':'cog',
-                'type':'special',
-                'n':'cog_cntl',
-                'mel':
-                '''
-                        string $cog=`curve -n 'cog_cntl' -d 3 -p 7.06316e-009 0 -1 -p 0.104714 0 -0.990425 -p 0.314142 0 -0.971274 -p 0.597534 0 -0.821244 -p 0.822435 0 -0.597853 -p 0.96683 0 -0.314057 -p 1.016585 0 -2.28604e-005 -p 0.96683 0 0.314148 -p 0.822435 0 0.597532 -p 0.597534 0 0.822435 -p 0.314142 0 0.96683 -p 1.22886e-008 0 1.016585 -p -0.314142 0 0.96683 -p -0.597534 0 0.822435 -p -0.822435 0 0.597532 -p -0.96683 0 0.314148 -p -1.016585 0 -2.29279e-005 -p -0.96683 0 -0.314057 -p -0.822435 0 -0.597853 -p -0.597534 0 -0.821244 -p -0.314142 0 -0.971274 -p -0.104714 0 -0.990425 -p 7.06316e-009 0 -1 -k 0 -k 0 -k 0 -k 1 -k 2 -k 3 -k 4 -k 5 -k 6 -k 7 -k 8 -k 9 -k 10 -k 11 -k 12 -k 13 -k 14 -k 15 -k 16 -k 17 -k 18 -k 19 -k 20 -k 20 -k 20 -n helperCog`;
-                        select -r $cog.ep[1] $cog.ep[3] $cog.ep[5] $cog.ep[7] $cog.ep[9] $cog.ep[11] $cog.ep[13] $cog.ep[15] $cog.ep[17] $cog.ep[19];
-                        scale -r -p 0cm 0cm 0cm 0.732056 0.732056 0.732056 ;
-                        select -cl;
-
-                '''},
-
-            'pointer':{
-                'ID':'pointer',
-                'type':'curve',
-                'd':3,
-                'p':[(0.0, 0.0, -0.0096), (-0.3169, 0.0, -0.4585), 
-                    (-0.9507, 0.0, -1.3563), (-0.1329, 0.0, -1.2866), 
-                    (0.0238, 0.0, -1.538), (-0.4602, 0.0, -2.3617), 
-                    (-1.1307, 0.0, -3.2225), (-0.4428, 0.0, -2.5264), 
-                    (-0.0223, 0.0, -2.031), (0.509, 0.0, -2.5497), 
-                    (1.1194, 0.0, -3.2197), (0.4479, 0.0, -2.3495), 
-                    (0.0007, 0.0, -1.5368), (0.0475, 0.0, -1.3052), 
-                    (0.9731, 0.0, -1.3658), (0.3244, 0.0, -0.4617), 
-                    (0.0, 0.0, -0.0096)],
-                'k':[0,0,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,14,14],
-                'n':'pointer_cntl'},
-
-            'aim':{
-                'ID':'aim',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, -2.0), (0.0, 0.0, 0.0), (0.0, 2.0, -1.0),
-                    (0.0, -2.0, -1.0), (0.0, 0.0, 0.0), (-1.0, 0.0, -1.0), 
-                    (1.0, 0.0, -1.0), (0.0, 0.0, 0.0)],
-                'k':list(range(8)),
-                'n':'aim_cntl'},
-
-            'aim2':{
-                'ID':'aim2',
-                'type':'curve',
-                'd':1,
-                'p':[(0.0, 0.0, -2.0), (0.0, 0.0, 0.0), (0.0, 1.0, -1.0), 
-                    (0.0, -1.0, -1.0), (0.0, 0.0, 0.0), (-1.0, 0.0, -1.0), 
-                    (1.0, 0.0, -1.0), (0.0, 0.0, 0.0)],
-                'k':list(range(8)),
-                'n':'aim2_cntl'},
-
-            'dumbell':{
-                'ID':'dumbell',
-                'type':'curve',
-                'd':1,
-                'p':[(-1.2075, 0.0254, 0.0), (-1.1235, 0.0254, 0.2028), 
-                    (-0.9208, 0.0254, 0.2868), (-0.718, 0.0254, 0.2028), 
-                    (-0.635, 0.0254, 0.0024), (0.6341, 0.0254, 0.0), 
-                    (0.718, 0.0254, 0.2028), (0.9208, 0.0254, 0.2868), 
-                    (1.1235, 0.0254, 0.2028), (1.2075, 0.0254, 0.0), 
-                    (1.1235, 0.0254, -0.2028), (0.9208, 0.0254, -0.2868), 
-                    (0.718, 0.0254, -0.2028), (0.6341, 0.0254, 0.0), 
-                    (-0.635, 0.0254, 0.0024), (-0.718, 0.0254, -0.2028), 
-                    (-0.9208, 0.0254, -0.2868), (-1.1235, 0.0254, -0.2028), 
-                    (-1.2075, 0.0254, 0.0)],
-                'k':list(range(19)),
-                'n':'dumbell_cntl'}
-            }
-        return ControlLibraryDict
 
 
     def setControlLibrary(self,controlLib):
-        self.controlLib = self.getDefaultControlDict() if not controlLib else controlLib
+        if not controlLib:
+            self.registry = getShapeRegistry()
+        elif isinstance(controlLib, (str, list, tuple)):
+            self.registry = getShapeRegistry(controlLib)
+        elif isinstance(controlLib, ShapeRegistry):
+            self.registry = controlLib
+        else:
+            self.registry = ShapeRegistry(controlLib)
 
 
     def getControlData(self, key):
@@ -739,18 +925,33 @@ class ControlLibrary(object):
             key (str): control name
 
         Returns:
-            dict: contol info
+            ShapeRecord: contol info
         """
-        return self.controlLib[key]
+        return self.registry.get(key)
 
 
     def listControlShapes(self):
-        return self.controlLib.keys()
+        return self.registry.names()
+
+
+    def isPreTransformed(self, shape):
+        """True if createControlShape makes the shape with its points already sized, rotated and offset,
+            leaving the control's transform untouched
+
+        Args:
+            shape (str): shape name
+
+        Returns:
+            bool: True for curve shapes
+        """
+        return self.getControlData(shape).type == 'curve'
 
 
     def createControlShape(self,shape, name='',offset=(0,0,0),rotation=(0,0,0),size=1.0):
         """Creates a control shape
         All shapes lay on the xz plane and point down -z, towards the origin, when applicable
+        Curve shapes are made with their final points in one command, see isPreTransformed
+        The made nodes are recorded in the active name index
 
         Args:
             shape (str): name of the shape to create
@@ -763,45 +964,54 @@ class ControlLibrary(object):
         Returns:
             str: control name
         """
-        # Get dict
-        controlDict = self.getControlData(shape)
+        # Get record
+        record = self.getControlData(shape)
+        options = record.options
         # Generate Control
-        if controlDict['type']=='curve':
+        if record.type=='curve':
             controlNode = curve(
-                n=controlDict['n'],
-                d=controlDict['d'],
-                p=controlDict['p'],
-                k=controlDict['k'])
-
-        elif controlDict['type']=='circle':
+                n=name or record.name,
+                d=record.degree,
+                p=transformShapePoints(record.points,size,rotation,offset),
+                k=record.knots.tolist(),
+                per=options.get('per',False))
+            #the pivot stays where the offset put it, as it would after makeIdentity
+            if any(offset):
+                xform(controlNode,piv=offset)
+            return trackCreatedHierarchy(controlNode)
+
+        elif record.type=='circle':
             controlNode = circle(
-                n=controlDict['n'],
-                c=controlDict['c'],
-                nr=controlDict['nr'],
-                sw=controlDict['sw'],
-                r=controlDict['r'],
-                d=controlDict['d'],
-                ut=controlDict['ut'],
-                tol=controlDict['tol'],
-                s=controlDict['s'],
-                ch=controlDict['ch'])
-
-        elif controlDict['type']== 'nSphere':
+                n=record.name,
+                c=options['c'],
+                nr=options['nr'],
+                sw=options['sw'],
+                r=options['r'],
+                d=record.degree,
+                ut=options['ut'],
+                tol=options['tol'],
+                s=options['s'],
+                ch=options['ch'])
+
+        elif record.type== 'nSphere':
             if isinstance(size,tuple):
                 size=size[0]
 
-            controlNode=sphere(
-                n=controlDict['n'],
-                nsp=controlDict['spans'],
-                s=controlDict['sections'],
-                cch=controlDict['cch'],
-                r=size)[0]
-
-        elif controlDict['type']=='special':
-            controlNode = mc_eval(controlDict['mel'])
+            created=sphere(
+                n=record.name,
+                nsp=options['spans'],
+                s=options['sections'],
+                cch=options['cch'],
+                r=size)
+            controlNode=created[0]
+            #history node
+            trackCreated(created[1:])
+
+        elif record.type=='special':
+            controlNode = mc_eval(options['mel'])
             controlNode = ls(selection=1)
         else:
-            raise KeyError("Generation of {} type not supported currently.".format(controlDict['type']))
+            raise KeyError("Generation of {} type not supported currently.".format(record.type))
             
         # Transform
         if isinstance(size,(tuple,list)):
@@ -817,14 +1027,14 @@ class ControlLibrary(object):
         if name:
             controlNode = rename(controlNode, name)
 
-        return controlNode
+        return trackCreatedHierarchy(controlNode)
 
 
     def displayControlOptions(self,rows='',columns=''):
         #This could use some layout parameters
 
-        for key in self.controlLib.keys():
-            self.createControlControl(key)
+        for key in self.registry:
+            self.createControlShape(key)
 
 
 if __name__ == "__main__" :
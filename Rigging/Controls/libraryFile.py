@@ -0,0 +1,273 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Rigging.Controls
+
+Description: Reading and writing control shape library files.
+    Shapes are stored in the layout of getDefaultControlDict, either as JSON or in a compact binary form.
+    Both forms open with an index of every definition without its points and knots,
+    which are only read when a shape is first asked for.
+    JSON files: {"format": "mrShapeLibrary", "version": 2, "index": {name: definition}, "shapes": {name: {"p":..., "k":...}}}
+        The header, index and "shapes" key each sit on their own line, then one line per shape.
+        Index definitions hold "payload": [offset, length], the bytes of their shape's line from the first shape line.
+        Version 1 files, {"format": "mrShapeLibrary", "version": 1, "shapes": {name: definition}},
+        and files edited out of that layout are still valid JSON and are read whole when opened.
+    Binary files: 'MRSL', uint16 version, uint16 reserved, uint32 index size, a JSON index, then float64 blocks.
+        Index definitions hold their points and knots as [offset, count] into the blocks.
+    Binary files use BINARY_EXTENSION, anything else is read as JSON.
+    Nothing here needs Maya.
+
+"""
+
+import os
+import sys
+import json
+import struct
+from array import array
+
+FORMAT_NAME = 'mrShapeLibrary'
+FORMAT_VERSION = 2
+BINARY_MAGIC = b'MRSL'
+BINARY_EXTENSION = '.mrsl'
+
+__header = struct.Struct('<4sHHI')
+
+
+class ShapeLibraryFile(object):
+    """Shape library file, read as a mapping of shape name to definition.
+        Only the index is read when opened, points and knots are read per shape on first use.
+        JSON files not in the indexed layout are read whole instead.
+
+    Args:
+        path (str): library file
+    """
+    def __init__(self, path):
+        super(ShapeLibraryFile,self).__init__()
+        self.path = path
+        self.binary = isBinary(path)
+        self._definitions = {}
+        if self.binary:
+            self._index, self._dataStart = readBinaryIndex(path)
+        else:
+            self._index, self._dataStart = readJsonIndex(path)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, key):
+        """Returns the definition of a shape, reading its points and knots the first time it is asked for
+
+        Args:
+            key (str): shape name
+
+        Returns:
+            dict: shape definition, 'p' and 'k' are flat double arrays for binary files
+        """
+        definition = self._definitions.get(key)
+        if definition is None:
+            definition = dict(self._index[key])
+            if self.binary:
+                definition['p'] = self.__readBlock(*definition['p'])
+                definition['k'] = self.__readBlock(*definition['k'])
+            elif self._dataStart is not None:
+                definition.update(self.__readPayload(*definition.pop('payload')))
+            self._definitions[key] = definition
+        return definition
+
+    def keys(self):
+        return list(self._index)
+
+    def __readPayload(self, offset, length):
+        with open(self.path, 'rb') as f:
+            f.seek(self._dataStart + offset)
+            return json.loads(f.read(length).decode('utf-8'))
+
+    def __readBlock(self, offset, count):
+        if not count:
+            return memoryview(b'').cast('d')
+        with open(self.path, 'rb') as f:
+            f.seek(self._dataStart + offset * 8)
+            values = array('d', f.read(count * 8))
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return memoryview(values.tobytes()).cast('d')
+
+
+##########################################################
+##########################################################
+#                         Reading                        #
+##########################################################
+##########################################################
+
+def isBinary(path):
+    return os.path.splitext(path)[1].lower() == BINARY_EXTENSION
+
+
+def readLibrary(path):
+    """Opens a library file, see ShapeLibraryFile
+
+    Args:
+        path (str): library file
+
+    Returns:
+        ShapeLibraryFile: shapes by name
+    """
+    return ShapeLibraryFile(path)
+
+
+def readJsonIndex(path):
+    """Reads the header and index of a JSON library, or the whole file when it is not in the indexed layout
+
+    Returns:
+        tuple: index dict and the file offset the shape lines start at, None when the definitions are complete
+    """
+    with open(path, 'rb') as f:
+        lines = [f.readline().decode('utf-8').rstrip() for count in range(3)]
+        dataStart = f.tell()
+    try:
+        header = json.loads(lines[0].rstrip(',') + '}')
+        index = json.loads('{' + lines[1].rstrip(',') + '}')['index']
+    except (ValueError, KeyError):
+        return readJsonShapes(path), None
+    if header.get('version') != FORMAT_VERSION or lines[2] != '"shapes":{':
+        return readJsonShapes(path), None
+    __checkVersion(path, header.get('format'), header.get('version'))
+    return index, dataStart
+
+
+def readJsonShapes(path):
+    """Reads every definition of a JSON library, with its points and knots"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    __checkVersion(path, data.get('format'), data.get('version'))
+    if 'index' not in data:
+        return data.get('shapes', {})
+    shapes = {}
+    for name, definition in data['index'].items():
+        shapes[name] = dict(definition)
+        shapes[name].pop('payload', None)
+        shapes[name].update(data.get('shapes', {}).get(name, {}))
+    return shapes
+
+
+def readBinaryIndex(path):
+    """Reads the header and index of a binary library
+
+    Returns:
+        tuple: index dict and the file offset the float64 blocks start at
+    """
+    with open(path, 'rb') as f:
+        magic, version, reserved, size = __header.unpack(f.read(__header.size))
+        if magic != BINARY_MAGIC:
+            raise ValueError('{} is not a shape library'.format(path))
+        __checkVersion(path, FORMAT_NAME, version)
+        index = json.loads(f.read(size).decode('utf-8'))
+    return index, __header.size + size
+
+
+def __checkVersion(path, name, version):
+    if name != FORMAT_NAME:
+        raise ValueError('{} is not a shape library'.format(path))
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ValueError('{} is version {}, only version {} and older can be read'.format(path, version, FORMAT_VERSION))
+
+
+##########################################################
+##########################################################
+#                         Writing                        #
+##########################################################
+##########################################################
+
+def writeLibrary(path, shapes, binary=None):
+    """Writes shapes to a library file
+
+    Args:
+        path (str): library file
+        shapes (dict): definitions in the getDefaultControlDict layout, or ShapeRecords, by name
+        binary (bool, optional): write the binary form. Defaults to True for BINARY_EXTENSION paths.
+
+    Returns:
+        str: path
+    """
+    if binary is None:
+        binary = isBinary(path)
+    definitions = [(name, __flatten(shape)) for name, shape in shapes.items()]
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    if not binary:
+        index = {}
+        lines = []
+        offset = 0
+        for count, (name, (definition, points, knots)) in enumerate(definitions):
+            payload = {}
+            if points or knots:
+                payload = {'p': [points[i:i+3] for i in range(0, len(points), 3)], 'k': knots}
+            payload = json.dumps(payload, separators=(',',':'))
+            key = json.dumps(name) + ':'
+            definition['payload'] = [offset + len(key), len(payload)]
+            index[name] = definition
+            lines.append(key + payload + (',' if count < len(definitions) - 1 else ''))
+            offset += len(lines[-1]) + 1
+        with open(path, 'w', newline='\n') as f:
+            f.write(json.dumps({'format': FORMAT_NAME, 'version': FORMAT_VERSION}, separators=(',',':'))[:-1] + ',\n')
+            f.write('"index":' + json.dumps(index, separators=(',',':')) + ',\n')
+            f.write('"shapes":{\n')
+            for line in lines:
+                f.write(line + '\n')
+            f.write('}}\n')
+        return path
+
+    index = {}
+    values = array('d')
+    for name, (definition, points, knots) in definitions:
+        definition['p'] = [len(values), len(points)]
+        values.extend(points)
+        definition['k'] = [len(values), len(knots)]
+        values.extend(knots)
+        index[name] = definition
+    if sys.byteorder != 'little':
+        values.byteswap()
+    encoded = json.dumps(index, separators=(',',':')).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(__header.pack(BINARY_MAGIC, FORMAT_VERSION, 0, len(encoded)))
+        f.write(encoded)
+        f.write(values.tobytes())
+    return path
+
+
+def __flatten(shape):
+    """Splits a definition or ShapeRecord into its other keys, flat points and knots"""
+    if isinstance(shape, dict):
+        definition = dict(shape)
+        points = definition.pop('p', ())
+        if isinstance(points, memoryview):
+            points = points.tolist()
+        else:
+            points = [float(value) for point in points for value in point]
+        knots = [float(value) for value in definition.pop('k', ())]
+    else:
+        definition = {'ID': shape.ID, 'type': shape.type, 'n': shape.name}
+        if shape.degree is not None:
+            definition['d'] = shape.degree
+        definition.update(shape.options)
+        points = shape.points.tolist()
+        knots = shape.knots.tolist()
+    for key, value in definition.items():
+        if isinstance(value, tuple):
+            definition[key] = list(value)
+    return definition, points, knots
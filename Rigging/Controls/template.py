@@ -0,0 +1,192 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Rigging.Controls
+
+Description: Per scene cache of control shape templates.
+    The first control of a shape makes a template, later ones copy or instance it.
+    A character's templates are sorted into its hidden rig group, so they are deleted with the rig and not exported with the controls.
+    Templates of controls without a character live under TEMPLATE_GROUP.
+    A copy only has its points rewritten, in one setAttr, when its size, rotation or offset differ from the template's.
+    Shapes made by a command rather than from points (circle) are always made from templates,
+    curves are already made in one command so they only use templates when instanced.
+    Instances share the template's shape node, so they are only made when no point edits are needed.
+
+"""
+
+import maya.cmds as mc
+
+from Rigging.Controls.library import ControlLibrary,transformShapePoints
+from Rigging.Utility.general import organizeElement
+from Rigging.Utility.nameIndex import nodeExists,trackCreated,trackRenamed,trackDeleted
+
+TEMPLATE_GROUP = 'shapeTemplate_grp'
+TEMPLATE_TYP = 'shape'
+TEMPLATE_CLAS = 'template'
+TEMPLATE_TYPES = ('circle',)
+INSTANCE_TYPES = ('curve','circle')
+
+__shapeTemplates = None
+
+
+class ShapeTemplates(object):
+    """Makes control shapes from hidden templates, falling back to the library for shapes it can not template.
+        Offers the same createControlShape and isPreTransformed as ControlLibrary.
+
+    Args:
+        library (ControlLibrary, optional): library the templates are made from. Defaults to the default library.
+    """
+    def __init__(self, library=None):
+        super(ShapeTemplates,self).__init__()
+        self.library = library or ControlLibrary()
+        self._templates = {}
+
+    def isTemplated(self, shape, instance=False):
+        """True if controls of the shape are made from a template
+
+        Args:
+            shape (str): shape name
+            instance (bool, optional): instancing is requested. Defaults to False.
+
+        Returns:
+            bool: True if a template is used
+        """
+        typ = self.library.getControlData(shape).type
+        return typ in TEMPLATE_TYPES or (instance and typ in INSTANCE_TYPES)
+
+    def isPreTransformed(self, shape):
+        """True if createControlShape makes the shape with its points already sized, rotated and offset
+
+        Args:
+            shape (str): shape name
+
+        Returns:
+            bool: True for templated and curve shapes
+        """
+        return self.isTemplated(shape) or self.library.isPreTransformed(shape)
+
+    def getTemplate(self, shape, char=''):
+        """Returns the template of a shape, making it if it is not in the scene
+
+        Args:
+            shape (str): shape name
+            char (str, optional): character the template belongs to. Defaults to '', a template at world level.
+
+        Returns:
+            tuple: template transform, its shape nodes and their untransformed points
+        """
+        template = self._templates.get((char,shape))
+        if template and nodeExists(template[0]):
+            return template
+
+        name = '_'.join([segment for segment in (char,'template',shape,'crv') if segment])
+        if not nodeExists(name):
+            #made at the origin with no size, rotation or offset applied
+            controlNode = self.library.createControlShape(shape,name)
+            if char:
+                organizeElement(controlNode,typ=TEMPLATE_TYP,clas=TEMPLATE_CLAS)
+            else:
+                if not nodeExists(TEMPLATE_GROUP):
+                    trackCreated(mc.group(em=1,n=TEMPLATE_GROUP))
+                    mc.setAttr(TEMPLATE_GROUP+'.visibility',0)
+                mc.parent(controlNode,TEMPLATE_GROUP)
+
+        #paths from the template, it may still be waiting to be sorted into the rig
+        shapes = ['|'.join((name,node.rpartition('|')[2])) for node in mc.listRelatives(name,s=1) or []]
+        points = [mc.getAttr(node+'.controlPoints[*]') for node in shapes]
+        template = self._templates[(char,shape)] = (name, shapes, points)
+        return template
+
+    def createControlShape(self, shape, name='', offset=(0,0,0), rotation=(0,0,0), size=1.0, instance=False, char=''):
+        """Creates a control shape, see ControlLibrary.createControlShape.
+            The made nodes are recorded in the active name index.
+
+        Args:
+            shape (str): name of the shape to create
+            name (str, optional): Name to be used as the control's basename. Defaults to ''.
+            offset ([float], optional): Offset location of control shape. Defaults to (0,0,0).
+            rotation ([float] (angle), optional): Rotation, in angles, to adjust the placement of the control. Defaults to (0,0,0).
+            size (float, optional): Scale Adjustment. Defaults to 1.0.
+            instance (bool, optional): share the template's shape nodes when no point edits are needed. Defaults to False.
+            char (str, optional): character the template belongs to. Defaults to '', a template at world level.
+
+        Returns:
+            str: control name
+        """
+        if not self.isTemplated(shape, instance):
+            return self.library.createControlShape(shape,name,offset,rotation,size)
+
+        path, shapes, points = self.getTemplate(shape,char)
+        name = name or self.library.getControlData(shape).name
+        scales = (size,size,size) if isinstance(size,(int,float)) else tuple(size)
+        edited = scales != (1,1,1) or any(rotation) or any(offset)
+
+        if instance and not edited:
+            controlNode = trackCreated(mc.createNode('transform',n=name))
+            mc.parent(shapes,controlNode,s=1,r=1,add=1)
+            return controlNode
+
+        copy = trackCreated(mc.duplicate(path,n=name,rr=1)[0])
+        controlNode = trackRenamed(copy, mc.parent(copy,w=1)[0])
+        copies = trackCreated(mc.listRelatives(controlNode,s=1,f=1) or [])
+        for count, copy in enumerate(copies):
+            copy = trackRenamed(copy, mc.rename(copy, controlNode + ('Shape' if not count else 'Shape{}'.format(count))))
+            if edited:
+                values = [value for point in transformShapePoints(points[count],size,rotation,offset) for value in point]
+                mc.setAttr('{}.controlPoints[0:{}]'.format(copy,len(points[count])-1), *values)
+        #the pivot stays where the offset put it, as it would after makeIdentity
+        if any(offset):
+            mc.xform(controlNode,piv=offset)
+        return controlNode
+
+    def clear(self, char=''):
+        """Deletes a character's templates from the scene.
+            Refuses while controls instance them, deleting the template would take their shapes.
+
+        Args:
+            char (str, optional): character whose templates are deleted. Defaults to '', the world level templates.
+        """
+        group = getTemplateGroup(char)
+        if nodeExists(group):
+            shapes = mc.listRelatives(group,ad=1,s=1,f=1) or []
+            instanced = [shape for shape in shapes if len(mc.listRelatives(shape,ap=1) or []) > 1]
+            if instanced:
+                raise RuntimeError('templates are instanced by controls, remove the instances first: {}'.format(instanced))
+            trackDeleted(mc.listRelatives(group,ad=1) or [])
+            mc.delete(group)
+            trackDeleted(group)
+        for key in [key for key in self._templates if key[0] == char]:
+            del self._templates[key]
+
+
+def getTemplateGroup(char=''):
+    """Name of the group a character's templates are sorted into
+
+    Args:
+        char (str, optional): character segment. Defaults to '', TEMPLATE_GROUP.
+
+    Returns:
+        str: group name
+    """
+    if not char:
+        return TEMPLATE_GROUP
+    return '_'.join((char,TEMPLATE_TYP,TEMPLATE_CLAS,'grp'))
+
+
+def getShapeTemplates():
+    """Returns the shared template cache, making it on first use
+
+    Returns:
+        ShapeTemplates: template cache
+    """
+    global __shapeTemplates
+    if __shapeTemplates is None:
+        __shapeTemplates = ShapeTemplates()
+    return __shapeTemplates
@@ -20,19 +20,21 @@ from maya import cmds as mc
 
 from Utility.stringTools import *
 import Utility.vectorMath as vec
-from Rigging.Utility.general import organizeElement,getDescendent,getParent,addDriver
+from Rigging.Utility.general import organizeElement,deferOrganize,getDescendent,getParent,addDriver,getDriverNodes
 from Rigging.Controls.core import makeCntl,makeMasterCntl,enableInverseBlend,syncVis
 
 from Rigging.Core.basic import assembleFK,assembleIK,duplicateChain
 from Rigging.Core.geo import getFootPivots,makePivots,stackPivots
+from Rigging.Utility.nameIndex import nodeExists
 
 
 #needs testing
+@deferOrganize
 def assembleFootIK(ankle_jnt,verts='',geo='',ankle_ik='',
                     cntlShape='circle',name='foot',
                     cntlSize=1.0,rotation=(0,0,0),
                     forwardAxis='x',upAxis='y',
-                    rotationAxis='z',pvSize=1.0):
+                    rotationAxis='z',pvSize=1.0,pivotMode='axis'):
     """Builds a foot IK system.
 
     Args:
@@ -48,6 +50,7 @@ def assembleFootIK(ankle_jnt,verts='',geo='',ankle_ik='',
         upAxis (str, optional): up axis of foot. Defaults to 'y'.
         rotationAxis (str, optional): primary rotation axis for ankle. Defaults to 'z'.
         pvSize (float, optional): uniform scale modifier for pole vector control. Defaults to 1.0.
+        pivotMode (str, optional): foot pivot detection, 'axis' or 'pca'. See getFootPivots. Defaults to 'axis'.
 
     Returns:
         str: name of foot control
@@ -57,7 +60,7 @@ def assembleFootIK(ankle_jnt,verts='',geo='',ankle_ik='',
     #this might need it's own chain to accomidate fk-ik switch
     
     #make pivots
-    pivot_dict = getFootPivots(ankle_jnt=ankle_jnt,verts=verts,geo=geo)
+    pivot_dict = getFootPivots(ankle_jnt=ankle_jnt,verts=verts,obj=geo,mode=pivotMode)
     pivots = makePivots(pivot_dict, ankle_jnt,name=name)
     stackPivots(pivots)
     organizeElement(pivots[-1])
@@ -175,6 +178,7 @@ def assembleFootIK(ankle_jnt,verts='',geo='',ankle_ik='',
 
 
 #ready but needs stress test and clav + end pairing tests
+@deferOrganize
 def assembleBasicLimb(jnts,mstrCntl='',clav=0,
                     fk=1,fkCntlSize=1.0,fkRotation=(0,0,90),fkTyp='nested',
                     fkRotationAxis='z',fkUpAxis='y',fkForwardAxis='x',fkShape='circle',fkPreset='',
@@ -242,7 +246,7 @@ def assembleBasicLimb(jnts,mstrCntl='',clav=0,
         mc.addAttr(ln='fkik', at='float',max=1,min=0,dv=0,k=1)
         for jnt in jnts:
             #assumes there is only a single constraint
-            constraints = list(set(mc.listConnections(jnt,type='constraint')))
+            constraints = getDriverNodes(jnt)
             for check in constraints:
                 if 'bind' in check:
                     constraint=check
@@ -254,6 +258,7 @@ def assembleBasicLimb(jnts,mstrCntl='',clav=0,
 
 
 #ready, kind of touchy tho
+@deferOrganize
 def assembleHand(root,
     mstrCntl='',
     name='hand',
@@ -310,7 +315,7 @@ def assembleHand(root,
 
     finger_roots = mc.listRelatives(root,c=1)
     fkParentDriver = replaceSegment(root,-2,'fk')
-    if mc.objExists(fkParentDriver):
+    if nodeExists(fkParentDriver):
         fkParentDriver
     for finger in finger_roots:
         count = len(mc.listRelatives(finger,ad=1))
@@ -319,7 +324,7 @@ def assembleHand(root,
             jnts.append(getDescendent(jnts[i],1))
 
         if fk==1:
-            if not mc.objExists(fkParentDriver):
+            if not nodeExists(fkParentDriver):
                 fkParentDriver = duplicateChain(root,typ='fk',addID='fkik')[0]
                 addDriver(root,fkParentDriver,'parent')
             fk_cntl= assembleFK(jnts,rotationAxis=fingerAxis,rotation=fkRotation,shape=fkShape,cntlSize=fkCntlSize,typ='base',parentDriver=fkParentDriver)
@@ -337,7 +342,7 @@ def assembleHand(root,
             mc.addAttr(ln='fkik', at='float',max=1,min=0,dv=0,k=1)
             for jnt in jnts:
                 #assumes there is only a single constraint
-                constraint = list(set(mc.listConnections(jnt,type='constraint')))[0]
+                constraint = getDriverNodes(jnt)[0]
                 enableInverseBlend(fk_cntl,constraint,'fkik',0,1)
             #needs to be IK to fk only    
             syncVis(fk_cntl,'fkik',ik_cntl)
@@ -19,8 +19,9 @@ Description: Functions for generating the most primitive control structures.
 import maya.cmds as mc
 from Utility.stringTools import *
 import Utility.vectorMath as vec
-from Rigging.Utility.general import organizeElement,createUtility,getDescendent,getParent,getRigSpace,addDriver
+from Rigging.Utility.general import organizeElement,deferOrganize,createUtility,getDescendent,getParent,getRigSpace,assignSpaces,addDriver,addDrivers
 from Rigging.Controls.core import makeCntl,enableInverseBlend
+from Rigging.Utility.nameIndex import trackCreated,getNameAllocator
 
 ##########################################################
 ##########################################################
@@ -38,55 +39,32 @@ def duplicateChain(jnts, typ='typ',addID='',conflictID=''):
         jnts (list | str): joints to be duplicated
         typ (str, optional): intended typ tag for the new joints. Defaults to 'typ'.
         addID (str, optional): additional IDs to be added to the new chain. Defaults to ''.
-        conflictID (str, optional): Desire str to be used for conflictingIDs. Will use numbers if give ''. Defaults to ''.
+        conflictID (str, optional): Desire str to be used for conflictingIDs, followed by a number. Will use only numbers if given ''. Defaults to ''.
 
     Returns:
         list: list of new joints
     """
-    # TODO inspect conflictID handling
     if not jnts:
         raise ValueError("You must provide joints")
 
     if isinstance(jnts,(str)):
         jnts = [jnts]
 
-    output_jnts = []
-    
-    conflictAbove=0
-    conflictCount=0
-    if not conflictID:
-        conflictID = conflictCount
-    
-    newJnts=[]
+    #reserve the whole chain up front so every joint shares one conflictID
+    baseNames= replaceSegments(jnts,'typ',typ)
+    if addID:
+        baseNames= appendIDs(baseNames,addID)
+    newJnts= getNameAllocator().allocateChain(baseNames,tag=str(conflictID))
+
     previousNewJnt= ''
-    for jnt in jnts:
-        # Name handling
-        newName= replaceSegment(jnt,'typ',typ)
-        if addID:
-            newName= appendID(newName,addID)
-        if conflictAbove:
-            newName = appendID(newName,conflictID) 
-        if mc.objExists(newName):
-            newNameWithId=newName
-            while mc.objExists(newNameWithId):
-                if isinstance(conflictID,int):
-                    conflictID += 1
-                    newNameWithId= appendID(newName,str(conflictID))
-                else:
-                    conflictCount += 1
-                    conflictID = ''.join((conflictID,str(conflictCount)))
-                    newNameWithId= appendID(newName,conflictID)
-            # enable the reuse of the previously solved conflictID
-            conflictAbove=1
-            newName= newNameWithId
-        mc.duplicate(jnt,n=newName,po=1)
+    for jnt,newName in zip(jnts,newJnts):
+        trackCreated(mc.duplicate(jnt,n=newName,po=1))
         
         if previousNewJnt:
             mc.parent(newName,previousNewJnt)
         else:
             mc.parent(newName,a=1,w=1)
         previousNewJnt=newName
-        newJnts.append(newName)
 
     organizeElement(newJnts[0])
     return newJnts
@@ -99,6 +77,7 @@ def duplicateChain(jnts, typ='typ',addID='',conflictID=''):
 ##########################################################
 
 
+@deferOrganize
 def assembleFK(jnts,cntlSize=1.0,rotation=(0,0,90), typ='nested', rotationAxis='z',
                 shape='circle',upAxis='y',forwardAxis='x', parentDriver='',preset=''):
     """creates an fk system for the given joints.
@@ -124,8 +103,7 @@ def assembleFK(jnts,cntlSize=1.0,rotation=(0,0,90), typ='nested', rotationAxis='
     #create new influence chain and attach it to the given chain
         
     proxy_jnts = duplicateChain(jnts, 'fk')
-    for jnt, proxy_jnt in zip(jnts,proxy_jnts):
-        addDriver(proxy_jnt,jnt,'parent')
+    addDrivers([(proxy_jnt,jnt,'parent') for jnt, proxy_jnt in zip(jnts,proxy_jnts)])
     
     if typ == 'nested':
     #Stack controls
@@ -136,12 +114,10 @@ def assembleFK(jnts,cntlSize=1.0,rotation=(0,0,90), typ='nested', rotationAxis='
             mc.parent(cntls[i],cntl_handle, a=1)
         
         #connects cntls to new joint chain
-        for cntl,jnt in zip(cntls,proxy_jnts):
-            cntl = getDescendent(cntl,2)
-            #because && and || don't seem to like me
-            addDriver(cntl,jnt,'parent')
+        #because && and || don't seem to like me
         parent = getParent(jnts[0],1)
-        addDriver(parent,cntls[0],'parent')
+        addDrivers([(getDescendent(cntl,2),jnt,'parent') for cntl,jnt in zip(cntls,proxy_jnts)]
+                    + [(parent,cntls[0],'parent')])
         organizeElement(cntls[0])
 
         #if parentDriver:
@@ -194,7 +170,7 @@ def assembleFK(jnts,cntlSize=1.0,rotation=(0,0,90), typ='nested', rotationAxis='
         return base_cntl
             
 
-def makePV(jnts, ik, distance=1, size=1):
+def makePV(jnts, ik, distance=1, size=1, fallback=(0,0,-1)):
     """Makes a pole vector for the given 3 joint chain and attaches it to
     the give ik. distance is the offset from the middle joint
 
@@ -203,23 +179,17 @@ def makePV(jnts, ik, distance=1, size=1):
         ik (str): name of IK handle
         distance (int, optional): offset distance for control. Defaults to 1.
         size (int, optional): PV control shape scale. Defaults to 1.
+        fallback (tuple, optional): PV direction used when the chain is straight. Defaults to (0,0,-1), behind the character.
 
     Returns:
         str: name of the PV's control_group
     """
-    #get locations
-    startJoint=mc.xform(jnts[0], q=1, t=1,ws=1)
-    #mc.getAttr(jnts[0]+'.translate')[0]
-    middle=mc.xform(jnts[1], q=1, t=1, ws=1)
-    endEffector=mc.xform(jnts[2], q=1, t=1,ws=1)
-
-    #get plane vectors
-    norm = vec.normalize(vec.vector(middle,endEffector))
-    bitangent = vec.bitangent(norm,vec.vector(middle,startJoint))
-    bisector = vec.normalize(vec.add(norm,bitangent))
+    #get locations in one query
+    points=mc.xform(jnts[:3], q=1, t=1, ws=1)
+    startJoint,middle,endEffector = points[0:3],points[3:6],points[6:9]
 
     #get target world position
-    pvPosition = vec.add(middle,vec.mult(bitangent,(-1*distance)))
+    pvPosition = vec.poleVector(startJoint,middle,endEffector,distance,fallback)[0]
     #actually make the control and connect it
     cntl_grp = makeCntl(ik,typ='pv',size=size,position=pvPosition)[0]
     pv_cntl= getDescendent(cntl_grp,2)
@@ -237,6 +207,7 @@ def makePV(jnts, ik, distance=1, size=1):
 
 
 # TODO test
+@deferOrganize
 def assembleIK(jnts, solver='ikRPsolver', name='', typ='ik',shape='nail', 
                 cntlSize=1, rotation=(0,0,90), offsetShapeDist=(0,0,0), pvSize=1, pvDist=1,
                 forwardAxis='x', preset='', stickyTip=0, stickyShape='sphere',
@@ -320,7 +291,7 @@ def assembleIK(jnts, solver='ikRPsolver', name='', typ='ik',shape='nail',
             ,-1,'hndl')
 
     #make ik handle
-    ik = mc.ikHandle(sj=proxy_jnts[0],ee=proxy_jnts[-1],sol=solver,n=ikName)[0]
+    ik = trackCreated(mc.ikHandle(sj=proxy_jnts[0],ee=proxy_jnts[-1],sol=solver,n=ikName))[0]
     organizeElement(ik)
     cntls.append(ik)
     #add PV if needed
@@ -375,7 +346,7 @@ def assembleIK(jnts, solver='ikRPsolver', name='', typ='ik',shape='nail',
             replaceSegment(proxy_clav,-2,'ik')
             ,-1,'hndl')
 
-        clav_ik = mc.ikHandle(sj=proxy_clav,ee=proxy_jnts[0],sol='ikSCsolver',n=clav_ikName)[0]
+        clav_ik = trackCreated(mc.ikHandle(sj=proxy_clav,ee=proxy_jnts[0],sol='ikSCsolver',n=clav_ikName))[0]
         clav_cntl_grp= makeCntl(proxy_clav,typ='ik',name='clav',size=cntlSize,shape=shape,rotation=rotation,offsetShapeDist=offsetShapeDist)[0]
         clav_cntl= getDescendent(clav_cntl_grp,2)
         addDriver(clav_cntl,clav_ik,'parent')
@@ -399,6 +370,7 @@ def assembleIK(jnts, solver='ikRPsolver', name='', typ='ik',shape='nail',
 
 
 # TODO bug splat on last cntl -- previous comments did not clarify issue. RIP
+@deferOrganize
 def assembleBashChain(jnts,shape='circle',rotation=(0,0,0),cntlSize=1.0,
                         finalCntlShape='rombus',finalCntlSize=1.0,finalCntlOffset=(0,0,0)):
     """Experimental \n
@@ -444,12 +416,14 @@ def assembleBashChain(jnts,shape='circle',rotation=(0,0,0),cntlSize=1.0,
             constraint = addDriver(cntls[i-1],cntl_offset,'parent')
             addDriver(rig_space,cntl_offset,'parent')
             enableInverseBlend(cntls[i],constraint,'follow')
+            assignSpaces(cntls[i],rig_space)
     
     #endCntl stuff
     endCntl_offset = getParent(cntls[-1],1)
     end_constraint = addDriver(cntls[-2],endCntl_offset,'parent')
     addDriver(rig_space,endCntl_offset,'parent')
     enableInverseBlend(cntls[-1],end_constraint,'follow')
+    assignSpaces(cntls[-1],rig_space)
     #need to add support for special end control   
     #single chain IK with cntls on base that drives 
     return cntls
@@ -468,7 +442,7 @@ def addStickyTip(jnts, root_cntl,  shape='sphere'):
     Returns:
         str: name of new control handle
     """
-    sticky_ik_handle = mc.ikHandle(sj=jnts[-2],ee=jnts[-1],sol='ikSCSolver')
+    sticky_ik_handle = trackCreated(mc.ikHandle(sj=jnts[-2],ee=jnts[-1],sol='ikSCSolver'))
     sticky_cntl = getDescendent(makeCntl(jnts[2], shape=shape),2)
 
     addDriver(sticky_cntl,sticky_ik_handle)
@@ -480,6 +454,7 @@ def addStickyTip(jnts, root_cntl,  shape='sphere'):
     return sticky_cntl
 
 
+@deferOrganize
 def assembleSingleBash(jnts, shape='nail', name='', rotation=(0,0,90), 
                         cntlSize=1.0,position=(0,0,0),offsetShapeDist=(0,0,0)):
     """Experimental \n
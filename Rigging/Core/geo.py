@@ -16,10 +16,17 @@ Description: Functions for laying out nodes with relation to geometry
 
 """
 
+import hashlib
+
 from maya import cmds as mc
 from Utility.stringTools import *
 import Utility.vectorMath as vec
+import Utility.vectorArray as vecArray
+from Utility.vectorArray import np
 from Rigging.Utility.general import getDescendent
+from Rigging.Utility.nameIndex import trackCreated
+from Utility.pointCache import makeSignature,getPointCache
+from Utility.spatialIndex import KDTree
 
 
 ##########################################################
@@ -28,101 +35,322 @@ from Rigging.Utility.general import getDescendent
 ##########################################################
 ##########################################################
 
-def getFootPivots(ankle_jnt,verts='',obj=''):
-    """calculates the location of where each foot pivot should be placed
+FOOT_PIVOTS = (
+    'toeUp', #0
+    'ball', #1
+    'toeTip', #2
+    'heel', #3
+    'inside', #4
+    'outside', #5
+    'ankle', #6
+    'center', #7
+    'offset' #8
+    )
+
+
+def getPoints(verts='',obj='',cache=None):
+    """Reads the world positions of the given vertices, or every vertex of obj, in a single query
+
+    Args:
+        verts (list, optional): list of vertices or other components. Defaults to ''.
+        obj (str, optional): name of geometry node. Defaults to ''.
+        cache (PointCache | bool, optional): point cache to read whole meshes through, True for the shared cache.
+            Defaults to None.
+
+    Returns:
+        numpy.ndarray: (N,3) positions, a list of tuples without numpy
+    """
+    if not verts:
+        if cache:
+            return getCachedPoints(obj,cache)
+        verts = '{}.vtx[*]'.format(obj)
+    return vecArray.asPoints(mc.xform(verts,q=1,t=1,ws=1))
+
+
+def getMeshSignature(obj,points=None):
+    """Signature of a mesh's topology counts and world space points, for keying the point cache
+
+    Args:
+        obj (str): name of mesh
+        points (list, optional): flat world positions of every vertex, when already read. Defaults to None.
+
+    Returns:
+        str: signature
+    """
+    counts = [mc.polyEvaluate(obj,**{flag:1}) for flag in ('v','e','f')]
+    if points is None:
+        points = mc.xform('{}.vtx[*]'.format(obj),q=1,t=1,ws=1) or []
+    if vecArray.HAS_NUMPY:
+        digest = hashlib.sha1(np.asarray(points,dtype=np.float64).tobytes()).hexdigest()
+    else:
+        digest = hashlib.sha1(repr(list(points)).encode('utf-8')).hexdigest()
+    return makeSignature(obj,counts,digest)
+
+
+def getCachedPoints(obj,cache=True,refresh=False):
+    """World positions of every vertex of obj, from the point cache when it has them.
+        The points are read in one query to sign the mesh, so any deformation gives a new entry.
+        Hits return the shared memory-mapped copy rather than a new array.
+
+    Args:
+        obj (str): name of mesh
+        cache (PointCache | bool, optional): cache to use, True for the shared cache. Defaults to True.
+        refresh (bool, optional): replace the entry. Defaults to False.
+
+    Returns:
+        numpy.memmap: (N,3) read-only positions
+    """
+    if cache is True:
+        cache = getPointCache()
+    points = mc.xform('{}.vtx[*]'.format(obj),q=1,t=1,ws=1) or []
+    signature = getMeshSignature(obj,points)
+    if refresh:
+        return cache.put(obj,signature,points)
+    return cache.fetch(obj,signature,lambda: points)
+
+
+def findFootExtremes(points,toe,reference):
+    """Finds the toe tip, heel, inside, outside and lowest point of a foot.
+        The toe tip is searched for below the toe joint, everything else below the reference.
+        A start position is kept when no point beats it. Inside and outside are measured from the x median.
+
+    Args:
+        points (numpy.ndarray): (N,3) vertex positions
+        toe (tuple): toe joint position
+        reference (tuple): position the other searches start from
+
+    Returns:
+        dict: 'toeTip','heel','inside','outside' positions and the 'lowest' height
+    """
+    if not vecArray.HAS_NUMPY:
+        points = vecArray.asPoints(points)
+        toe_candidates = [tuple(toe)] + [point for point in points if point[1] < toe[1]]
+        candidates = [tuple(reference)] + [point for point in points if point[1] < reference[1]]
+        return {
+            'toeTip': list(max(toe_candidates, key=lambda point: point[2])),
+            'heel': list(min(candidates, key=lambda point: point[2])),
+            'inside': list(min(candidates, key=lambda point: abs(point[0]))),
+            'outside': list(max(candidates, key=lambda point: abs(point[0]))),
+            'lowest': min(point[1] for point in points)}
+
+    points = vecArray.asPoints(points)
+    toe_candidates = np.vstack((toe, points[points[:,1] < toe[1]]))
+    candidates = np.vstack((reference, points[points[:,1] < reference[1]]))
+    return {
+        'toeTip': toe_candidates[np.argmax(toe_candidates[:,2])].tolist(),
+        'heel': candidates[np.argmin(candidates[:,2])].tolist(),
+        'inside': candidates[np.argmin(np.abs(candidates[:,0]))].tolist(),
+        'outside': candidates[np.argmax(np.abs(candidates[:,0]))].tolist(),
+        'lowest': float(points[:,1].min())}
+
+
+def __soleSamples(points,normal,cells=16):
+    """Lowest point along normal in each cell of a grid laid over the footprint.
+        These sit on the sole however the foot is tilted, so a plane fit to them is not skewed by a tilted band.
+    """
+    helper = np.eye(3)[np.argmin(np.abs(normal))]
+    u = np.cross(normal, helper)
+    u /= np.linalg.norm(u)
+    v = np.cross(normal, u)
+    planar = np.stack((points.dot(u), points.dot(v)), axis=1)
+    low = planar.min(axis=0)
+    size = (planar.max(axis=0) - low) / cells
+    size[size == 0] = 1.0
+    grid = np.minimum((planar - low) // size, cells - 1).astype(int)
+    cell = grid[:,0] * cells + grid[:,1]
+    #sort by cell then height, the first point of each cell is its lowest
+    order = np.lexsort((points.dot(normal), cell))
+    first = np.unique(cell[order], return_index=True)[1]
+    return points[order[first]]
+
+
+def getFootFrame(points,ankle,toe,band=0.1,iterations=2):
+    """Finds the sole plane and forward axis of a foot with PCA.
+        The sole normal is the smallest principal axis of the lowest points over the footprint, pointed at the ankle.
+        The contact band is every point within band of the foot's height above the sole,
+        its largest principal axis is forward, pointed at the toe, and lateral points away from the x median.
+        Each iteration lays the footprint grid out along the last normal, so tilted feet settle onto their own sole.
+
+    Args:
+        points (numpy.ndarray): (N,3) vertex positions
+        ankle (tuple): ankle joint position
+        toe (tuple): toe joint position
+        band (float, optional): contact band thickness as a fraction of the foot's height. Defaults to 0.1.
+        iterations (int, optional): times the sole plane is refit. Defaults to 2.
+
+    Returns:
+        tuple: ground origin, forward, lateral and normal as numpy arrays, and the contact band points
+    """
+    if not vecArray.HAS_NUMPY:
+        raise ImportError('PCA foot pivots need numpy')
+    points = vecArray.asPoints(points)
+    ankle = np.asarray(ankle, dtype=float)
+    toe = np.asarray(toe, dtype=float)
+
+    normal = np.array((0.0,1.0,0.0))
+    for i in range(max(1,iterations)):
+        sole = __soleSamples(points,normal)
+        if len(sole) < 3:
+            sole = points
+        #eigh sorts ascending, the smallest axis is the sole normal
+        axes = np.linalg.eigh(np.cov(sole - sole.mean(axis=0), rowvar=False))[1]
+        normal = axes[:,0] if np.dot(axes[:,0], ankle - sole.mean(axis=0)) >= 0 else -axes[:,0]
+
+    heights = points.dot(normal)
+    ground = sole.dot(normal).min()
+    contact = points[heights <= ground + (heights.max()-ground) * band]
+    if len(contact) < 3:
+        contact = points
+    origin = contact.mean(axis=0)
+    axes = np.linalg.eigh(np.cov(contact - origin, rowvar=False))[1]
+
+    #largest axis of the band runs heel to toe
+    forward = axes[:,2] - normal * np.dot(axes[:,2], normal)
+    forward /= np.linalg.norm(forward)
+    if np.dot(forward, toe - ankle) < 0:
+        forward = -forward
+    lateral = np.cross(normal, forward)
+    if np.dot(lateral, (origin[0],0.0,0.0)) < 0:
+        lateral = -lateral
+
+    #drop the origin onto the sole
+    origin = origin - normal * (np.dot(origin, normal) - ground)
+    return origin, forward, lateral, normal, contact
+
+
+def findFootPivotsPCA(points,ankle,ball,toe,band=0.1):
+    """Foot pivot positions measured in the foot's own frame, so rotated, splayed or tilted feet
+        and left and right sides are handled the same. See getFootFrame.
+
+    Args:
+        points (numpy.ndarray): (N,3) vertex positions
+        ankle (tuple): ankle joint position
+        ball (tuple): ball joint position
+        toe (tuple): toe joint position
+        band (float, optional): contact band thickness as a fraction of the foot's height. Defaults to 0.1.
+
+    Returns:
+        dict: dictionary of pivot names and their positions
+    """
+    origin, forward, lateral, normal, contact = getFootFrame(points,ankle,toe,band)
+    local = contact - origin
+    along = local.dot(forward)
+    across = local.dot(lateral)
+
+    def onGround(index):
+        point = local[index]
+        return origin + point - normal * np.dot(point, normal)
+
+    toeTip, heel = onGround(np.argmax(along)), onGround(np.argmin(along))
+    inside, outside = onGround(np.argmin(across)), onGround(np.argmax(across))
+    center = origin + forward * (along.max()+along.min())/2 + lateral * (across.max()+across.min())/2
+
+    pivot_pos = [ball, ball, toeTip, heel, inside, outside, ankle, center, ankle]
+    pivotData={}
+    for pivot, pos in zip(FOOT_PIVOTS,pivot_pos):
+        pivotData[pivot]=tuple(float(value) for value in pos)
+    return pivotData
+
+
+def isolateFoot(points,ankle,ball,toe,scale=1.0,tree=None):
+    """Points of one foot out of a larger mesh: everything up to the ankle's height within scale times
+        the ankle to toe length of the ankle, ball or toe joint, that is also closer to those joints than to their mirror across x.
+        Keeps the leg, the other foot and the body out of the pivot search.
+
+    Args:
+        points (numpy.ndarray): (N,3) vertex positions
+        ankle (tuple): ankle joint position
+        ball (tuple): ball joint position
+        toe (tuple): toe joint position
+        scale (float, optional): search radius as a multiple of the ankle to toe length. Defaults to 1.0.
+        tree (KDTree, optional): index already built over points. Defaults to None.
+
+    Returns:
+        numpy.ndarray: (M,3) foot points, all of points if the search finds too few
+    """
+    points = vecArray.asPoints(points)
+    tree = tree or KDTree(points)
+    joints = np.array((ankle,ball,toe), dtype=float)
+    radius = vec.mag(vec.vector(ankle,toe)) * scale
+    foot = points[np.unique(np.concatenate(tree.queryRadius(joints,radius)))]
+    foot = foot[foot[:,1] <= joints[0,1]]
+    if abs(joints[:,0]).min() > 1e-3:
+        mirrored = joints * (-1.0,1.0,1.0)
+        foot = foot[KDTree(np.vstack((joints,mirrored))).closest(foot) < 3]
+    if len(foot) < 3:
+        return points
+    return foot
+
+
+def closestJoints(points,joints):
+    """Nearest joint to each point, from one position query of the joints
+
+    Args:
+        points (list | numpy.ndarray): one or more positions
+        joints (list): joint names
+
+    Returns:
+        list: joint name for each point
+    """
+    tree = KDTree(mc.xform(joints,q=1,t=1,ws=1))
+    return [joints[index] for index in tree.closest(points)]
+
+
+def getFootPivots(ankle_jnt,verts='',obj='',mode='axis',cache=None,isolate=False):
+    """calculates the location of where each foot pivot should be placed.
+    Vertex positions are read in one query and searched as arrays
 
     Args:
         ankle_jnt (str): name of ankle joint. Defaults to ''.
         verts (list, optional): list of vertices to check. Defaults to ''.
         obj (str, optional): name of geometry node. Defaults to ''.
+        mode (str, optional): 'axis' searches along world axes with +z forward,
+            'pca' measures in the foot's own frame, see findFootPivotsPCA. Defaults to 'axis'.
+        cache (PointCache | bool, optional): point cache for whole meshes, True for the shared cache. Defaults to None.
+        isolate (bool, optional): for whole meshes, only search points near this foot's joints,
+            see isolateFoot. Needs numpy. Whole body meshes give different pivots with it on. Defaults to False.
 
     Returns:
         dict: dictionary of pivot names and their positions
     """
     if not verts and not obj:
         raise ValueError('either vertices or geometry node needs to be provided')
-    #initialize
-    pivots= [
-        'toeUp', #0
-        'ball', #1
-        'toeTip', #2
-        'heel', #3
-        'inside', #4
-        'outside', #5
-        'ankle', #6
-        'center', #7
-        'offset' #8
-        ]
-
-    pivot_pos= []
+
     ball_jnt= getDescendent(ankle_jnt,1)
     toe_jnt= getDescendent(ankle_jnt,2)
+    joint_pos = mc.xform([ankle_jnt,ball_jnt,toe_jnt],q=1,t=1,ws=1)
+    ankle_pos, ball_pos, toe_pos = joint_pos[0:3], joint_pos[3:6], joint_pos[6:9]
+
+    points = getPoints(verts,obj,cache)
+    if not verts and isolate and vecArray.HAS_NUMPY:
+        points = isolateFoot(points,ankle_pos,ball_pos,toe_pos)
 
-    #if give a limited list, use that, and make a center from 
+    if mode == 'pca':
+        return findFootPivotsPCA(points,ankle_pos,ball_pos,toe_pos)
+    elif mode != 'axis':
+        raise ValueError('unknown foot pivot mode: {}'.format(mode))
+
+    #if given a limited list, use that, and make a center from it
+    #if given whole obj, search the verts around the ankle
     if isinstance(verts,list):
-        cluster = mc.cluster(verts)
-        center= mc.xform(cluster[1],q=1,rp=1,ws=1)
-        mc.delete(cluster)
-        #mc.select(selected)
-    #if given whole obj make a list of all the verts
-    #need to add support for telling different sides
-    elif obj:
-        center = mc.xform(ankle_jnt,q=1,t=1,ws=1)
-        vert_count = mc.polyEvaluate(obj,v=1)
-        verts=[]
-        for i in range(vert_count):
-            verts.append('{}.vtx[{}]'.format(obj,i))
-    #init pivot positions to center
-    for x in range(len(pivots)):
-        pivot_pos.append(center)
-    
-    #set ankle and offset
-    pivot_pos[6] = mc.xform(ankle_jnt,q=1,t=1,ws=1)
-    pivot_pos[-1] = mc.xform(ankle_jnt,q=1,t=1,ws=1)
-    #set ball and toeUp
-    pivot_pos[0] = mc.xform(ball_jnt,q=1,t=1,ws=1)
-    pivot_pos[1] = mc.xform(ball_jnt,q=1,t=1,ws=1)
-    #set toeTip
-    pivot_pos[2] = mc.xform(toe_jnt,q=1,t=1,ws=1)
-
-    #scrub points to find extremes
-    for vert in verts:
-        vert_pos = mc.xform(vert,q=1,t=1,ws=1)
-        #toe_tip
-        if vert_pos[2]>pivot_pos[2][2]:
-            if vert_pos[1]<pivot_pos[2][1]:
-                pivot_pos[2] = vert_pos
-        #heel
-        if vert_pos[2]<pivot_pos[3][2]:
-            if vert_pos[1]<pivot_pos[3][1]:
-                pivot_pos[3] = vert_pos
-        #inside
-        if abs(vert_pos[0]) < abs(pivot_pos[4][0]):
-            if vert_pos[1]<pivot_pos[4][1]:
-                pivot_pos[4]=vert_pos
-        #outside
-        if abs(vert_pos[0]) > abs(pivot_pos[5][0]):
-            if vert_pos[1]<pivot_pos[5][1]:
-                pivot_pos[5]=vert_pos
-        #lowestPoint
-        if vert_pos[1] <= pivot_pos[-2][1]:
-            pivot_pos[-2][1]=vert_pos[1]
-
-    #re-calculate center
-    #x=average of inside an doutside
-    center_x= (pivot_pos[4][0]+pivot_pos[5][0])/2
-    #y=center y because I jerry-rigged lowest point into here
-    center_y = pivot_pos[7][1]
-    #z=average toe to heel
-    center_z= (pivot_pos[2][2]+pivot_pos[3][2])/2
-    #set the center to the new values
-    pivot_pos[-2]=(center_x,center_y,center_z)
-    pivot_pos[4][1]= center_y
-    pivot_pos[5][1]= center_y
+        center = list(vecArray.centroid(points))
+    else:
+        center = list(ankle_pos)
+
+    extremes = findFootExtremes(points,toe_pos,center)
+    ground = extremes['lowest']
+    inside, outside = extremes['inside'], extremes['outside']
+    inside[1] = ground
+    outside[1] = ground
+
+    #x=average of inside and outside, y=lowest point, z=average toe to heel
+    center = ((inside[0]+outside[0])/2, ground, (extremes['toeTip'][2]+extremes['heel'][2])/2)
 
+    pivot_pos = [ball_pos, ball_pos, extremes['toeTip'], extremes['heel'],
+                inside, outside, ankle_pos, center, ankle_pos]
     pivotData={}
-    for pivot, pos in zip(pivots,pivot_pos):
-        pivotData[pivot]=pos
+    for pivot, pos in zip(FOOT_PIVOTS,pivot_pos):
+        pivotData[pivot]=tuple(pos)
     return pivotData
     
 
@@ -137,9 +365,9 @@ def makePivots(pivot_data,ankle_jnt,name=''):
 
     pivots=[]
 
-    for id,position in pivot_data:
+    for id,position in pivot_data.items():
         pivot_name = appendID(base_name,id)
-        pivot= mc.group(em=1,name=pivot_name)
+        pivot= trackCreated(mc.group(em=1,name=pivot_name))
         mc.xform(pivot,t=position,ws=1)
         pivots.append(pivot)
     return pivots
@@ -19,30 +19,159 @@ Description: Being Refactored
 """
 
 import re
+from collections import OrderedDict
+from functools import wraps
+from time import perf_counter
 import maya.cmds as mc
+import maya.api.OpenMaya as om
 
 from Utility.stringTools import getSegment,replaceSegment,appendID
+from Rigging.Utility.nameIndex import NameIndex,nodeExists,trackCreated,getActiveIndex
+from Rigging.Utility.registry import getUtilityRegistry,getSpaceRegistry,forgetRegistries,RegistryBatch
 import Utility.vectorMath as vec
 
-#ready | list based inputs do not work, but it does correctly wrap into a list?
-def organizeElement(nodes,typ='',clas='',rigType='character'):
-    """Sorts Rig nodes inside of the character rig group
+__activeOrganizer = None
+
+
+class ElementOrganizer(object):
+    """Collects rig nodes to sort into the character hierarchy and parents them in batches.
+        The character and rig root groups are made as soon as a character is seen, since builders parent into them directly.
+        Everything else waits for flush, which makes the missing groups and reparents with one mc.parent per destination group.
+        While open as a context manager each node's parent is recorded when it is queued,
+        nodes a builder has reparented since are left where the builder put them.
+        Nodes are kept by the name they were given, short names, partial or full paths.
+        Group existence is remembered per character for the life of the organizer.
+        Use as a context manager to collect every organizeElement call of a build, it flushes on exit.
 
     Args:
-        nodes (str | list): Nodes that require sorting
-        typ (str, optional): _description_. Defaults to ''.
-        clas (str, optional): _description_. Defaults to ''.
-        rigType (str, optional): _description_. Defaults to 'character'.
+        rigType (str, optional): rig type used in the character group name. Defaults to 'character'.
     """
-    if isinstance(nodes,(str)):
-        nodes = [nodes]
-        
-    for node in nodes:
+    def __init__(self, rigType='character'):
+        super(ElementOrganizer,self).__init__()
+        self.rigType = rigType
+        self._known = {}
+        self._groups = OrderedDict()
+        self._queue = OrderedDict()
+        self._deferring = False
+
+    def __enter__(self):
+        self._previous = getActiveOrganizer()
+        self._deferring = True
+        setActiveOrganizer(self)
+        return self
+
+    def __exit__(self, *args):
+        setActiveOrganizer(self._previous)
+        self._deferring = False
+        self.flush()
+        return False
+
+    def add(self, nodes, typ='', clas='', rigType=''):
+        """Queues nodes to be sorted on the next flush
+
+        Args:
+            nodes (str | list): Nodes that require sorting
+            typ (str, optional): typ group to sort into. Defaults to the node's typ segment.
+            clas (str, optional): class group to sort into. Defaults to the node's class segment.
+            rigType (str, optional): rig type used in the character group name. Defaults to the organizer's.
+        """
+        if isinstance(nodes,(str)):
+            nodes = [nodes]
+        #nothing can reparent a node before an organizer that is not deferring flushes
+        parents = self.__parents(nodes) if self._deferring else {}
+        for node in nodes:
+            roots, groups = self.__destination(node, typ, clas, rigType or self.rigType)
+            #the roots are parented into by other builders, so they can not wait
+            self.__makeGroups(roots)
+            for group in groups:
+                self._groups.setdefault(group[1], group)
+            self._queue.setdefault(groups[-1][1], OrderedDict())[node] = parents.get(node)
+
+    def flush(self):
+        """Makes missing groups and reparents every queued node"""
+        groups, self._groups = self._groups, OrderedDict()
+        queue, self._queue = self._queue, OrderedDict()
+        self.__makeGroups(groups.values())
+
+        nodes = [node for members in queue.values() for node in members]
+        if not nodes:
+            return
+        #one ls for every current parent so nodes already in place are left alone
+        parents = self.__parents(nodes)
+        for target, members in queue.items():
+            moving = [node for node, queued in members.items()
+                      if node in parents and parents[node] != target and queued in (None, parents[node])]
+            if moving:
+                mc.parent(moving, target)
+
+    def __parents(self, nodes):
+        """Current parent of each node with one ls, '' for world.
+            Nodes that are missing, or whose name matches more than one node, are left out.
+
+        Returns:
+            dict: parent by node name as given
+        """
+        #ls of an empty list lists the whole scene
+        if not nodes:
+            return {}
+        #every path ls returns, under each of its partial paths
+        matches = {}
+        for path in mc.ls(nodes, long=1) or []:
+            parts = path.split('|')
+            matches.setdefault(path, []).append(parts)
+            for count in range(1, len(parts)):
+                matches.setdefault('|'.join(parts[count:]), []).append(parts)
+        parents = {}
+        for node in nodes:
+            found = matches.get(node, [])
+            if len(found) == 1:
+                parts = found[0]
+                parents[node] = parts[-2] if len(parts) > 2 else ''
+        return parents
+
+    def forget(self, char):
+        """Drops the cached groups of a character. Call after its groups are deleted"""
+        self._known.pop(char, None)
+
+    def __exists(self, char, group):
+        known = self._known.setdefault(char, set())
+        if group in known:
+            return True
+        if nodeExists(group):
+            known.add(group)
+            return True
+        return False
+
+    def __makeGroups(self, groups):
+        """Makes the groups that do not exist yet, then parents them with one mc.parent per parent group.
+
+        Args:
+            groups (list): (char, group, parent, hidden) for each group
+        """
+        children = OrderedDict()
+        for char, group, parent, hidden in groups:
+            if self.__exists(char, group):
+                continue
+            trackCreated(mc.group(em=1,n=group))
+            self._known[char].add(group)
+            if hidden:
+                mc.setAttr('.'.join((group,'visibility')),0)
+            if parent:
+                children.setdefault(parent, []).append(group)
+        for parent, members in children.items():
+            mc.parent(members, parent)
+
+    def __destination(self, node, typ, clas, rigType):
+        """Group chain a node is sorted into, from the character group down.
+
+        Returns:
+            tuple: root and sorting groups as (char, group, parent, hidden), the node goes into the last group
+        """
         offset=0
+        #paths are sorted by the name of the node they lead to
+        node = node.rpartition('|')[2]
         char = getSegment(node,0)
         character_grp = '_'.join([char,rigType,'rig'])
-        if not mc.objExists(character_grp):
-            mc.group(em=1,name=character_grp)
 
         #if given a group, use typ and last id for name
         if getSegment(node,-1) == 'grp':
@@ -51,114 +180,156 @@ def organizeElement(nodes,typ='',clas='',rigType='character'):
             typ = getSegment(node,(-2+offset))
         if not clas:
             clas = getSegment(node,(-1+offset))
-        
+
         typ_grp= '_'.join([char,typ,clas,'grp'])
         class_grp= '_'.join([char, clas,'grp'])
         rig_root= '_'.join([char,'rig','grp'])
-        
-        #cntls live outside of the rig for ease of access
-        if clas== 'cntl':
-            rig_root= character_grp
 
         #just a special case to deal with constraints
         #maybe add a typ group for different types of constraints
         if 'constraint' in node.lower():
             class_grp = '_'.join((char,'constraint','grp'))
             typ_grp = '_'.join((char, getSegment(node,(-3)),'constraint','grp'))
-            if not mc.objExists(class_grp):
-                if not mc.objExists(rig_root):
-                    mc.parent(mc.group(em=1,n=rig_root),character_grp)
-                    mc.setAttr('.'.join((rig_root,'visibility')),0)
-                mc.parent(mc.group(em=1,n=class_grp),rig_root)
-            if not mc.objExists(typ_grp):
-                mc.parent(mc.group(em=1,n=typ_grp),class_grp)
-            mc.parent(node,w=1)
-            mc.parent(node,typ_grp)
-            return
 
-        #series of checks and sorting
-        if not mc.objExists(typ_grp):
-            mc.parent(node,mc.group(em=1,n=typ_grp))
-        else:
-            if getParent(node,1) != None:
-                mc.parent(node,w=1)
-            mc.parent(node,typ_grp)
-            return
+        #cntls live outside of the rig for ease of access
+        elif clas== 'cntl':
+            return [(char,character_grp,'',0)], [(char,class_grp,character_grp,0), (char,typ_grp,class_grp,0)]
 
-        if not mc.objExists(class_grp):
-            mc.parent(typ_grp,mc.group(em=1,n=class_grp))
-        else:
-            mc.parent(typ_grp,class_grp)
-            return
+        return ([(char,character_grp,'',0), (char,rig_root,character_grp,1)],
+                [(char,class_grp,rig_root,0), (char,typ_grp,class_grp,0)])
 
-        if not mc.objExists(rig_root):
-            mc.parent(class_grp,mc.group(em=1,n=rig_root))
-            mc.setAttr('.'.join((rig_root,'visibility')),0)
-            mc.parent(rig_root,character_grp)
-        else:
-            mc.parent(class_grp,rig_root)
+
+def getActiveOrganizer():
+    return __activeOrganizer
+
+
+def setActiveOrganizer(organizer):
+    """Sets the organizer organizeElement defers to. None sorts right away
+
+    Args:
+        organizer (ElementOrganizer | None): organizer to activate
+    """
+    global __activeOrganizer
+    __activeOrganizer = organizer
+
+
+def deferOrganize(function):
+    """Decorator that collects every organizeElement call made while function runs and sorts them in one batch.
+        Utility registrations are held and written once as well. Nested builders share the outermost batch.
+        The outermost builder also activates a NameIndex, built with one ls, unless one is already active,
+        so existence checks and name allocation during the build are answered in memory.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if __activeOrganizer is not None:
+            return function(*args, **kwargs)
+        with getActiveIndex() or NameIndex(), ElementOrganizer(), RegistryBatch():
+            return function(*args, **kwargs)
+    return wrapper
+
+
+#ready
+def organizeElement(nodes,typ='',clas='',rigType='character'):
+    """Sorts Rig nodes inside of the character rig group.
+        Sorting is deferred while an ElementOrganizer is active, otherwise it happens right away
+
+    Args:
+        nodes (str | list): Nodes that require sorting
+        typ (str, optional): typ group to sort into. Defaults to the node's typ segment.
+        clas (str, optional): class group to sort into. Defaults to the node's class segment.
+        rigType (str, optional): rig type used in the character group name. Defaults to 'character'.
+    """
+    if __activeOrganizer is not None:
+        __activeOrganizer.add(nodes,typ,clas,rigType)
+        return
+    organizer = ElementOrganizer(rigType)
+    organizer.add(nodes,typ,clas)
+    organizer.flush()
     return
 
 
-def deleteRig(char):
+def deleteRig(char,fast=False):
     """
     deletes everything in the char_rig_grp and all utility nodes.
     Unsure why I had to step though and checking existence-- test edge cases
+    fast mode works out the nodes in memory, skips nodes under another deleted node,
+    and deletes them in one command with undo disabled, which flushes the undo queue. It reports to the script editor and returns what it did
+
+    Args:
+        char (str): character segment
+        fast (bool, optional): single delete with undo disabled. Defaults to False.
+
+    Returns:
+        dict: with fast, requested, existing and deleted node counts and seconds taken
     """
-    nodes=[]
     rig_grp= '_'.join([char,'rig','grp'])
     cntl_grp= '_'.join([char,'cntl','grp'])
-    utility_grp = '_'.join((char,'utility','grp'))
-    if mc.objExists(utility_grp):
-        if  mc.listAttr(utility_grp,st='utilityList'):
-            utility_list = mc.getAttr('.'.join((utility_grp,'utilityList')),asString=1)
-            nodes = utility_list.split(',')
-    if mc.objExists(cntl_grp):
-        nodes.append(cntl_grp)
-    if mc.objExists(rig_grp):
-        nodes.append(rig_grp)
+    nodes = getUtilityRegistry(char).nodes()
+    report = None
+    if fast:
+        report = __teardown(nodes + [cntl_grp, rig_grp])
+    else:
+        if mc.objExists(cntl_grp):
+            nodes.append(cntl_grp)
+        if mc.objExists(rig_grp):
+            nodes.append(rig_grp)
+
+        for node in nodes:
+            if mc.objExists(node):
+                mc.delete(node)
+    #deleted groups take their children with them, so re-read the scene
+    if getActiveIndex() is not None:
+        getActiveIndex().rebuild()
+    if getActiveOrganizer() is not None:
+        getActiveOrganizer().forget(char)
+    forgetRegistries(char)
+    return report
+
+
+def __teardown(nodes):
+    """Deletes nodes with one ls and one delete, undo disabled and its queue flushed
+
+    Args:
+        nodes (list): node names, missing ones are ignored
 
-    for node in nodes:
-        if mc.objExists(node):
-            mc.delete(node)
+    Returns:
+        dict: requested, existing and deleted node counts and seconds taken
+    """
+    start = perf_counter()
+    existing = mc.ls(list(OrderedDict.fromkeys(nodes)),long=1) or []
+    #a parent's delete takes its descendants, shortest paths first so parents are seen before children
+    roots = set()
+    for path in sorted(existing, key=lambda path: path.count('|')):
+        parts = path.split('|')
+        if not any('|'.join(parts[:i]) in roots for i in range(2,len(parts))):
+            roots.add(path)
+
+    #turning undo off flushes the queue, nothing is left referring to the deleted nodes
+    undo = mc.undoInfo(q=1,state=1)
+    mc.undoInfo(state=0)
+    try:
+        if roots:
+            mc.delete(sorted(roots))
+    finally:
+        mc.undoInfo(state=undo)
+
+    report = {'requested':len(nodes), 'existing':len(existing), 'deleted':len(roots),
+              'seconds':perf_counter()-start}
+    om.MGlobal.displayInfo('deleteRig: removed {deleted} of {requested} nodes ({existing} found) in {seconds:.3f}s'.format(**report))
+    return report
 
 
 def createUtility(nodeType,name):
     """
-    creates a utility node and appends it to a list for easy clean up later
+    creates a utility node and registers it with its character for easy clean up later
     name needs to be established in full before call
     returns node name
     """
     #don't do anything if it already exists--maybe change later?
-    if mc.objExists(name):
+    if nodeExists(name):
         return name
-    #make the new node and names
-    else:
-        mc.createNode(nodeType,n=name)
-        char = getSegment(name,0)
-        utility_grp = '_'.join((char,'utility','grp'))
-        utility_list_attr = '.'.join((utility_grp,'utilityList'))
-    
-    #adds a utility tracking attr if need be
-    if not mc.objExists(utility_grp):
-        rig_root_grp = '_'.join((char,'rig','grp'))
-        mc.group(em=1,n=utility_grp)
-        presel = mc.ls(selection=1)
-        mc.select(utility_grp)
-        mc.addAttr(ln='utilityList',dt='string')
-        mc.parent(utility_grp,rig_root_grp)
-        mc.select(presel)
-    
-    #adds a tracking variable if need be
-    if not mc.listAttr(utility_grp,st='utilityList'):
-        mc.addAttr(ln='utilityList',at='string',dv=utility_grp,s=1)
-    
-    #append new node to list, or 
-    current_list = mc.getAttr(utility_list_attr,asString=1)
-    if not current_list:
-        mc.setAttr(utility_list_attr, name, type='string')
-    else:
-        mc.setAttr(utility_list_attr,','.join((current_list,name)), type='string')
+    trackCreated(mc.createNode(nodeType,n=name))
+    getUtilityRegistry(getSegment(name,0)).register(name)
     return name
 
 
@@ -187,33 +358,100 @@ def getSpace(targets):
     """
     if isinstance(targets,str):
         targets = [targets]
+    return makeSpaces([(replaceSegment(target,-1, 'space'),target) for target in targets])
 
-    spaces= []
-    for target in targets:
-        space_name = replaceSegment(target,-1, 'space')
-        if mc.objExists(space_name):
-            spaces.append(space_name)
-        else:
-            #get names
-            char = getSegment(target,0)
-            space = mc.group(em=1,n=space_name)
-            space_grp = '_'.join((char,'space','grp'))
-            rig_grp = '_'.join((char,'rig','grp'))
-            
-            if not mc.objExists(space_grp):
-                space_grp = mc.group(em=1,n=space_grp)
-                mc.parent(space_grp,rig_grp)
-
-            mc.parent(space, space_grp)
-            addDriver(target,space,'parent',mo=0)
+
+def makeSpaces(definitions):
+    """Returns the spaces for many definitions at once, creating the missing ones.
+        A space with several targets follows their blend. Spaces are looked up by targets in the character's
+        space registry, new ones are parented with one mc.parent per character and driven with one addDrivers call.
+
+    Args:
+        definitions (list): (name, targets) or (name, targets, weights) tuples,
+            targets being a node or a list of nodes, weights one per target
+
+    Returns:
+        list: space name for each definition
+    """
+    spaces = []
+    registries = {}
+    created = OrderedDict()
+    drivers = []
+    with RegistryBatch():
+        for definition in definitions:
+            space_name, targets = definition[0], definition[1]
+            if isinstance(targets,str):
+                targets = [targets]
+            weights = definition[2] if len(definition) > 2 else [1]*len(targets)
+            char = getSegment(space_name,0)
+            if char not in registries:
+                registries[char] = __spaceRegistry(char)
+                __spaceGroup(char)
+            registry = registries[char]
+
+            space = registry.getSpace(targets)
+            if space is None and space_name in registry:
+                #made before the registry, known by name only
+                space = space_name
+                registry.register(space,targets)
+            if space is not None:
+                spaces.append(space)
+                continue
+
+            space = trackCreated(mc.group(em=1,n=space_name))
+            created.setdefault(char,[]).append(space)
+            drivers.extend((target,space,'parent',{'mo':0,'w':weight}) for target, weight in zip(targets,weights))
+            registry.register(space,targets)
             spaces.append(space)
 
+        for char, members in created.items():
+            mc.parent(members,'_'.join((char,'space','grp')))
+        if drivers:
+            addDrivers(drivers)
     return spaces
 
 
 def getSpaceList(char):
+    return __spaceRegistry(char).spaces()
+
+
+def getControlSpaces(control):
+    """Spaces registered for a control, see assignSpaces
+
+    Args:
+        control (str): control name
+
+    Returns:
+        list: space names
+    """
+    return __spaceRegistry(getSegment(control,0)).getControlSpaces(control)
+
+
+def assignSpaces(control,spaces):
+    """Records spaces a control can follow in its character's space registry
+
+    Args:
+        control (str): control name
+        spaces (str | list): space names
+    """
+    __spaceRegistry(getSegment(control,0)).assign(control,spaces)
+
+
+def __spaceGroup(char):
     space_grp = '_'.join((char,'space','grp'))
-    return mc.listRelatives(space_grp,ad=1)
+    if not nodeExists(space_grp):
+        rig_grp = '_'.join((char,'rig','grp'))
+        trackCreated(mc.group(em=1,n=space_grp))
+        mc.parent(space_grp,rig_grp)
+    return space_grp
+
+
+def __spaceRegistry(char):
+    """The character's space registry, emptied if its space group is gone so deleted spaces are not handed out"""
+    registry = getSpaceRegistry(char)
+    if not nodeExists('_'.join((char,'space','grp'))):
+        registry.reset()
+    return registry
 
 
 #lazy way to get rig space (acts as world)    
@@ -222,20 +460,8 @@ def getRigSpace(char):
     returns what is essentially a sudo-world space grp
     """
     rig_space = '_'.join((char,'rig','space'))
-    
-    if mc.objExists(rig_space):
-        return rig_space
-    else:
-        mc.group(em=1,n=rig_space)
-        space_grp = '_'.join((char,'space','grp'))
-        rig_grp = '_'.join((char,'rig','grp'))
-        
-        if not mc.objExists(space_grp):
-            space_grp = mc.group(em=1,n=space_grp)
-            mc.parent(space_grp,rig_grp)
-        mc.parent(rig_space, space_grp)
-        addDriver(rig_grp,rig_space,'parent',mo=0)
-        return rig_space
+    rig_grp = '_'.join((char,'rig','grp'))
+    return makeSpaces([(rig_space,rig_grp)])[0]
 
 
 def getRootGrp(node):
@@ -260,12 +486,37 @@ def hideAttrs(node,pattern):
             mc.setAttr(target, k=value)
 
 
+DRIVER_BACKENDS = ('constraint','matrix')
+MATRIX_DRIVER_TYPES = ('parent','point','orient')
+DRIVER_OPTIONS = ('skipRotation','skipTranslate','mo','aimAxis','upAxis','w','backend')
+
+__driverBackend = 'constraint'
+
+
+def getDriverBackend():
+    return __driverBackend
+
+
+def setDriverBackend(backend):
+    """Sets the backend addDriver uses when a call does not pick one
+
+    Args:
+        backend (str): 'constraint' or 'matrix'
+    """
+    global __driverBackend
+    if backend not in DRIVER_BACKENDS:
+        raise ValueError('unknown driver backend: {}'.format(backend))
+    __driverBackend = backend
+
+
 # TODO debug
 def addDriver(driver,driven,typ='parent',skipRotation='none',
-    skipTranslate='none',mo=1, aimAxis='x+',upAxis='y+',w=1):
+    skipTranslate='none',mo=1, aimAxis='x+',upAxis='y+',w=1,backend=None):
     """connects two node via constraint, 
     adds as an additional influence if that type of constraint already exists \n
     returns constraint 
+    The matrix backend builds parent, point and orient drivers from matrix nodes instead, see addMatrixDriver.
+    Skipped channels, aim and pv always use constraints.
 
     Args:
         driver (str): influencing node
@@ -277,35 +528,279 @@ def addDriver(driver,driven,typ='parent',skipRotation='none',
         aimAxis (str, optional): forward axis for aim constraints. Defaults to 'x+'.
         upAxis (str, optional): up axis for aim constraints. Defaults to 'y+'.
         w (int, optional): default weight for new constraint influence. Defaults to 1.
+        backend (str, optional): 'constraint' or 'matrix'. Defaults to the global backend, see setDriverBackend.
 
     Returns:
-        str: name of constraint
+        str: name of constraint, or of the weight node for matrix drivers
     """
-    constraints = []
+    backend = backend or __driverBackend
+    if backend not in DRIVER_BACKENDS:
+        raise ValueError('unknown driver backend: {}'.format(backend))
     typ = typ.lower()
+    if backend == 'matrix' and typ in MATRIX_DRIVER_TYPES and skipRotation == 'none' and skipTranslate == 'none':
+        return addMatrixDriver(driver,driven,typ,mo=mo,w=w)
+
+    constraint = __constrain([driver],driven,typ,skipRotation,skipTranslate,mo,aimAxis,upAxis,w)
+    trackCreated(constraint)
+    organizeElement(constraint)
+    #constraints.append(constraint)
+
+    #just add it and if it's parent isn'the constrains folder, move it to constrains folder
+
+    return constraint
+
+
+def __constrain(drivers,driven,typ,skipRotation='none',skipTranslate='none',mo=1,aimAxis='x+',upAxis='y+',w=1):
+    """Runs one constraint command for any number of drivers of a single driven. Returns the constraint"""
+    targets = list(drivers) + [driven]
     #switch for type of constraint
     #need buffer to accomidate None returns
     #constraints = list(set(mc.listConnections(driven,type='constraint')))
     if typ == 'parent':
-        constraint = mc.parentConstraint( driver, driven,sr=skipRotation, w=w, mo=mo)[0]
+        constraint = mc.parentConstraint(*targets,sr=skipRotation, w=w, mo=mo)[0]
     elif typ == 'orient':
-        constraint = mc.orientConstraint( driver, driven,skip=skipRotation, w=w, mo=mo)[0]
+        constraint = mc.orientConstraint(*targets,skip=skipRotation, w=w, mo=mo)[0]
     elif typ == 'pv':
-        constraint = mc.poleVectorConstraint(driver, driven, w=w)[0]
+        constraint = mc.poleVectorConstraint(*targets, w=w)[0]
     elif typ == 'point':
-        constraint = mc.pointConstraint(driver, driven, skip=skipTranslate, w=w, mo=mo)[0]
+        constraint = mc.pointConstraint(*targets, skip=skipTranslate, w=w, mo=mo)[0]
     elif typ == 'aim':
         if isinstance(aimAxis, str):
             aimAxis= vec.getAxis(aimAxis)
         if isinstance(upAxis,str):
             upAxis= vec.getAxis(upAxis)
-        constraint = mc.aimConstraint(driver, driven, skip=skipRotation, aim=aimAxis, upVector=upAxis, w=w, mo=mo)[0]
-    else: 
-        pass
-    organizeElement(constraint)
-    #constraints.append(constraint)
+        constraint = mc.aimConstraint(*targets, skip=skipRotation, aim=aimAxis, upVector=upAxis, w=w, mo=mo)[0]
+    else:
+        raise ValueError('unknown constraint type: {}'.format(typ))
+    return constraint
 
-    #just add it and if it's parent isn'the constrains folder, move it to constrains folder
 
-    return constraint
+def addDrivers(pairs,backend=None):
+    """Bulk addDriver. Pairs sharing a driven, type and options become one constraint command listing every driver,
+        weights that differ from the group's first are set after. All constraints are sorted in one organizeElement call.
+
+    Args:
+        pairs (list): (driver, driven), (driver, driven, typ) or (driver, driven, typ, options) tuples,
+            where options is a dict of addDriver keywords, backend included
+        backend (str, optional): 'constraint' or 'matrix'. Defaults to the global backend, see setDriverBackend.
+
+    Returns:
+        dict: list of constraints, or weight nodes, for each driven, one per type and option set
+    """
+    backend = backend or __driverBackend
+    groups = OrderedDict()
+    for pair in pairs:
+        driver, driven = pair[0], pair[1]
+        typ = (pair[2] if len(pair) > 2 else 'parent').lower()
+        options = dict(pair[3]) if len(pair) > 3 else {}
+        unknown = set(options) - set(DRIVER_OPTIONS)
+        if unknown:
+            raise ValueError('unknown addDriver options: {}'.format(sorted(unknown)))
+        weight = options.pop('w',1)
+        pairBackend = options.pop('backend',None) or backend
+        if pairBackend not in DRIVER_BACKENDS:
+            raise ValueError('unknown driver backend: {}'.format(pairBackend))
+        #list values, such as axes and skipped channels, are made hashable for grouping
+        options = tuple(sorted((name, tuple(value) if isinstance(value,(list,tuple)) else value)
+                               for name, value in options.items()))
+        groups.setdefault((driven, typ, pairBackend, options), []).append((driver, weight))
+
+    results = OrderedDict()
+    constraints = []
+    for (driven, typ, backend, options), drivers in groups.items():
+        options = dict(options)
+        skipped = options.get('skipRotation','none') != 'none' or options.get('skipTranslate','none') != 'none'
+        if backend == 'matrix' and typ in MATRIX_DRIVER_TYPES and not skipped:
+            for driver, weight in drivers:
+                node = addMatrixDriver(driver,driven,typ,mo=options.get('mo',1),w=weight)
+        else:
+            names = [driver for driver, weight in drivers]
+            node = trackCreated(__constrain(names,driven,typ,w=drivers[0][1],**options))
+            if any(weight != drivers[0][1] for driver, weight in drivers):
+                for plug, (driver, weight) in zip(getDriverWeights(node)[-len(drivers):], drivers):
+                    mc.setAttr(plug,weight)
+            if node not in constraints:
+                constraints.append(node)
+
+        nodes = results.setdefault(driven, [])
+        if node not in nodes:
+            nodes.append(node)
+
+    if constraints:
+        organizeElement(constraints)
+    return results
+
+
+def addMatrixDriver(driver,driven,typ='parent',mo=1,w=1):
+    """Drives a node from matrix nodes instead of a constraint, adding an influence if the driven already has one.
+        Each driver's world matrix, after a static offset when mo is on, feeds a blendMatrix,
+        then the blend is taken into the driven's parent space.
+        Each driver's world matrix is picked down to the translation and rotation typ uses, without scale or shear,
+        so like a constraint, scaling a driver does not scale the driven.
+        parent drives offsetParentMatrix, with the driven's current local matrix folded out so its channels are kept.
+        point and orient decompose into translate or rotate, with the driven's current offsetParentMatrix folded out.
+        The first driver is the blend's input and every later one a target. Its weightIn attribute holds one weight
+        per driver, and each target blends by its weight over the sum of its own and every earlier weight.
+        Rotations are slerped and translations interpolated, so two drivers blend like a constraint's average.
+        Static weights are normalized like constraint weights. Connected weights are used as given, so should sum to 1,
+        as enableInverseBlend's do. Needs Maya 2020 or later.
+
+    Args:
+        driver (str): influencing node
+        driven (str): influenced node
+        typ (str, optional): 'parent', 'point' or 'orient'. Defaults to 'parent'.
+        mo (int, optional): whether to maintain offset or not. Defaults to 1.
+        w (int, optional): weight for the new influence. Defaults to 1.
+
+    Returns:
+        str: name of the blendMatrix node, whose weightIn plugs stand in for constraint weights
+    """
+    if typ not in MATRIX_DRIVER_TYPES:
+        raise ValueError('matrix drivers support {}, not {}'.format(MATRIX_DRIVER_TYPES,typ))
+    base = '_'.join((driven,typ+'Driver'))
+    blend = '_'.join((base,'blend','util'))
+    if not nodeExists(blend):
+        __makeMatrixDriver(driven,typ,base,blend)
+
+    index = len(mc.getAttr('.'.join((blend,'driverWeight')),mi=1) or [])
+    driverMatrix = mc.getAttr('.'.join((driver,'worldMatrix[0]')))
+    pick = createUtility('pickMatrix','_'.join((base,str(index),'pick','util')))
+    mc.setAttr('.'.join((pick,'useTranslate')), typ != 'orient')
+    mc.setAttr('.'.join((pick,'useRotate')), typ != 'point')
+    mc.setAttr('.'.join((pick,'useScale')), 0)
+    mc.setAttr('.'.join((pick,'useShear')), 0)
+    mc.connectAttr('.'.join((driver,'worldMatrix[0]')),'.'.join((pick,'inputMatrix')))
+    source = '.'.join((pick,'outputMatrix'))
+
+    offset = vec.identityMatrix()
+    if mo:
+        drivenMatrix = mc.getAttr('.'.join((driven,'worldMatrix[0]')))
+        offset = __matrixDriverOffset(driverMatrix,drivenMatrix,typ)
+    target = createUtility('multMatrix','_'.join((base,str(index),'mult','util')))
+    mc.setAttr('.'.join((target,'matrixIn[0]')),offset,type='matrix')
+    mc.connectAttr(source,'.'.join((target,'matrixIn[1]')))
+
+    if not index:
+        mc.connectAttr('.'.join((target,'matrixSum')),'.'.join((blend,'inputMatrix')))
+    else:
+        __addBlendTarget(blend,base,index,'.'.join((target,'matrixSum')))
+    mc.setAttr('{}.driverWeight[{}]'.format(blend,index),w)
+    __normalizeMatrixWeights(blend)
+    return blend
+
+
+def __addBlendTarget(blend,base,index,matrix):
+    """Adds a driver as a blend target, weighted by its weightIn over the sum of its own and every earlier weightIn"""
+    total = createUtility('plusMinusAverage','_'.join((base,str(index),'total','util')))
+    for count in range(index+1):
+        mc.connectAttr('{}.weightIn[{}]'.format(blend,count),'{}.input1D[{}]'.format(total,count))
+    #keeps an all zero blend on the first driver rather than dividing by zero
+    mc.setAttr('{}.input1D[{}]'.format(total,index+1),1e-6)
+    ratio = createUtility('multiplyDivide','_'.join((base,str(index),'ratio','util')))
+    mc.setAttr('.'.join((ratio,'operation')),2)
+    mc.connectAttr('{}.weightIn[{}]'.format(blend,index),'.'.join((ratio,'input1X')))
+    mc.connectAttr('.'.join((total,'output1D')),'.'.join((ratio,'input2X')))
+    mc.connectAttr('.'.join((ratio,'outputX')),'{}.target[{}].weight'.format(blend,index-1))
+    mc.connectAttr(matrix,'{}.target[{}].targetMatrix'.format(blend,index-1))
+
+
+def __makeMatrixDriver(driven,typ,base,blend):
+    """Makes the blend node and the nodes taking its output into the driven's channels"""
+    createUtility('blendMatrix',blend)
+    mc.addAttr(blend,ln='driverWeight',at='double',m=1)
+    mc.addAttr(blend,ln='weightIn',at='double',m=1)
+    local = createUtility('multMatrix','_'.join((base,'local','util')))
+    parentInverse = '.'.join((driven,'parentInverseMatrix[0]'))
+    if typ == 'parent':
+        #the driven's own channels still apply under offsetParentMatrix, so take them back out
+        current = mc.getAttr('.'.join((driven,'matrix')))
+        mc.setAttr('.'.join((local,'matrixIn[0]')),vec.matrixInverse(current),type='matrix')
+        mc.connectAttr('.'.join((blend,'outputMatrix')),'.'.join((local,'matrixIn[1]')))
+        mc.connectAttr(parentInverse,'.'.join((local,'matrixIn[2]')))
+        mc.connectAttr('.'.join((local,'matrixSum')),'.'.join((driven,'offsetParentMatrix')),f=1)
+        return
+
+    mc.connectAttr('.'.join((blend,'outputMatrix')),'.'.join((local,'matrixIn[0]')))
+    mc.connectAttr(parentInverse,'.'.join((local,'matrixIn[1]')))
+    #translate and rotate sit under offsetParentMatrix, so take it back out
+    if mc.attributeQuery('offsetParentMatrix',node=driven,exists=1):
+        offsetParent = '.'.join((driven,'offsetParentMatrix'))
+        if mc.listConnections(offsetParent,s=1,d=0):
+            raise ValueError('{} has a connected offsetParentMatrix, {} matrix drivers need a static one'.format(driven,typ))
+        mc.setAttr('.'.join((local,'matrixIn[2]')),vec.matrixInverse(mc.getAttr(offsetParent)),type='matrix')
+    decompose = createUtility('decomposeMatrix','_'.join((base,'decompose','util')))
+    if typ == 'point':
+        mc.connectAttr('.'.join((local,'matrixSum')),'.'.join((decompose,'inputMatrix')))
+        mc.connectAttr('.'.join((decompose,'outputTranslate')),'.'.join((driven,'translate')),f=1)
+        return
+
+    #joint rotation sits inside jointOrient, so remove the orient before decomposing
+    if mc.attributeQuery('jointOrient',node=driven,exists=1):
+        jointOrient = vec.eulerToMatrix(mc.getAttr('.'.join((driven,'jointOrient')))[0])
+        mc.setAttr('.'.join((local,'matrixIn[3]')),vec.matrixInverse(jointOrient),type='matrix')
+    mc.connectAttr('.'.join((local,'matrixSum')),'.'.join((decompose,'inputMatrix')))
+    mc.connectAttr('.'.join((driven,'rotateOrder')),'.'.join((decompose,'inputRotateOrder')))
+    mc.connectAttr('.'.join((decompose,'outputRotate')),'.'.join((driven,'rotate')),f=1)
+
+
+def __matrixDriverOffset(driverMatrix,drivenMatrix,typ):
+    """Static matrix placed before a driver's picked world matrix so the driven holds its current world placement.
+        point and orient compare the picked parts of both matrices, parent keeps the driven's whole world matrix
+    """
+    driverMatrix = __pickMatrix(driverMatrix,typ)
+    if typ != 'parent':
+        drivenMatrix = __pickMatrix(drivenMatrix,typ)
+    return vec.matrixMult(drivenMatrix,vec.matrixInverse(driverMatrix))
+
+
+def __pickMatrix(matrix,typ):
+    """The translation and rotation of a world matrix a matrix driver's pickMatrix keeps for typ"""
+    translate, rotate, scale = vec.decomposeMatrix(matrix)
+    return vec.composeMatrix(translate=translate if typ != 'orient' else (0,0,0),
+                             rotate=rotate if typ != 'point' else (0,0,0))
+
+
+def __normalizeMatrixWeights(blend):
+    """Sets every unconnected weightIn to its driverWeight over the sum of all driverWeights"""
+    indices = mc.getAttr('.'.join((blend,'driverWeight')),mi=1) or []
+    weights = [mc.getAttr('{}.driverWeight[{}]'.format(blend,index)) for index in indices]
+    total = sum(weights) or 1.0
+    for index, weight in zip(indices,weights):
+        plug = '{}.weightIn[{}]'.format(blend,index)
+        if not mc.listConnections(plug,s=1,d=0):
+            mc.setAttr(plug,weight/total)
+
+
+def getDriverWeights(node):
+    """Weight plugs of a constraint, or of a matrix driver's weight node, in influence order
+
+    Args:
+        node (str): constraint or blendMatrix node returned by addDriver
+
+    Returns:
+        list: attribute paths
+    """
+    if mc.nodeType(node) == 'blendMatrix':
+        indices = mc.getAttr('.'.join((node,'driverWeight')),mi=1) or []
+        return ['{}.weightIn[{}]'.format(node,index) for index in indices]
+    #constraint commands share their node type's name
+    weights = getattr(mc,mc.nodeType(node),mc.parentConstraint)(node,q=1,wal=1)
+    return ['.'.join((node,weight)) for weight in weights]
+
+
+def getDriverNodes(driven):
+    """Constraints and matrix driver weight nodes driving a node
+
+    Args:
+        driven (str): influenced node
+
+    Returns:
+        list: constraint and blendMatrix names
+    """
+    drivers = list(set(mc.listConnections(driven,type='constraint') or []))
+    for typ in MATRIX_DRIVER_TYPES:
+        blend = '_'.join((driven,typ+'Driver','blend','util'))
+        if nodeExists(blend):
+            drivers.append(blend)
+    return drivers
 
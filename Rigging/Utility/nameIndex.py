@@ -0,0 +1,358 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Rigging.Utility
+
+Description: In-memory index of scene node names.
+    Built from a single ls and kept current by the toolkit as it creates, renames and deletes nodes,
+    so existence checks and segment queries are answered without a command round trip.
+    While an index is active, builders check nodeExists instead of mc.objExists.
+    Builders decorated with deferOrganize activate an index for the length of the outermost build.
+    NameAllocator hands out conflict free names, remembering the highest conflict ID used per base name.
+    The cmds module can be swapped for a stand-in for use outside of Maya.
+
+"""
+
+try:
+    import maya.cmds as mc
+except ImportError:
+    mc = None
+
+from Utility.stringTools import parseName,appendID
+
+INDEXED_SEGMENTS = ('char','typ','name','side','clas')
+
+__activeIndex = None
+
+
+class NameIndex(object):
+    """Hash map index of node names by segment.
+        Use as a context manager to make it the active index for a build.
+
+    Args:
+        cmds (module, optional): maya.cmds or a stand-in providing ls. Defaults to maya.cmds.
+    """
+    def __init__(self, cmds=None):
+        super(NameIndex,self).__init__()
+        self.cmds = cmds or mc
+        self.allocator = NameAllocator(self.exists)
+        self.rebuild()
+
+    def __contains__(self, name):
+        return name.rpartition('|')[2] in self._nodes
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __enter__(self):
+        self._previous = getActiveIndex()
+        setActiveIndex(self)
+        return self
+
+    def __exit__(self, *args):
+        setActiveIndex(self._previous)
+        return False
+
+    def rebuild(self):
+        """Clears the index and refills it with one ls of the scene"""
+        self._nodes = {}
+        self._segments = dict((segment, {}) for segment in INDEXED_SEGMENTS)
+        self.allocator.reset()
+        self.add(self.cmds.ls())
+
+    def exists(self, name):
+        return name in self
+
+    def add(self, names):
+        """Adds nodes to the index
+
+        Args:
+            names (str | list): node names or paths
+        """
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            name = name.rpartition('|')[2]
+            if name in self._nodes:
+                self._nodes[name] += 1
+                continue
+            self._nodes[name] = 1
+            for segment, value in self.__segmentValues(name):
+                self._segments[segment].setdefault(value, set()).add(name)
+
+    def discard(self, names):
+        """Removes nodes from the index, ignoring names that are not indexed
+
+        Args:
+            names (str | list): node names or paths
+        """
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            name = name.rpartition('|')[2]
+            count = self._nodes.get(name, 0)
+            if count > 1:
+                self._nodes[name] = count - 1
+                continue
+            elif not count:
+                continue
+            del self._nodes[name]
+            for segment, value in self.__segmentValues(name):
+                matches = self._segments[segment][value]
+                matches.discard(name)
+                if not matches:
+                    del self._segments[segment][value]
+
+    def rename(self, old, new):
+        self.discard(old)
+        self.add(new)
+
+    def find(self, char=None, typ=None, name=None, side=None, clas=None):
+        """Returns the indexed nodes matching every segment given.
+            e.g. find(char='RBT', side='L', clas='cntl')
+
+        Args:
+            char (str, optional): character segment
+            typ (str, optional): typ segment
+            name (str, optional): name segment
+            side (str, optional): side segment
+            clas (str, optional): class segment
+
+        Returns:
+            list: sorted node names
+        """
+        query = (('char',char), ('typ',typ), ('name',name), ('side',side), ('clas',clas))
+        matches = None
+        for segment, value in query:
+            if value is None:
+                continue
+            found = self._segments[segment].get(value)
+            if not found:
+                return []
+            matches = set(found) if matches is None else matches & found
+            if not matches:
+                return []
+        if matches is None:
+            matches = self._nodes
+        return sorted(matches)
+
+    def __segmentValues(self, name):
+        """Yields (segment, value) pairs for every indexed segment the name has.
+            Positional segments are only indexed when they are not also the class segment.
+        """
+        segments = parseName(name).segments
+        count = len(segments)
+        if count < 2:
+            return
+        for index, segment in enumerate(INDEXED_SEGMENTS[:-1]):
+            if index >= count - 1:
+                break
+            yield segment, segments[index]
+        yield 'clas', segments[-1]
+
+
+class NameAllocator(object):
+    """Hands out names that are free in the scene and not already handed out.
+        Conflicting names get a numbered ID, continuing from the highest ID this allocator has used for that base,
+        so a name normally costs a single existence check. Bases it has not seen are probed in doubling steps.
+
+    Args:
+        exists (function, optional): existence check for a node name. Defaults to nodeExists.
+    """
+    def __init__(self, exists=None):
+        super(NameAllocator,self).__init__()
+        self.exists = exists or nodeExists
+        self.reset()
+
+    def reset(self):
+        """Forgets reserved names and conflict IDs. Call after nodes are deleted"""
+        self._highest = {}
+        self._reserved = set()
+
+    def isFree(self, name):
+        return name not in self._reserved and not self.exists(name)
+
+    def reserve(self, names):
+        if isinstance(names, str):
+            names = [names]
+        self._reserved.update(names)
+
+    def allocate(self, name, conflictBase='', tag=''):
+        """Reserves and returns name if it is free,
+            otherwise conflictBase with tag and the next conflict ID appended as an ID.
+
+        Args:
+            name (str): preferred name
+            conflictBase (str, optional): name to append the conflict ID to. Defaults to name.
+            tag (str, optional): text placed before the conflict ID. Defaults to ''.
+
+        Returns:
+            str: reserved name
+        """
+        return self.allocateChain([name], [conflictBase or name], tag)[0]
+
+    def allocateChain(self, names, conflictBases=None, tag=''):
+        """Reserves names for a whole chain before any node is created.
+            If any name conflicts, every name gets the same conflict ID so the chain stays consistent.
+
+        Args:
+            names (list): preferred names
+            conflictBases (list, optional): names to append the conflict ID to. Defaults to names.
+            tag (str, optional): text placed before the conflict ID. Defaults to ''.
+
+        Returns:
+            list: reserved names
+        """
+        if all(self.isFree(name) for name in names):
+            self.reserve(names)
+            return list(names)
+
+        bases = conflictBases or names
+        count = self.__nextFreeID(bases, tag)
+        allocated = [appendID(base, ''.join((tag, str(count)))) for base in bases]
+        self.reserve(allocated)
+        return allocated
+
+    def __nextFreeID(self, bases, tag):
+        """Returns the lowest conflict ID above the highest used for bases that is free for all of them"""
+        def free(count):
+            suffix = ''.join((tag, str(count)))
+            return all(self.isFree(appendID(base, suffix)) for base in bases)
+
+        keys = [(base, tag) for base in bases]
+        known = [self._highest[key] for key in keys if key in self._highest]
+        if known:
+            count = max(known) + 1
+            while not free(count):
+                count += 1
+        else:
+            #IDs are handed out in order, so find the end of the used run by doubling then bisecting
+            low, high = 0, 1
+            while not free(high):
+                low, high = high, high * 2
+            while high - low > 1:
+                middle = (low + high) // 2
+                if free(middle):
+                    high = middle
+                else:
+                    low = middle
+            count = high
+
+        for key in keys:
+            self._highest[key] = count
+        return count
+
+
+##########################################################
+##########################################################
+#                     Active Index                       #
+##########################################################
+##########################################################
+
+
+def getActiveIndex():
+    return __activeIndex
+
+
+def setActiveIndex(index):
+    """Sets the index used by nodeExists and the tracking functions. None disables indexing
+
+    Args:
+        index (NameIndex | None): index to activate
+    """
+    global __activeIndex
+    __activeIndex = index
+
+
+def nodeExists(name):
+    """mc.objExists, answered by the active index when there is one
+
+    Args:
+        name (str): node name
+
+    Returns:
+        bool: True if the node exists
+    """
+    index = __activeIndex
+    if index is None:
+        return mc.objExists(name)
+    return name in index
+
+
+def getNameAllocator():
+    """Returns the active index's allocator, so conflict IDs are remembered for the build.
+        Without an active index a new allocator is returned.
+
+    Returns:
+        NameAllocator: allocator
+    """
+    if __activeIndex is not None:
+        return __activeIndex.allocator
+    return NameAllocator()
+
+
+def trackCreated(nodes):
+    """Records newly created nodes in the active index.
+        Returns what it was given so it can wrap creation commands.
+
+    Args:
+        nodes (str | list): created node names
+
+    Returns:
+        str | list: nodes
+    """
+    if __activeIndex is not None and nodes:
+        __activeIndex.add(nodes)
+    return nodes
+
+
+def trackCreatedHierarchy(nodes):
+    """Records newly created transforms in the active index along with their shapes and children.
+        Returns what it was given so it can wrap creation commands.
+
+    Args:
+        nodes (str | list): created transforms
+
+    Returns:
+        str | list: nodes
+    """
+    if __activeIndex is not None and nodes:
+        __activeIndex.add(__activeIndex.cmds.ls(nodes,dag=1) or [])
+    return nodes
+
+
+def trackDeleted(nodes):
+    """Removes deleted nodes from the active index
+
+    Args:
+        nodes (str | list): deleted node names
+    """
+    if __activeIndex is not None and nodes:
+        __activeIndex.discard(nodes)
+        __activeIndex.allocator.reset()
+
+
+def trackRenamed(old, new):
+    """Records a rename in the active index.
+        Returns the new name so it can wrap mc.rename
+
+    Args:
+        old (str): previous node name
+        new (str): current node name
+
+    Returns:
+        str: new
+    """
+    if __activeIndex is not None:
+        __activeIndex.rename(old, new)
+    return new
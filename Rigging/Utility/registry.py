@@ -0,0 +1,399 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Rigging.Utility
+
+Description: Per character registries of rig nodes, cached in memory and stored on one of the character's groups.
+    UtilityRegistry keeps the utility nodes of a character in a set and stores them on the character's utility group
+    as a single stringArray attribute, written in one setAttr.
+    Older rigs stored a comma joined utilityList string, which is read, merged and cleared on the next write.
+    SpaceRegistry maps targets to their space groups and controls to the spaces they use,
+    stored as JSON on the character's space group.
+    Inside a RegistryBatch registrations are held in memory and every registry is written once on exit.
+    Registries are dropped whenever a scene is opened or a new one made, so they are never carried into another scene.
+
+"""
+
+import json
+from abc import ABC,abstractmethod
+from collections import OrderedDict
+
+import maya.cmds as mc
+
+from Rigging.Utility.nameIndex import nodeExists,trackCreated
+
+UTILITY_ATTR = 'utilityNodes'
+LEGACY_UTILITY_ATTR = 'utilityList'
+SPACE_ATTR = 'spaceData'
+SCENE_EVENTS = ('SceneOpened','NewSceneOpened')
+
+__registries = {}
+__batchDepth = 0
+__sceneJobs = []
+
+
+class GroupRegistry(ABC):
+    """Base for registries stored on a character group. Reads the group once and writes it back on flush.
+        Subclasses set groupClass and implement the abstract _read, _write and _clear.
+
+    Args:
+        char (str): character segment
+    """
+    groupClass = ''
+
+    def __init__(self, char):
+        super(GroupRegistry,self).__init__()
+        self.char = char
+        self.group = '_'.join((char,self.groupClass,'grp'))
+        self.reset()
+
+    def reset(self):
+        """Forgets everything read from the scene. Call after the group is deleted"""
+        self._clear()
+        self._loaded = False
+        self._dirty = False
+
+    def flush(self):
+        """Writes the registry to its group, making the group if needed"""
+        if not self._dirty:
+            return
+        self._makeGroup()
+        self._write()
+        self._dirty = False
+
+    def _load(self):
+        """Reads the stored data the first time the registry is used"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if nodeExists(self.group):
+            self._read()
+
+    def _changed(self):
+        self._dirty = True
+        if not isBatching():
+            self.flush()
+
+    def _makeGroup(self):
+        if not nodeExists(self.group):
+            rig_root_grp = '_'.join((self.char,'rig','grp'))
+            trackCreated(mc.group(em=1,n=self.group))
+            mc.parent(self.group,rig_root_grp)
+
+    @abstractmethod
+    def _clear(self):
+        """Empties the in memory data"""
+
+    @abstractmethod
+    def _read(self):
+        """Reads the data stored on the group, which exists"""
+
+    @abstractmethod
+    def _write(self):
+        """Stores the in memory data on the group, which _makeGroup has made"""
+
+
+class UtilityRegistry(GroupRegistry):
+    """Set of a character's utility nodes, mirrored on its utility group.
+
+    Args:
+        char (str): character segment
+    """
+    groupClass = 'utility'
+
+    def __contains__(self, name):
+        self._load()
+        return name in self._nodes
+
+    def __len__(self):
+        self._load()
+        return len(self._nodes)
+
+    def nodes(self):
+        """Returns every registered node, including ones from a legacy utilityList
+
+        Returns:
+            list: node names in registration order
+        """
+        self._load()
+        return list(self._nodes)
+
+    def register(self, names):
+        """Adds nodes to the registry. Written right away unless a RegistryBatch is open
+
+        Args:
+            names (str | list): utility node names
+        """
+        if isinstance(names, str):
+            names = [names]
+        self._load()
+        added = False
+        for name in names:
+            if name and name not in self._nodes:
+                self._nodes[name] = None
+                added = True
+        if added:
+            self._changed()
+
+    def discard(self, names):
+        if isinstance(names, str):
+            names = [names]
+        self._load()
+        removed = [name for name in names if self._nodes.pop(name, 0) is None]
+        if removed:
+            self._changed()
+
+    def _clear(self):
+        self._nodes = OrderedDict()
+        self._legacy = False
+
+    def _read(self):
+        """Reads the stored nodes, merging in a legacy utilityList"""
+        stored = []
+        if mc.attributeQuery(UTILITY_ATTR, node=self.group, exists=1):
+            stored = mc.getAttr('.'.join((self.group,UTILITY_ATTR))) or []
+        if mc.attributeQuery(LEGACY_UTILITY_ATTR, node=self.group, exists=1):
+            legacy = mc.getAttr('.'.join((self.group,LEGACY_UTILITY_ATTR)),asString=1) or ''
+            legacy = [name for name in legacy.split(',') if name]
+            if legacy:
+                self._legacy = True
+                self._dirty = True
+            stored = list(stored) + legacy
+        for name in stored:
+            self._nodes.setdefault(name, None)
+
+    def _write(self):
+        names = list(self._nodes)
+        mc.setAttr('.'.join((self.group,UTILITY_ATTR)), len(names), *names, type='stringArray')
+        #legacy names now live in the new attr
+        if self._legacy:
+            mc.setAttr('.'.join((self.group,LEGACY_UTILITY_ATTR)), '', type='string')
+            self._legacy = False
+
+    def _makeGroup(self):
+        if not nodeExists(self.group):
+            #a new group means a new rig, keep only nodes that are still in the scene
+            #ls of an empty list lists the whole scene, so only ask when there are nodes
+            existing = mc.ls(list(self._nodes)) if self._nodes else []
+            self._nodes = OrderedDict((name, None) for name in existing)
+        super(UtilityRegistry,self)._makeGroup()
+        if not mc.attributeQuery(UTILITY_ATTR, node=self.group, exists=1):
+            mc.addAttr(self.group,ln=UTILITY_ATTR,dt='stringArray')
+
+
+class SpaceRegistry(GroupRegistry):
+    """Spaces of a character by target, and the spaces each control uses, mirrored on its space group.
+        Spaces made before the registry existed are read from the space group once, by name only.
+
+    Args:
+        char (str): character segment
+    """
+    groupClass = 'space'
+
+    def __contains__(self, space):
+        self._load()
+        return space in self._spaces
+
+    def __len__(self):
+        self._load()
+        return len(self._spaces)
+
+    def spaces(self):
+        """Returns every registered space
+
+        Returns:
+            list: space names in registration order
+        """
+        self._load()
+        return list(self._spaces)
+
+    def getSpace(self, targets):
+        """Space driven by exactly the given targets, None if there is none
+
+        Args:
+            targets (str | list): target, or targets of a multi target space
+
+        Returns:
+            str: space name
+        """
+        self._load()
+        return self._byTargets.get(self.__key(targets))
+
+    def getTargets(self, space):
+        self._load()
+        return list(self._spaces.get(space, ()))
+
+    def getControlSpaces(self, control):
+        """Spaces registered for a control, in the order they were added
+
+        Args:
+            control (str): control name
+
+        Returns:
+            list: space names
+        """
+        self._load()
+        return list(self._controls.get(control, ()))
+
+    def register(self, space, targets):
+        """Records a space and the targets driving it
+
+        Args:
+            space (str): space name
+            targets (str | list): target, or targets of a multi target space
+        """
+        self._load()
+        key = self.__key(targets)
+        if self._spaces.get(space) == key and self._byTargets.get(key) == space:
+            return
+        self._spaces[space] = key
+        self._byTargets[key] = space
+        self._changed()
+
+    def assign(self, control, spaces):
+        """Records spaces a control can follow
+
+        Args:
+            control (str): control name
+            spaces (str | list): space names
+        """
+        if isinstance(spaces, str):
+            spaces = [spaces]
+        self._load()
+        current = self._controls.setdefault(control, OrderedDict())
+        added = [space for space in spaces if space not in current]
+        for space in added:
+            current[space] = None
+        if added:
+            self._changed()
+
+    def __key(self, targets):
+        if isinstance(targets, str):
+            return (targets,)
+        return tuple(targets)
+
+    def _clear(self):
+        self._spaces = OrderedDict()
+        self._byTargets = {}
+        self._controls = OrderedDict()
+
+    def _read(self):
+        if not mc.attributeQuery(SPACE_ATTR, node=self.group, exists=1):
+            #older rigs, spaces are known by name only
+            for space in mc.listRelatives(self.group,ad=1,type='transform') or []:
+                self._spaces.setdefault(space, ())
+            self._dirty = bool(self._spaces)
+            return
+        data = json.loads(mc.getAttr('.'.join((self.group,SPACE_ATTR))) or '{}')
+        for space, targets in data.get('spaces', []):
+            self._spaces[space] = tuple(targets)
+            if targets:
+                self._byTargets[tuple(targets)] = space
+        for control, spaces in data.get('controls', []):
+            self._controls[control] = OrderedDict((space, None) for space in spaces)
+
+    def _write(self):
+        data = {'spaces': [[space, list(targets)] for space, targets in self._spaces.items()],
+                'controls': [[control, list(spaces)] for control, spaces in self._controls.items()]}
+        mc.setAttr('.'.join((self.group,SPACE_ATTR)), json.dumps(data), type='string')
+
+    def _makeGroup(self):
+        super(SpaceRegistry,self)._makeGroup()
+        if not mc.attributeQuery(SPACE_ATTR, node=self.group, exists=1):
+            mc.addAttr(self.group,ln=SPACE_ATTR,dt='string')
+
+
+class RegistryBatch(object):
+    """Context manager that holds registry writes until the outermost batch closes, then flushes every registry"""
+    def __enter__(self):
+        setBatchDepth(getBatchDepth() + 1)
+        return self
+
+    def __exit__(self, *args):
+        setBatchDepth(getBatchDepth() - 1)
+        if not isBatching():
+            flushRegistries()
+        return False
+
+
+##########################################################
+##########################################################
+#                        Access                          #
+##########################################################
+##########################################################
+
+
+def getUtilityRegistry(char):
+    """Returns the utility registry of a character, making it on first use
+
+    Args:
+        char (str): character segment
+
+    Returns:
+        UtilityRegistry: registry
+    """
+    return __getRegistry(UtilityRegistry, char)
+
+
+def getSpaceRegistry(char):
+    """Returns the space registry of a character, making it on first use
+
+    Args:
+        char (str): character segment
+
+    Returns:
+        SpaceRegistry: registry
+    """
+    return __getRegistry(SpaceRegistry, char)
+
+
+def __getRegistry(registryClass, char):
+    registry = __registries.get((registryClass, char))
+    if registry is None:
+        watchScene()
+        registry = __registries[(registryClass, char)] = registryClass(char)
+    return registry
+
+
+def forgetRegistries(char):
+    """Drops the in memory registries of a character, they are re-read from the scene on next use"""
+    for key in [key for key in __registries if key[1] == char]:
+        del __registries[key]
+
+
+def forgetAllRegistries():
+    """Drops every in memory registry without writing it. Runs when a scene is opened or a new one made"""
+    __registries.clear()
+
+
+def watchScene():
+    """Starts the script jobs that forget the registries on scene changes, once per session"""
+    if __sceneJobs:
+        return
+    for event in SCENE_EVENTS:
+        __sceneJobs.append(mc.scriptJob(event=[event, forgetAllRegistries]))
+
+
+def flushRegistries():
+    for registry in list(__registries.values()):
+        registry.flush()
+
+
+def getBatchDepth():
+    return __batchDepth
+
+
+def setBatchDepth(depth):
+    global __batchDepth
+    __batchDepth = max(0, depth)
+
+
+def isBatching():
+    return __batchDepth > 0
@@ -0,0 +1,202 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Utility
+
+Description: On disk cache of mesh points.
+    World space points are saved as .npy files and read back memory-mapped, so repeat reads cost no scene queries
+    and several processes can share one cache directory.
+    Entries are keyed by mesh name and a signature of the mesh, see makeSignature.
+    Writes go to a temporary file that is renamed into place, so readers never see a partial file.
+    The least recently used entries are removed once the cache holds more than maxEntries files or maxBytes.
+    Nothing here needs Maya, the scene side lives in Rigging.Core.geo.
+
+"""
+
+import os
+import hashlib
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), 'mrMayaTools', 'pointCache')
+
+__defaultCache = None
+
+
+def makeSignature(*values):
+    """Short hash of anything that identifies a mesh's current state,
+        e.g. its vertex, edge and face counts and its points.
+
+    Returns:
+        str: 16 character hex digest
+    """
+    return hashlib.sha1(repr(values).encode('utf-8')).hexdigest()[:16]
+
+
+class PointCache(object):
+    """Directory of memory-mapped point arrays
+
+    Args:
+        directory (str, optional): folder to keep entries in. Defaults to DEFAULT_DIRECTORY.
+        maxEntries (int, optional): most entries kept. Defaults to 64.
+        maxBytes (int, optional): most bytes kept, None for no limit. Defaults to None.
+    """
+    def __init__(self, directory=None, maxEntries=64, maxBytes=None):
+        super(PointCache,self).__init__()
+        if np is None:
+            raise ImportError('the point cache needs numpy')
+        self.directory = directory or DEFAULT_DIRECTORY
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def __contains__(self, key):
+        return os.path.isfile(self.path(*key))
+
+    def path(self, name, signature):
+        """File an entry is stored in. Maya path and namespace separators are swapped for underscores,
+            and a hash of the name is added so names that only differ by those separators do not share files
+        """
+        safeName = name.replace('|', '_').replace(':', '_')
+        nameHash = hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.directory, '{}-{}.{}.npy'.format(safeName, nameHash, signature))
+
+    def get(self, name, signature):
+        """Returns the cached points read-only and memory-mapped, None on a miss
+
+        Args:
+            name (str): mesh name
+            signature (str): mesh signature
+
+        Returns:
+            numpy.memmap: (N,3) points
+        """
+        path = self.path(name, signature)
+        try:
+            points = np.load(path, mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            return None
+        self.__touch(path)
+        return points
+
+    def put(self, name, signature, points):
+        """Saves points for a mesh, replacing entries for older signatures of it
+
+        Args:
+            name (str): mesh name
+            signature (str): mesh signature
+            points (list | numpy.ndarray): flat or (N,3) points
+
+        Returns:
+            numpy.memmap: the saved points, memory-mapped. The points in memory if they could not be saved
+        """
+        path = self.path(name, signature)
+        points = np.asarray(points, dtype=np.float64).reshape(-1,3)
+        handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                np.save(f, points)
+            os.replace(temporary, path)
+        except OSError:
+            #another process has the entry mapped, its copy is just as good
+            pass
+        finally:
+            #gone already once renamed into place
+            self.__remove(temporary)
+        self.invalidate(name, keep=signature)
+        self.evict()
+        try:
+            return np.load(path, mmap_mode='r')
+        except (IOError, OSError, ValueError):
+            return points
+
+    def fetch(self, name, signature, reader):
+        """Returns the cached points, or calls reader and caches what it returns
+
+        Args:
+            name (str): mesh name
+            signature (str): mesh signature
+            reader (function): returns the points when the cache misses
+
+        Returns:
+            numpy.memmap: (N,3) points
+        """
+        points = self.get(name, signature)
+        if points is None:
+            points = self.put(name, signature, reader())
+        return points
+
+    def invalidate(self, name, keep=None):
+        """Removes every entry for a mesh
+
+        Args:
+            name (str): mesh name
+            keep (str, optional): signature to leave in place. Defaults to None.
+        """
+        prefix = os.path.basename(self.path(name, '')).rpartition('.npy')[0]
+        for entry in self.__entries():
+            base = os.path.basename(entry)
+            if base.startswith(prefix) and base.count('.') == prefix.count('.') + 1:
+                if keep is None or base != os.path.basename(self.path(name, keep)):
+                    self.__remove(entry)
+
+    def evict(self):
+        """Removes the least recently used entries until the cache is within its limits"""
+        entries = []
+        for entry in self.__entries():
+            try:
+                stat = os.stat(entry)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort(reverse=True)
+
+        total = 0
+        for count, (mtime, size, entry) in enumerate(entries):
+            total += size
+            if count >= self.maxEntries or (self.maxBytes is not None and total > self.maxBytes):
+                self.__remove(entry)
+
+    def clear(self):
+        for entry in self.__entries():
+            self.__remove(entry)
+
+    def __entries(self):
+        return [os.path.join(self.directory, entry) for entry in os.listdir(self.directory) if entry.endswith('.npy')]
+
+    def __touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def __remove(self, path):
+        #entries mapped by another process can not be removed on windows, they go on the next eviction
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def getPointCache():
+    """Returns the shared cache in DEFAULT_DIRECTORY, creating it on first use
+
+    Returns:
+        PointCache: cache
+    """
+    global __defaultCache
+    if __defaultCache is None:
+        __defaultCache = PointCache()
+    return __defaultCache
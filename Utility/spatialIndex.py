@@ -0,0 +1,223 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Utility
+
+Description: KD-tree over bulk point arrays for nearest, k-nearest and radius queries.
+    Uses scipy's cKDTree when scipy is installed, otherwise a numpy tree of bounding boxes searched best first.
+    Both answer in the same shapes as cKDTree, so callers do not need to know which one they have.
+    Run the module directly to benchmark it against a brute force scan.
+
+"""
+import heapq
+from timeit import timeit
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+HAS_SCIPY = cKDTree is not None
+
+
+class KDTree(object):
+    """Spatial index of a set of points
+
+    Args:
+        points (list | numpy.ndarray): flat or (N,3) points
+        leafSize (int, optional): most points kept in a leaf. Defaults to 16.
+        useScipy (bool, optional): use cKDTree when it is available. Defaults to True.
+    """
+    def __init__(self, points, leafSize=16, useScipy=True):
+        super(KDTree,self).__init__()
+        if np is None:
+            raise ImportError('the spatial index needs numpy')
+        self.points = np.asarray(points, dtype=float).reshape(-1,3)
+        self.leafSize = max(1, leafSize)
+        self._tree = cKDTree(self.points, leafsize=self.leafSize) if useScipy and HAS_SCIPY else None
+        if self._tree is None:
+            self.__build()
+
+    def __len__(self):
+        return len(self.points)
+
+    def query(self, points, k=1):
+        """k nearest points to each of points. Missing neighbours have an infinite distance and index len(self)
+
+        Args:
+            points (list | numpy.ndarray): one or more query points
+            k (int, optional): neighbours to find. Defaults to 1.
+
+        Returns:
+            tuple: distances and indices, (M,k) arrays, or (M,) when k is 1
+        """
+        queries = np.asarray(points, dtype=float).reshape(-1,3)
+        if self._tree is not None:
+            distances, indices = self._tree.query(queries, k=k)
+            return distances, indices
+
+        distances = np.full((len(queries),k), np.inf)
+        indices = np.full((len(queries),k), len(self.points), dtype=int)
+        for row, query in enumerate(queries):
+            found, order = self.__nearest(query, k)
+            distances[row,:len(found)] = np.sqrt(found)
+            indices[row,:len(found)] = order
+        if k == 1:
+            return distances[:,0], indices[:,0]
+        return distances, indices
+
+    def queryRadius(self, points, radius):
+        """Every point within radius of each of points
+
+        Args:
+            points (list | numpy.ndarray): one or more query points
+            radius (float): search distance
+
+        Returns:
+            list: sorted index array for each query point
+        """
+        queries = np.asarray(points, dtype=float).reshape(-1,3)
+        if self._tree is not None:
+            return [np.array(sorted(found), dtype=int) for found in self._tree.query_ball_point(queries, radius)]
+        return [self.__withinRadius(query, radius * radius) for query in queries]
+
+    def closest(self, points):
+        """Index of the nearest point to each of points
+
+        Args:
+            points (list | numpy.ndarray): one or more query points
+
+        Returns:
+            numpy.ndarray: (M,) indices
+        """
+        return np.atleast_1d(self.query(points, k=1)[1])
+
+    def __build(self):
+        """Splits the points at the median of the widest axis until the leaves are small enough.
+            Nodes are kept in flat lists, each with the bounding box of its points.
+        """
+        self._order = np.arange(len(self.points))
+        self._mins, self._maxs, self._ranges, self._children = [], [], [], []
+        stack = [(0, len(self.points), None, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(self._ranges)
+            if parent is not None:
+                self._children[parent][side] = node
+            members = self.points[self._order[start:end]]
+            low = members.min(axis=0) if end > start else np.zeros(3)
+            high = members.max(axis=0) if end > start else np.zeros(3)
+            self._mins.append(low)
+            self._maxs.append(high)
+            self._ranges.append((start, end))
+            self._children.append([None, None])
+            if end - start <= self.leafSize:
+                continue
+            axis = int(np.argmax(high - low))
+            middle = (end - start) // 2
+            split = np.argpartition(members[:,axis], middle)
+            self._order[start:end] = self._order[start:end][split]
+            stack.append((start, start + middle, node, 0))
+            stack.append((start + middle, end, node, 1))
+
+    def __boxDistance(self, node, query):
+        gap = np.maximum(0.0, np.maximum(self._mins[node] - query, query - self._maxs[node]))
+        return float(gap.dot(gap))
+
+    def __nearest(self, query, k):
+        """Best first search, returns squared distances and indices of the k nearest, closest first"""
+        bestDistances = np.empty(0)
+        bestIndices = np.empty(0, dtype=int)
+        worst = np.inf
+        heap = [(0.0, 0)]
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if bound > worst:
+                break
+            left, right = self._children[node]
+            if left is None:
+                start, end = self._ranges[node]
+                members = self._order[start:end]
+                offsets = self.points[members] - query
+                bestDistances = np.concatenate((bestDistances, np.einsum('ij,ij->i', offsets, offsets)))
+                bestIndices = np.concatenate((bestIndices, members))
+                if len(bestDistances) > k:
+                    keep = np.argpartition(bestDistances, k - 1)[:k]
+                    bestDistances, bestIndices = bestDistances[keep], bestIndices[keep]
+                if len(bestDistances) == k:
+                    worst = bestDistances.max()
+                continue
+            for child in (left, right):
+                distance = self.__boxDistance(child, query)
+                if distance <= worst:
+                    heapq.heappush(heap, (distance, child))
+        order = np.argsort(bestDistances)
+        return bestDistances[order], bestIndices[order]
+
+    def __withinRadius(self, query, radiusSquared):
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self.__boxDistance(node, query) > radiusSquared:
+                continue
+            left, right = self._children[node]
+            if left is None:
+                start, end = self._ranges[node]
+                members = self._order[start:end]
+                offsets = self.points[members] - query
+                found.append(members[np.einsum('ij,ij->i', offsets, offsets) <= radiusSquared])
+                continue
+            stack.extend((left, right))
+        if not found:
+            return np.empty(0, dtype=int)
+        return np.sort(np.concatenate(found))
+
+
+##########################################################
+##########################################################
+#                        Benchmark                       #
+##########################################################
+##########################################################
+
+def benchmark(count=100000, queries=1000, number=3):
+    """Times nearest point queries on a KD-tree against a brute force scan
+
+    Args:
+        count (int, optional): points in the tree. Defaults to 100000.
+        queries (int, optional): query points. Defaults to 1000.
+        number (int, optional): runs to average. Defaults to 3.
+
+    Returns:
+        dict: average seconds per run for each approach
+    """
+    random = np.random.default_rng(0)
+    points = random.uniform(-10.0, 10.0, (count,3))
+    targets = random.uniform(-10.0, 10.0, (queries,3))
+    results = {}
+    results['build'] = timeit(lambda: KDTree(points, useScipy=False), number=number) / number
+    tree = KDTree(points, useScipy=False)
+    results['kdTree'] = timeit(lambda: tree.closest(targets), number=number) / number
+    results['bruteForce'] = timeit(lambda: [np.argmin(((points - target)**2).sum(axis=1)) for target in targets],
+                                   number=number) / number
+    if HAS_SCIPY:
+        scipyTree = KDTree(points)
+        results['cKDTree'] = timeit(lambda: scipyTree.closest(targets), number=number) / number
+    for key, value in sorted(results.items()):
+        print('{:<14}{:.6f}s'.format(key, value))
+    return results
+
+
+if __name__ == '__main__':
+    benchmark()
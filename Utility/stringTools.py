@@ -14,14 +14,17 @@ Description: Collection of name management functions.
     This autorig relies on tags and name segments to identify and traverse the rig.
     The expected and generated patterns are as follows: ['char','typ','name','side','IDs','class']
         such that IDs can be any amount of additional tags. 
-    Currently all processes use "_" for delimination, 
-        but support for namespaces is being added for an updated pattern of: Char:Typ:Name_Side_[IDs]_class
+    Segments are deliminated by "_", with optional leading namespaces for the pattern: Char:Typ:Name_Side_[IDs]_class
     Please refer to Documentation/NamingConventions.md for examples of names, IDs, solutions to side assignments, etc
 
 """
 
-import re
-import maya.cmds as mc
+from collections import OrderedDict
+from timeit import timeit
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 
@@ -31,11 +34,28 @@ import maya.cmds as mc
 ##########################################################
 ##########################################################
 
+def __tokenizeName(name):
+    """
+    Splits a name into segments in a single pass.
+    Everything before the last ":" is treated as namespaces, which are kept whole,
+    and the remaining leaf is deliminated by "_"
+
+    Args:
+        name (str): string to split
+
+    Returns:
+        tuple : (list of name segments, number of leading namespace segments)
+    """
+    if ':' not in name:
+        return name.split('_'), 0
+    namespaces, sep, leaf = name.rpartition(':')
+    namespaces = namespaces.split(':')
+    return namespaces + leaf.split('_'), len(namespaces)
+
+
 def __nameToSegments(name):
     """
     Seperates string into segments deliminated by "_" or ":"
-    Note: While parsing supports namespaces, this is still being implemented
-        and currently namespaces are converted 
 
     Args:
         name (str): string to split
@@ -43,30 +63,21 @@ def __nameToSegments(name):
     Returns:
         list : name segments
     """
-    if ':' not in name:
-        return name.split('_')
-    else:
-        segments = name.split(':')
-        for segment in segments:
-            if re.search('_',segment):
-                currentIndex = segments.index(segments)
-                toParse = segments.pop(currentIndex)
-                additionalSegments = toParse.split('_')
-                segments = segments[0:currentIndex] + additionalSegments + segments[currentIndex:]
-    return segments
+    return __tokenizeName(name)[0]
 
 
 def __segmentsToName(segments,namespace=0):
-    """Wrapper placed in anticipation of namespace support
+    """Joins segments back into a name, the inverse of __tokenizeName
 
     Args:
-        segments list: preorded list
+        segments (list): preorded list
+        namespace (int, optional): number of leading segments that are namespaces. Defaults to 0.
 
     Returns:
-        _type_: _description_
+        str: name
     """
     if namespace:
-        return ':'.join(segments[:2]) + ':' + '_'.join(segments[2:])
+        return ':'.join(segments[:namespace]) + ':' + '_'.join(segments[namespace:])
     else:
         return '_'.join(segments)
 
@@ -81,18 +92,223 @@ def __getSegmentByID(name , ID ):
     Returns:
         str: string segment
     """
-    segmentIndices = ['char','typ','name','side','IDs','class']
-    segments = __nameToSegments(name)
-    if re.search('(?i)id',ID):
-        return segments[4:-1]
-    elif re.search('(?i)class',ID):
-        return segments[-1]
-    else:
-        return segments[ segmentIndices.index(ID)]
+    return parseName(name).getSegment(ID)
     
 
 def __getSegmentByIndex( name , index):
-    return __nameToSegments(name)[index]
+    return parseName(name).segments[index]
+
+
+##########################################################
+##########################################################
+#                      Parsed Names                      #
+##########################################################
+##########################################################
+
+SEGMENT_INDICES = {'char':0, 'typ':1, 'name':2, 'side':3, 'ids':4, 'id':4, 'class':-1, 'clas':-1}
+NAME_CACHE_SIZE = 4096
+
+__nameCache = OrderedDict()
+
+
+class ParsedName(object):
+    """Immutable, pre-split node name.
+        Segments are parsed once and served from the cached tuple. 
+        Edits return a new ParsedName rather than changing this one.
+
+    Args:
+        segments (list | tuple): name segments
+        namespace (int, optional): number of leading segments that are namespaces. Defaults to 0.
+        fullName (str, optional): name the segments came from. Rebuilt from segments if not given.
+    """
+    __slots__ = ('segments','namespace','fullName')
+
+    def __init__(self, segments, namespace=0, fullName=''):
+        self.segments = tuple(segments)
+        self.namespace = namespace
+        if not fullName:
+            if namespace:
+                fullName = ':'.join(self.segments[:namespace]) + ':' + '_'.join(self.segments[namespace:])
+            else:
+                fullName = '_'.join(self.segments)
+        self.fullName = fullName
+
+    def __repr__(self):
+        return 'ParsedName({!r})'.format(self.fullName)
+
+    def __str__(self):
+        return self.fullName
+
+    def __eq__(self, other):
+        if isinstance(other, ParsedName):
+            return self.fullName == other.fullName
+        return self.fullName == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.fullName)
+
+    def __len__(self):
+        return len(self.segments)
+
+    @property
+    def char(self):
+        return self.segments[0]
+
+    @property
+    def typ(self):
+        return self.segments[1]
+
+    @property
+    def name(self):
+        return self.segments[2]
+
+    @property
+    def side(self):
+        return self.segments[3]
+
+    @property
+    def IDs(self):
+        return list(self.segments[4:-1])
+
+    @property
+    def clas(self):
+        return self.segments[-1]
+
+    def getSegment(self, index):
+        """Returns the segment at the give index / ID.
+            Expected Indices: [0:'char',1:'typ',2:'name',3:'side',4+:'IDs',-1:'class']
+
+        Args:
+            index (str | int): ID or index to return
+
+        Returns:
+            str | list: segment, or list of segments for 'IDs'
+        """
+        if isinstance(index, str):
+            index = segmentIndex(index)
+            if index == 4:
+                return list(self.segments[4:-1])
+        return self.segments[index]
+
+    def replaceSegment(self, index, replacement='NA'):
+        """Returns a new ParsedName with the segment at index replaced
+
+        Args:
+            index (str | int): ID or index of segment to change
+            replacement (str, optional): new segment text. Defaults to 'NA'.
+
+        Returns:
+            ParsedName: updated name
+        """
+        if isinstance(index, str):
+            index = segmentIndex(index)
+        segments = list(self.segments)
+        segments[index] = replacement
+        return deriveName(segments, self.namespace)
+
+    def appendID(self, id=''):
+        """Returns a new ParsedName with id added to the id list
+
+        Args:
+            id (str, optional): id to insert. Defaults to ''.
+
+        Returns:
+            ParsedName: updated name
+        """
+        segments = list(self.segments)
+        segments.insert(-2, id)
+        return deriveName(segments, self.namespace)
+
+
+def segmentIndex(ID):
+    """Converts a segment ID to its index. 'IDs' resolves to the first id slot (4)
+
+    Args:
+        ID (str): one of 'char','typ','name','side','IDs','class'
+
+    Returns:
+        int: segment index
+    """
+    try:
+        return SEGMENT_INDICES[ID.lower()]
+    except KeyError:
+        raise ValueError("{} is not a valid name segment".format(ID))
+
+
+def parseName(name):
+    """Returns the ParsedName for the given name, parsing only on a cache miss.
+        The cache keeps the NAME_CACHE_SIZE most recently used names.
+
+    Args:
+        name (str | ParsedName): name to parse
+
+    Returns:
+        ParsedName: parsed name
+    """
+    if isinstance(name, ParsedName):
+        return name
+    try:
+        parsed = __nameCache.pop(name)
+    except KeyError:
+        segments, namespace = __tokenizeName(name)
+        parsed = ParsedName(segments, namespace, name)
+        if len(__nameCache) >= NAME_CACHE_SIZE:
+            __nameCache.popitem(last=False)
+    __nameCache[name] = parsed
+    return parsed
+
+
+def cacheName(parsed):
+    """Adds an already parsed name to the cache so derived names are not re-split
+
+    Args:
+        parsed (ParsedName): name to store
+
+    Returns:
+        ParsedName: the given name
+    """
+    __nameCache.pop(parsed.fullName, None)
+    if len(__nameCache) >= NAME_CACHE_SIZE:
+        __nameCache.popitem(last=False)
+    __nameCache[parsed.fullName] = parsed
+    return parsed
+
+
+def deriveName(segments, namespace=0):
+    """ParsedName for edited segments. Segments holding a "_" or ":" are parsed again from the joined name,
+        so the result matches what parseName gives for it whether or not it is cached
+
+    Args:
+        segments (list): name segments
+        namespace (int, optional): number of leading segments that are namespaces. Defaults to 0.
+
+    Returns:
+        ParsedName: cached name
+    """
+    parsed = ParsedName(segments, namespace)
+    if any('_' in segment or ':' in segment for segment in parsed.segments):
+        __nameCache.pop(parsed.fullName, None)
+        return parseName(parsed.fullName)
+    return cacheName(parsed)
+
+
+def clearNameCache():
+    __nameCache.clear()
+
+
+def setNameCacheSize(size):
+    """Sets the maximum amount of parsed names to keep, trimming oldest entries
+
+    Args:
+        size (int): maximum cache entries
+    """
+    global NAME_CACHE_SIZE
+    NAME_CACHE_SIZE = max(int(size), 1)
+    while len(__nameCache) > NAME_CACHE_SIZE:
+        __nameCache.popitem(last=False)
 
 
 ##########################################################
@@ -127,21 +343,242 @@ def replaceSegment(name, index, replacement='NA'):
     Returns:
         str: updated name
     """
-    segments = __nameToSegments(name)
-    segmentIndices = ['char','typ','name','side','IDs','class']
-    if isinstance(index, str):
-        index = segmentIndices.index(index)
-    segments[index] = replacement
-    return __segmentsToName(segments)
+    return parseName(name).replaceSegment(index, replacement).fullName
 
 
 def appendID(name,id=''):
     """
     adds an id to the end of the id list
     """
-    segments = __nameToSegments(name)
-    segments.insert(-2,id)
-    return __segmentsToName(segments)
+    return parseName(name).appendID(id).fullName
 
 
-    
+##########################################################
+##########################################################
+#                    Batch Management                    #
+##########################################################
+##########################################################
+
+
+def __perName(value, count):
+    """Expands a single value to one per name. Lists and tuples are expected to match count"""
+    if isinstance(value, (list, tuple)):
+        if len(value) != count:
+            raise ValueError("Expected {} values, got {}".format(count, len(value)))
+        return value
+    return [value] * count
+
+
+def getSegments(names, index):
+    """Returns the segment at the given index / ID for every name.
+        Expected Indices: [0:'char',1:'typ',2:'name',3:'side',4+:'IDs',-1:'class']
+
+    Args:
+        names (list): names to parse
+        index (str | int): ID or index to return
+
+    Returns:
+        list: segment for each name
+    """
+    if isinstance(index, str):
+        index = segmentIndex(index)
+        if index == 4:
+            return [list(parseName(name).segments[4:-1]) for name in names]
+    return [parseName(name).segments[index] for name in names]
+
+
+def replaceSegments(names, index, replacement='NA'):
+    """Replace a segment of every name.
+        Expected Indices: [0:'char',1:'typ',2:'name',3:'side',4+:'IDs',-1:'class']
+
+    Args:
+        names (list): names to be editted
+        index (str | int): ID or index of segment you wish you change.
+        replacement (str | list, optional): new segment text, or one per name. Defaults to 'NA'.
+
+    Returns:
+        list: updated names
+    """
+    if isinstance(index, str):
+        index = segmentIndex(index)
+    replacements = __perName(replacement, len(names))
+    updated = []
+    for name, replacement in zip(names, replacements):
+        parsed = parseName(name)
+        segments = list(parsed.segments)
+        segments[index] = replacement
+        updated.append(deriveName(segments, parsed.namespace).fullName)
+    return updated
+
+
+def appendIDs(names, id=''):
+    """adds an id to the end of the id list of every name
+
+    Args:
+        names (list): names to be editted
+        id (str | list, optional): id to add, or one per name. Defaults to ''.
+
+    Returns:
+        list: updated names
+    """
+    ids = __perName(id, len(names))
+    updated = []
+    for name, id in zip(names, ids):
+        parsed = parseName(name)
+        segments = list(parsed.segments)
+        segments.insert(-2, id)
+        updated.append(deriveName(segments, parsed.namespace).fullName)
+    return updated
+
+
+##########################################################
+##########################################################
+#                       Mirroring                        #
+##########################################################
+##########################################################
+
+#side codes swapped by each mirror plane, named by the axis the plane faces
+MIRROR_PAIRS = {
+    'x':(('L','R'),),
+    'y':(('S','I'),),
+    'z':(('F','B'),('D','V'))}
+
+
+def __buildMirrorTables():
+    tables = {}
+    for axis, pairs in MIRROR_PAIRS.items():
+        mapping = {}
+        for a, b in pairs:
+            mapping[a] = b
+            mapping[b] = a
+        tables[axis] = str.maketrans(mapping)
+    return tables
+
+MIRROR_TABLES = __buildMirrorTables()
+
+
+def mirrorSide(side, axis='x'):
+    """Returns the side code mirrored across the given axis.
+        Indices and codes for other axes are kept, so 'L01' becomes 'R01' and 'SL' becomes 'SR'.
+
+    Args:
+        side (str): location code
+        axis (str, optional): 'x' for L/R, 'y' for S/I, 'z' for F/B and D/V. Defaults to 'x'.
+
+    Returns:
+        str: mirrored side code
+    """
+    return side.translate(MIRROR_TABLES[axis])
+
+
+def mirrorNames(names, axis='x'):
+    """Swaps the side segment of every name in a single pass.
+        Names without a side segment are returned unchanged.
+
+    Args:
+        names (list): names to mirror
+        axis (str | list, optional): mirror axis, or a list of axes to mirror across. Defaults to 'x'.
+
+    Returns:
+        list: mirrored names
+    """
+    if isinstance(axis, str):
+        axis = [axis]
+    table = {}
+    for key in axis:
+        for code, mirror in MIRROR_TABLES[key].items():
+            table[code] = mirror
+
+    mirrored = []
+    for name in names:
+        parsed = parseName(name)
+        if len(parsed.segments) < 5:
+            mirrored.append(parsed.fullName)
+            continue
+        segments = list(parsed.segments)
+        segments[3] = segments[3].translate(table)
+        mirrored.append(cacheName(ParsedName(segments, parsed.namespace)).fullName)
+    return mirrored
+
+
+#side codes for (positive, negative) positions along each axis. Characters face +z with their left on +x
+SIDE_CODES = {'x':('L','R'), 'y':('S','I'), 'z':('F','B')}
+
+
+def inferSides(positions, tolerance=0.001, axes='x', center=(0,0,0)):
+    """Assigns a location code to every position at once. Requires numpy.
+        Codes are concatenated in the order of axes, so axes='yx' gives codes like 'SL'.
+        Positions within tolerance of the center on every axis are 'M'.
+        The result can be passed straight to replaceSegments(names,'side',sides).
+
+    Args:
+        positions (list | numpy.ndarray): (N,3) world positions
+        tolerance (float, optional): distance from center still treated as medial. Defaults to 0.001.
+        axes (str, optional): axes to classify, from 'x','y','z'. Defaults to 'x'.
+        center (tuple, optional): world position of the median planes. Defaults to (0,0,0).
+
+    Returns:
+        list: location code per position
+    """
+    if np is None:
+        raise ImportError("inferSides requires numpy")
+    positions = np.asarray(positions, dtype=float).reshape(-1,3) - np.asarray(center, dtype=float)
+    codes = np.zeros(len(positions), dtype='<U{}'.format(max(len(axes),1)))
+    for axis in axes:
+        positive, negative = SIDE_CODES[axis]
+        column = positions[:, 'xyz'.index(axis)]
+        codes = np.char.add(codes, np.where(column > tolerance, positive, np.where(column < -tolerance, negative, '')))
+    codes[codes == ''] = 'M'
+    return codes.tolist()
+
+
+##########################################################
+##########################################################
+#                        Benchmark                       #
+##########################################################
+##########################################################
+
+
+def benchmarkTokenizer(count=100000):
+    """Times the tokenizer against the previous splitter.
+        The previous splitter fails on namespaced names, so those are only timed for the tokenizer.
+
+    Args:
+        count (int, optional): amount of names to split per run. Defaults to 100000.
+
+    Returns:
+        dict: seconds per run for each splitter and name style
+    """
+    def legacySplit(name):
+        if ':' not in name:
+            return name.split('_')
+        segments = name.split(':')
+        for segment in segments:
+            if '_' in segment:
+                currentIndex = segments.index(segments)
+                toParse = segments.pop(currentIndex)
+                segments = segments[0:currentIndex] + toParse.split('_') + segments[currentIndex:]
+        return segments
+
+    plain = ['RBT_bind_handDigit{:02d}_L_{}_jnt'.format(i % 100, i) for i in range(count)]
+    namespaced = ['RBT:bind:handDigit{:02d}_L_{}_jnt'.format(i % 100, i) for i in range(count)]
+    for name in namespaced[:100]:
+        if __segmentsToName(*__tokenizeName(name)) != name:
+            raise AssertionError('{} does not round trip'.format(name))
+
+    results = {
+        'legacy plain': timeit(lambda: [legacySplit(name) for name in plain], number=1),
+        'tokenizer plain': timeit(lambda: [__tokenizeName(name) for name in plain], number=1),
+        'tokenizer namespaced': timeit(lambda: [__tokenizeName(name) for name in namespaced], number=1)}
+    try:
+        legacySplit(namespaced[0])
+    except ValueError:
+        results['legacy namespaced'] = None
+
+    for key, value in sorted(results.items()):
+        print('{:<22}{}'.format(key, 'fails' if value is None else '{:.4f}s'.format(value)))
+    return results
+
+
+if __name__ == '__main__':
+    benchmarkTokenizer()
@@ -0,0 +1,287 @@
+"""
+copyright Matthew Rom 2022
+______________________________
+Created: 2022
+Updated: 5/10/2022
+Version: 2.0
+
+@author: Matthew Rom
+@email: matthewrom.td@gmail.com
+
+Module: Utility
+
+Description: Array versions of the vectorMath functions.
+    Each function takes (N,3) arrays, or (N,4,4) for matrices, and works on every row at once with numpy.
+    Second arguments are a scalar, one (3,) vector for every row or an (N,3) array, never told apart by length alone.
+    One scalar per row goes through multRows.
+    Without numpy the same functions loop over the tuple versions in vectorMath and return lists.
+    Run the module directly to benchmark the two.
+
+"""
+from timeit import timeit
+
+import Utility.vectorMath as vec
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+def asPoints(a):
+    """Returns a as an (N,3) float array, or a list of 3-tuples without numpy"""
+    if HAS_NUMPY:
+        return np.asarray(a, dtype=float).reshape(-1,3)
+    if len(a) and not isinstance(a[0], (tuple, list)):
+        a = [a[i:i+3] for i in range(0, len(a), 3)]
+    return [tuple(row) for row in a]
+
+
+def __perRow(b, count):
+    """Expands a scalar or single vector argument to one per row for the tuple fallback"""
+    if isinstance(b, (int, float)):
+        return [b] * count
+    if len(b) == 3 and not isinstance(b[0], (tuple, list)):
+        return [tuple(b)] * count
+    return [tuple(row) for row in b]
+
+
+def __rowValues(values, count):
+    """One scalar per row, from a scalar or a sequence of count scalars"""
+    if isinstance(values, (int, float)):
+        return [values] * count
+    values = [float(value) for value in values]
+    if len(values) != count:
+        raise ValueError('expected {} values, got {}'.format(count, len(values)))
+    return values
+
+
+##########################################################
+##########################################################
+#                       Operations                       #
+##########################################################
+##########################################################
+
+def vector(a,b):
+    if not HAS_NUMPY:
+        return [vec.vector(x,y) for x,y in zip(asPoints(a),asPoints(b))]
+    return asPoints(b) - asPoints(a)
+
+def mag(a):
+    if not HAS_NUMPY:
+        return [vec.mag(x) for x in asPoints(a)]
+    return np.sqrt(np.einsum('ij,ij->i', asPoints(a), asPoints(a)))
+
+def mult(a,b):
+    """b is a scalar, a (3,) per axis factor or an (N,3) array, see multRows for one scalar per row"""
+    if not HAS_NUMPY:
+        a = asPoints(a)
+        return [vec.mult(x,y) for x,y in zip(a,__perRow(b,len(a)))]
+    return asPoints(a) * np.asarray(b, dtype=float)
+
+def multRows(a,factors):
+    """Scales each row by its own factor"""
+    a = asPoints(a)
+    factors = __rowValues(factors, len(a))
+    if not HAS_NUMPY:
+        return [vec.mult(x,f) for x,f in zip(a,factors)]
+    return a * np.asarray(factors)[:, None]
+
+def add(a,b):
+    if not HAS_NUMPY:
+        a = asPoints(a)
+        return [vec.add(x,y) for x,y in zip(a,__perRow(b,len(a)))]
+    return asPoints(a) + np.asarray(b, dtype=float)
+
+def scale(a,b):
+    return mult(a,b)
+
+def offset(a,b):
+    return add(a,b)
+
+def normalize(a):
+    """Zero length rows are returned as zero vectors"""
+    if not HAS_NUMPY:
+        return [vec.normalize(x) if vec.mag(x) else (0.0,0.0,0.0) for x in asPoints(a)]
+    a = asPoints(a)
+    m = mag(a)[:, None]
+    return np.divide(a, m, out=np.zeros_like(a), where=m > 0)
+
+def dot(a,b):
+    if not HAS_NUMPY:
+        return [vec.dot(x,y) for x,y in zip(asPoints(a),asPoints(b))]
+    return np.einsum('ij,ij->i', asPoints(a), asPoints(b))
+
+def cross(a,b):
+    if not HAS_NUMPY:
+        return [vec.cross(x,y) for x,y in zip(asPoints(a),asPoints(b))]
+    return np.cross(asPoints(a), asPoints(b))
+
+def upVector(a,b):
+    return normalize(cross(a,b))
+
+def bitangent(a,b):
+    a = normalize(a)
+    b = normalize(b)
+    return normalize(cross(normalize(cross(a,b)),a))
+
+def invert(a):
+    return scale(a,-1)
+
+def centroid(a):
+    """Average of every row"""
+    if not HAS_NUMPY:
+        a = asPoints(a)
+        return tuple(sum(column)/len(a) for column in zip(*a))
+    return asPoints(a).mean(axis=0)
+
+
+##########################################################
+##########################################################
+#                        Matrices                        #
+##########################################################
+##########################################################
+
+def asMatrices(m):
+    """Returns m as an (N,4,4) array, or a list of flat 16 element lists without numpy"""
+    if HAS_NUMPY:
+        return np.asarray(m, dtype=float).reshape(-1,4,4)
+    if len(m) and not isinstance(m[0], (tuple, list)):
+        m = [m[i:i+16] for i in range(0, len(m), 16)]
+    return [list(matrix) for matrix in m]
+
+def multMatrices(a,b):
+    """a then b for every pair. Either side may be a single matrix"""
+    if not HAS_NUMPY:
+        a, b = asMatrices(a), asMatrices(b)
+        count = max(len(a), len(b))
+        a, b = a * count if len(a) == 1 else a, b * count if len(b) == 1 else b
+        return [vec.matrixMult(x,y) for x,y in zip(a,b)]
+    return np.matmul(asMatrices(a), asMatrices(b))
+
+def invertMatrices(m):
+    if not HAS_NUMPY:
+        return [vec.matrixInverse(matrix) for matrix in asMatrices(m)]
+    return np.linalg.inv(asMatrices(m))
+
+def transformPoints(points,m):
+    """Applies a single matrix, or one matrix per point"""
+    if not HAS_NUMPY:
+        points, m = asPoints(points), asMatrices(m)
+        m = m * len(points) if len(m) == 1 else m
+        return [vec.transformPoint(p,matrix) for p,matrix in zip(points,m)]
+    m = asMatrices(m)
+    points = asPoints(points)
+    if len(m) == 1:
+        return points.dot(m[0,:3,:3]) + m[0,3,:3]
+    return np.einsum('ij,ijk->ik', points, m[:,:3,:3]) + m[:,3,:3]
+
+def eulerToMatrices(rotates,rotateOrder='xyz'):
+    """Rotation matrix for every row of rotates, in degrees"""
+    if not HAS_NUMPY:
+        return [vec.eulerToMatrix(rotate,rotateOrder) for rotate in asPoints(rotates)]
+    angles = np.radians(asPoints(rotates))
+    result = np.broadcast_to(np.eye(4), (len(angles),4,4)).copy()
+    for axis in rotateOrder:
+        i, j = {'x':(1,2), 'y':(2,0), 'z':(0,1)}[axis]
+        c = np.cos(angles[:, 'xyz'.index(axis)])
+        s = np.sin(angles[:, 'xyz'.index(axis)])
+        rotation = np.broadcast_to(np.eye(4), result.shape).copy()
+        rotation[:,i,i], rotation[:,i,j], rotation[:,j,i], rotation[:,j,j] = c, s, -s, c
+        result = np.matmul(result, rotation)
+    return result
+
+def composeMatrices(translates,rotates,scales=None,rotateOrder='xyz'):
+    """scale * rotation * translation for every row"""
+    if not HAS_NUMPY:
+        translates, rotates = asPoints(translates), asPoints(rotates)
+        scales = asPoints(scales) if scales is not None else [(1,1,1)] * len(translates)
+        return [vec.composeMatrix(t,r,s,rotateOrder) for t,r,s in zip(translates,rotates,scales)]
+    result = eulerToMatrices(rotates,rotateOrder)
+    if scales is not None:
+        result[:,:3,:3] *= asPoints(scales)[:,:,None]
+    result[:,3,:3] = asPoints(translates)
+    return result
+
+
+##########################################################
+##########################################################
+#                         Solvers                        #
+##########################################################
+##########################################################
+
+def solvePoleVectors(starts,middles,ends,distance=1.0,fallback=(0.0,0.0,-1.0),tolerance=1e-3):
+    """Pole vector placements for many three joint chains at once. See vectorMath.poleVector
+
+    Args:
+        starts (numpy.ndarray): (N,3) first joint positions
+        middles (numpy.ndarray): (N,3) middle joint positions
+        ends (numpy.ndarray): (N,3) end joint positions
+        distance (float | list, optional): offset from the middle joint, or one per chain. Defaults to 1.0.
+        fallback (tuple, optional): pole direction for chains straighter than tolerance. Defaults to (0,0,-1).
+        tolerance (float, optional): sine of the bend below which a chain counts as straight. Defaults to 1e-3.
+
+    Returns:
+        tuple: (N,3) positions and (N,4,4) matrices aimed down x from the middle joint
+    """
+    if not HAS_NUMPY:
+        starts, middles, ends = asPoints(starts), asPoints(middles), asPoints(ends)
+        distances = __rowValues(distance, len(starts))
+        solved = [vec.poleVector(s,m,e,d,fallback,tolerance) for s,m,e,d in zip(starts,middles,ends,distances)]
+        return [position for position,matrix in solved], [matrix for position,matrix in solved]
+
+    middles = asPoints(middles)
+    norm = normalize(vector(middles,ends))
+    upper = vector(middles,starts)
+    offAxis = upper - norm * dot(upper,norm)[:,None]
+
+    straight = mag(offAxis) <= tolerance * mag(upper)
+    if straight.any():
+        fallback = np.broadcast_to(np.asarray(fallback, dtype=float), norm.shape)
+        flat = fallback - norm * dot(fallback,norm)[:,None]
+        #fallback parallel to the chain, use the world axis least aligned with it
+        parallel = mag(flat) < 1e-9
+        if parallel.any():
+            axes = np.eye(3)[np.argmin(np.abs(norm), axis=1)]
+            flat[parallel] = cross(norm,axes)[parallel]
+        offAxis[straight] = -flat[straight]
+
+    aim = -normalize(offAxis)
+    positions = middles + multRows(aim, distance)
+    up = normalize(cross(norm,aim))
+    matrices = np.zeros((len(middles),4,4))
+    matrices[:,0,:3], matrices[:,1,:3], matrices[:,2,:3], matrices[:,3,:3] = aim, up, cross(aim,up), positions
+    matrices[:,3,3] = 1.0
+    return positions, matrices
+
+
+##########################################################
+##########################################################
+#                        Benchmark                       #
+##########################################################
+##########################################################
+
+def benchmark(count=10000, number=10):
+    """Times bitangent over count vectors, looping vectorMath against this module
+
+    Args:
+        count (int, optional): amount of vectors. Defaults to 10000.
+        number (int, optional): runs to average. Defaults to 10.
+
+    Returns:
+        dict: average seconds per run for each implementation
+    """
+    a = [(i*0.5+1.0, i%7-3.0, 2.0) for i in range(count)]
+    b = [(1.0, i%5+1.0, i*0.25) for i in range(count)]
+    results = {'vectorMath': timeit(lambda: [vec.bitangent(x,y) for x,y in zip(a,b)], number=number) / number}
+    if HAS_NUMPY:
+        arrayA, arrayB = asPoints(a), asPoints(b)
+        results['vectorArray'] = timeit(lambda: bitangent(arrayA,arrayB), number=number) / number
+    for key, value in sorted(results.items()):
+        print('{:<14}{:.6f}s'.format(key, value))
+    return results
+
+
+if __name__ == '__main__':
+    benchmark()
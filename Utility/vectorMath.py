@@ -11,9 +11,12 @@ Version: 2.0
 Module: Utility
 
 Description: Library of vector math functions.
+    Matrices follow Maya's conventions: flat 16 element lists, row major, applied to row vectors,
+    so a child's world matrix is local * parentWorld, as returned by xform(q=1,m=1).
+    Angles are in degrees. Quaternions are (x,y,z,w).
 
 """
-from math import sqrt
+from math import sqrt, sin, cos, atan2, degrees, radians
 
 def vector(a,b):
     return (b[0]-a[0],b[1]-a[1],b[2]-a[2])    
@@ -59,9 +62,204 @@ def bitangent(a,b):
 def invert(a):
     return scale(a,-1);
 
+def perpendicular(a):
+    #any unit vector perpendicular to a, built from the world axis least aligned with it
+    axis = min(range(3), key=lambda i: abs(a[i]))
+    return normalize(cross(a,((1.0,0.0,0.0),(0.0,1.0,0.0),(0.0,0.0,1.0))[axis]))
+
 def bisector(a,b,c):
     #returns vector D, such that it bysects angle ABC
-    pass
+    #a straight angle has no single bisector, so any perpendicular is returned
+    d = add(normalize(vector(b,a)),normalize(vector(b,c)))
+    if mag(d) < 1e-9:
+        return perpendicular(vector(b,c))
+    return normalize(d)
+
+def poleVector(start,middle,end,distance=1.0,fallback=(0.0,0.0,-1.0),tolerance=1e-3):
+    """Pole vector placement for a three joint chain.
+        The pole sits distance from the middle joint, in the chain's plane, opposite the start joint's side of the lower bone.
+        Chains straighter than tolerance (sine of the bend) have no plane, so fallback gives the direction instead.
+
+    Returns:
+        tuple: (position, matrix) with the matrix's x axis aimed from the middle joint to the pole
+    """
+    norm = normalize(vector(middle,end))
+    upper = vector(middle,start)
+    offAxis = add(upper, mult(norm, -dot(upper,norm)))
+    if mag(offAxis) <= tolerance * mag(upper):
+        offAxis = add(fallback, mult(norm, -dot(fallback,norm)))
+        if mag(offAxis) < 1e-9:
+            offAxis = perpendicular(norm)
+        offAxis = invert(offAxis)
+    aim = invert(normalize(offAxis))
+    position = add(middle, mult(aim, distance))
+    up = normalize(cross(norm, aim))
+    side = cross(aim, up)
+    return position, list(aim) + [0.0] + list(up) + [0.0] + list(side) + [0.0] + list(position) + [1.0]
+
+##########################################################
+##########################################################
+#                        Matrices                        #
+##########################################################
+##########################################################
+
+ROTATE_ORDERS = ('xyz','yzx','zxy','xzy','yxz','zyx')
+
+def identityMatrix():
+    return [1.0,0.0,0.0,0.0, 0.0,1.0,0.0,0.0, 0.0,0.0,1.0,0.0, 0.0,0.0,0.0,1.0]
+
+def matrixMult(a,b):
+    """a then b, matching a*b in Maya"""
+    return [a[r]*b[c] + a[r+1]*b[c+4] + a[r+2]*b[c+8] + a[r+3]*b[c+12]
+            for r in (0,4,8,12) for c in (0,1,2,3)]
+
+def matrixInverse(m):
+    """Inverse of an affine matrix (last column 0,0,0,1)"""
+    a,b,c = m[0],m[1],m[2]
+    d,e,f = m[4],m[5],m[6]
+    g,h,i = m[8],m[9],m[10]
+    co0, co1, co2 = e*i - f*h, f*g - d*i, d*h - e*g
+    det = a*co0 + b*co1 + c*co2
+    if not det:
+        raise ZeroDivisionError("matrix is singular")
+    r = (co0/det, (c*h - b*i)/det, (b*f - c*e)/det,
+        co1/det, (a*i - c*g)/det, (c*d - a*f)/det,
+        co2/det, (b*g - a*h)/det, (a*e - b*d)/det)
+    t = m[12:15]
+    return [r[0],r[1],r[2],0.0,
+            r[3],r[4],r[5],0.0,
+            r[6],r[7],r[8],0.0,
+            -(t[0]*r[0] + t[1]*r[3] + t[2]*r[6]),
+            -(t[0]*r[1] + t[1]*r[4] + t[2]*r[7]),
+            -(t[0]*r[2] + t[1]*r[5] + t[2]*r[8]), 1.0]
+
+def transformPoint(p,m):
+    return (p[0]*m[0] + p[1]*m[4] + p[2]*m[8] + m[12],
+            p[0]*m[1] + p[1]*m[5] + p[2]*m[9] + m[13],
+            p[0]*m[2] + p[1]*m[6] + p[2]*m[10] + m[14])
+
+def transformVector(v,m):
+    return (v[0]*m[0] + v[1]*m[4] + v[2]*m[8],
+            v[0]*m[1] + v[1]*m[5] + v[2]*m[9],
+            v[0]*m[2] + v[1]*m[6] + v[2]*m[10])
+
+def axisRotationMatrix(axis,angle):
+    """Rotation of angle degrees about 'x', 'y' or 'z'"""
+    c, s = cos(radians(angle)), sin(radians(angle))
+    m = identityMatrix()
+    i, j = {'x':(1,2), 'y':(2,0), 'z':(0,1)}[axis]
+    m[i*4+i], m[i*4+j], m[j*4+i], m[j*4+j] = c, s, -s, c
+    return m
+
+def eulerToMatrix(rotate,rotateOrder='xyz'):
+    """Rotation matrix for rotate, applied in rotateOrder, first axis first"""
+    m = identityMatrix()
+    for axis in rotateOrder:
+        m = matrixMult(m, axisRotationMatrix(axis, rotate['xyz'.index(axis)]))
+    return m
+
+def matrixToEuler(m,rotateOrder='xyz'):
+    """Euler angles of a rotation matrix without scale. Inverse of eulerToMatrix"""
+    i, j, k = ['xyz'.index(axis) for axis in rotateOrder]
+    #permute the axes so every order reads as xyz. Odd permutations mirror the angles
+    sign = 1.0 if rotateOrder in ('xyz','yzx','zxy') else -1.0
+    r = lambda row,col: m[(i,j,k)[row]*4 + (i,j,k)[col]]
+    cy = sqrt(r(0,0)**2 + r(0,1)**2)
+    y = atan2(-r(0,2), cy)
+    if cy > 1e-9:
+        x = atan2(r(1,2), r(2,2))
+        z = atan2(r(0,1), r(0,0))
+    else:
+        x = atan2(-r(2,1), r(1,1))
+        z = 0.0
+    angles = [0.0,0.0,0.0]
+    for index, angle in zip((i,j,k), (x,y,z)):
+        angles[index] = degrees(angle) * sign
+    return tuple(angles)
+
+def composeMatrix(translate=(0,0,0),rotate=(0,0,0),scale=(1,1,1),rotateOrder='xyz'):
+    """scale * rotation * translation, matching a transform with default pivots"""
+    m = eulerToMatrix(rotate,rotateOrder)
+    for row in range(3):
+        for col in range(3):
+            m[row*4+col] *= scale[row]
+    m[12:15] = translate
+    return m
+
+def decomposeMatrix(m,rotateOrder='xyz'):
+    """Returns (translate, rotate, scale) of an unsheared matrix"""
+    scale = [mag(m[row*4:row*4+3]) for row in range(3)]
+    if dot(cross(m[0:3],m[4:7]),m[8:11]) < 0:
+        scale[0] = -scale[0]
+    rotation = identityMatrix()
+    for row in range(3):
+        for col in range(3):
+            rotation[row*4+col] = m[row*4+col] / scale[row]
+    return tuple(m[12:15]), matrixToEuler(rotation,rotateOrder), tuple(scale)
+
+
+##########################################################
+##########################################################
+#                       Quaternions                      #
+##########################################################
+##########################################################
+
+def quatMult(a,b):
+    """a then b, matching matrixMult"""
+    return (b[3]*a[0] + b[0]*a[3] + b[1]*a[2] - b[2]*a[1],
+            b[3]*a[1] - b[0]*a[2] + b[1]*a[3] + b[2]*a[0],
+            b[3]*a[2] + b[0]*a[1] - b[1]*a[0] + b[2]*a[3],
+            b[3]*a[3] - b[0]*a[0] - b[1]*a[1] - b[2]*a[2])
+
+def quatInvert(q):
+    n = q[0]**2 + q[1]**2 + q[2]**2 + q[3]**2
+    return (-q[0]/n, -q[1]/n, -q[2]/n, q[3]/n)
+
+def quatNormalize(q):
+    n = sqrt(q[0]**2 + q[1]**2 + q[2]**2 + q[3]**2)
+    return (q[0]/n, q[1]/n, q[2]/n, q[3]/n)
+
+def axisAngleToQuat(axis,angle):
+    axis = normalize(axis)
+    s = sin(radians(angle)/2.0)
+    return (axis[0]*s, axis[1]*s, axis[2]*s, cos(radians(angle)/2.0))
+
+def eulerToQuat(rotate,rotateOrder='xyz'):
+    q = (0.0,0.0,0.0,1.0)
+    for axis in rotateOrder:
+        q = quatMult(q, axisAngleToQuat(getAxis(axis), rotate['xyz'.index(axis)]))
+    return q
+
+def quatToMatrix(q):
+    x,y,z,w = quatNormalize(q)
+    return [1-2*(y*y+z*z), 2*(x*y+z*w), 2*(x*z-y*w), 0.0,
+            2*(x*y-z*w), 1-2*(x*x+z*z), 2*(y*z+x*w), 0.0,
+            2*(x*z+y*w), 2*(y*z-x*w), 1-2*(x*x+y*y), 0.0,
+            0.0, 0.0, 0.0, 1.0]
+
+def matrixToQuat(m):
+    """Quaternion of a rotation matrix without scale"""
+    trace = m[0] + m[5] + m[10]
+    if trace > 0:
+        s = sqrt(trace + 1.0) * 2
+        q = ((m[6]-m[9])/s, (m[8]-m[2])/s, (m[1]-m[4])/s, s/4)
+    elif m[0] > m[5] and m[0] > m[10]:
+        s = sqrt(1.0 + m[0] - m[5] - m[10]) * 2
+        q = (s/4, (m[1]+m[4])/s, (m[8]+m[2])/s, (m[6]-m[9])/s)
+    elif m[5] > m[10]:
+        s = sqrt(1.0 + m[5] - m[0] - m[10]) * 2
+        q = ((m[1]+m[4])/s, s/4, (m[6]+m[9])/s, (m[8]-m[2])/s)
+    else:
+        s = sqrt(1.0 + m[10] - m[0] - m[5]) * 2
+        q = ((m[8]+m[2])/s, (m[6]+m[9])/s, s/4, (m[1]-m[4])/s)
+    return quatNormalize(q)
+
+def quatToEuler(q,rotateOrder='xyz'):
+    return matrixToEuler(quatToMatrix(q),rotateOrder)
+
+def quatRotate(v,q):
+    return transformVector(v,quatToMatrix(q))
+
 
 ##########################################################
 ##########################################################